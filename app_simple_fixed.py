@@ -8,15 +8,30 @@ from flask import Flask, render_template, request, jsonify, Response
 import os
 import json
 import time
+import logging
+import hashlib
+import gzip
 import math
-import traceback
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate, islice, repeat
+from operator import itemgetter, mul
+from types import MappingProxyType
 
-# Simple in-memory storage for this demo
-calculation_logs = []
+log = logging.getLogger(__name__)
+
+# Simple in-memory storage for this demo; only the most recent calculations are kept
+calculation_logs = deque(maxlen=10000)
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'dev-secret-key'
+# Shared page assets under static/ change only on deploy
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600
+# Calculator results are built in display order; skip re-sorting every response's keys
+app.json.sort_keys = False
 
 # Calculator Registry
 calculators = {}
@@ -29,17 +44,22 @@ def register_calculator(calc_class):
 
 # Base Calculator Class
 class BaseCalculator:
+    # Calculators are created per request; slots keep each instance dict-free
+    __slots__ = ('slug', 'errors', '_coerced')
+    
     def __init__(self):
         self.slug = self.__class__.__name__.lower().replace('calculator', '')
         self.errors = []
+        self._coerced = {}
     
     def clear_errors(self):
         self.errors = []
+        self._coerced = {}
     
     def add_error(self, message):
         self.errors.append(message)
     
-    def validate_number(self, value, field_name, min_val=None, max_val=None):
+    def validate_number(self, value, field_name, min_val=None, max_val=None, key=None):
         try:
             num = float(value)
             if min_val is not None and num < min_val:
@@ -48,15 +68,118 @@ class BaseCalculator:
             if max_val is not None and num > max_val:
                 self.add_error(f"{field_name} must be at most {max_val}")
                 return None
+            if key is not None:
+                # Remember the parsed value so calculate() doesn't parse it again
+                self._coerced[key] = (value, num)
             return num
         except (ValueError, TypeError):
             self.add_error(f"{field_name} must be a valid number")
             return None
+    
+    def validate_fields(self, inputs, required=(), optional=()):
+        """Validate fields from (key, missing message, label, min, max) required specs and
+        (key, label, min, max) optional specs; a required spec with no label is not numeric"""
+        for key, missing_message, label, min_val, max_val in required:
+            value = inputs.get(key, '')
+            if value == '':
+                self.add_error(missing_message)
+            elif label is not None:
+                self.validate_number(value, label, min_val, max_val, key=key)
+        
+        for key, label, min_val, max_val in optional:
+            value = inputs.get(key, '')
+            if value != '':
+                self.validate_number(value, label, min_val, max_val, key=key)
+    
+    def get_number(self, inputs, key, default=None):
+        """Return inputs[key] as a float, reusing the value parsed by validate_number"""
+        value = inputs[key] if default is None else inputs.get(key, default)
+        cached = self._coerced.get(key)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        return float(value)
+
+def _round_cents(x):
+    """round(x, 2), with a cheaper path for floats that are not near a half cent.
+    
+    Within +-$10M, x * 100 is off by far less than 1e-6, so floor(scaled + 0.5)
+    gives the same cents as round() unless the value sits on (or next to) a tie,
+    where round()'s correctly-rounded half-even rule is used as before. Ints go
+    to round() too so they stay ints in the JSON response.
+    """
+    scaled = x * 100
+    if -1e9 < scaled < 1e9 and type(scaled) is float:
+        cents = math.floor(scaled + 0.5)
+        if abs(scaled - cents + 0.5) > 1e-6:
+            return cents / 100 if cents else math.copysign(0.0, x)
+    return round(x, 2)
+
+_MEMOIZE_CACHE_SIZE = 4096
+
+def _memoize_inputs(calculate):
+    """Cache a calculate() method's result dicts by input values.
+
+    Inputs are keyed by (key, type, value) so '5', 5 and 5.0 stay distinct;
+    inputs holding unhashable values (lists, dicts) are calculated every time.
+    A miss runs on the calling instance, so values parsed by validate_inputs()
+    are reused. Errors are not cached. A hit returns a shallow copy (dict or
+    result object) whose 'inputs' is the caller's own dict; nested values are
+    shared and must be treated as read-only.
+    """
+    cache = {}
+
+    def wrapper(self, inputs):
+        try:
+            frozen = (type(self), tuple(sorted((key, type(value), value) for key, value in inputs.items())))
+            hash(frozen)
+        except TypeError:
+            return calculate(self, inputs)
+        result = cache.pop(frozen, None)
+        if result is None:
+            result = calculate(self, inputs)
+            if len(cache) >= _MEMOIZE_CACHE_SIZE:
+                # Least recently used first: hits are re-inserted at the end
+                cache.pop(next(iter(cache)), None)
+        cache[frozen] = result
+        if isinstance(result, CalculationResult):
+            return replace(result, inputs=inputs)
+        result = dict(result)
+        if 'inputs' in result:
+            result['inputs'] = inputs
+        return result
+
+    wrapper.cache_clear = cache.clear
+    wrapper.__doc__ = calculate.__doc__
+    return wrapper
+
+# Calculator Result Base Class
+@dataclass(slots=True)
+class CalculationResult:
+    """Slotted calculator result with read-only dict-style access for existing callers"""
+    
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __contains__(self, key):
+        return key in self.__dataclass_fields__
+    
+    def keys(self):
+        return self.__dataclass_fields__.keys()
+    
+    def to_dict(self):
+        return asdict(self)
 
 # Loan Calculator
 @register_calculator
 class LoanCalculator(BaseCalculator):
+    __slots__ = ()
+    
+    @_memoize_inputs
     def calculate(self, inputs):
+        r = _round_cents
         try:
             loan_amount = float(inputs['loan_amount'])
             annual_rate = float(inputs['annual_rate']) / 100  # Convert percentage to decimal
@@ -76,19 +199,15 @@ class LoanCalculator(BaseCalculator):
             total_paid = monthly_payment * num_payments
             total_interest = total_paid - loan_amount
             
-            # Generate amortization summary (first year)
-            amortization_sample = self._generate_amortization_sample(loan_amount, monthly_rate, monthly_payment, 12)
-            
             return {
-                'loan_amount': round(loan_amount, 2),
+                'loan_amount': r(loan_amount),
                 'annual_rate': float(inputs['annual_rate']),
                 'loan_term_years': loan_term_years,
-                'monthly_payment': round(monthly_payment, 2),
-                'total_paid': round(total_paid, 2),
-                'total_interest': round(total_interest, 2),
+                'monthly_payment': r(monthly_payment),
+                'total_paid': r(total_paid),
+                'total_interest': r(total_interest),
                 'loan_type': loan_type,
                 'loan_info': self._get_loan_info(loan_type),
-                'amortization_sample': amortization_sample,
                 'inputs': inputs
             }
             
@@ -99,33 +218,16 @@ class LoanCalculator(BaseCalculator):
         except Exception as e:
             raise ValueError(f"Calculation error: {str(e)}")
     
+    # (key, missing message, label, min, max)
+    _REQUIRED_FIELDS = (
+        ('loan_amount', "Loan amount is required", 'Loan amount', 100, 10000000),
+        ('annual_rate', "Annual interest rate is required", 'Annual interest rate', 0, 50),
+        ('loan_term_years', "Loan term is required", 'Loan term', 0.5, 50)
+    )
+    
     def validate_inputs(self, inputs):
         self.clear_errors()
-        
-        # Validate loan amount
-        if 'loan_amount' not in inputs or inputs['loan_amount'] == '':
-            self.add_error("Loan amount is required")
-        else:
-            amount = self.validate_number(inputs['loan_amount'], 'Loan amount', 100, 10000000)
-            if amount is None:
-                pass
-        
-        # Validate annual interest rate
-        if 'annual_rate' not in inputs or inputs['annual_rate'] == '':
-            self.add_error("Annual interest rate is required")
-        else:
-            rate = self.validate_number(inputs['annual_rate'], 'Annual interest rate', 0, 50)
-            if rate is None:
-                pass
-        
-        # Validate loan term
-        if 'loan_term_years' not in inputs or inputs['loan_term_years'] == '':
-            self.add_error("Loan term is required")
-        else:
-            term = self.validate_number(inputs['loan_term_years'], 'Loan term', 0.5, 50)
-            if term is None:
-                pass
-        
+        self.validate_fields(inputs, self._REQUIRED_FIELDS)
         return len(self.errors) == 0
     
     def get_meta_data(self):
@@ -136,33 +238,6 @@ class LoanCalculator(BaseCalculator):
             'canonical': '/calculators/loan/'
         }
     
-    def _generate_amortization_sample(self, balance, monthly_rate, payment, months):
-        schedule = []
-        remaining_balance = balance
-        
-        for month in range(1, min(months + 1, 13)):  # Show first 12 months max
-            if remaining_balance <= 0:
-                break
-                
-            interest_payment = remaining_balance * monthly_rate
-            principal_payment = payment - interest_payment
-            
-            if principal_payment > remaining_balance:
-                principal_payment = remaining_balance
-                interest_payment = payment - principal_payment
-            
-            remaining_balance -= principal_payment
-            
-            schedule.append({
-                'month': month,
-                'payment': round(payment, 2),
-                'principal': round(principal_payment, 2),
-                'interest': round(interest_payment, 2),
-                'balance': round(max(0, remaining_balance), 2)
-            })
-        
-        return schedule
-    
     def _get_loan_info(self, loan_type):
         info = {
             'personal': {
@@ -195,6 +270,8 @@ class LoanCalculator(BaseCalculator):
 # Income Tax Calculator
 @register_calculator
 class IncomeTaxCalculator(BaseCalculator):
+    __slots__ = ()
+    
     def calculate(self, inputs):
         try:
             annual_income = float(inputs['annual_income'])
@@ -202,26 +279,11 @@ class IncomeTaxCalculator(BaseCalculator):
             state = inputs.get('state', 'no_state_tax')
             tax_year = int(inputs.get('tax_year', 2024))
             
-            # Standard deductions for 2024
-            standard_deductions = {
-                'single': 14600,
-                'married_jointly': 29200,
-                'married_separately': 14600,
-                'head_of_household': 21900
-            }
-            
-            standard_deduction = standard_deductions.get(filing_status, 14600)
-            
-            # Calculate federal tax
-            federal_tax = self._calculate_federal_tax(annual_income, filing_status, standard_deduction, tax_year)
+            standard_deduction = self._get_standard_deduction(filing_status)
             
-            # Calculate state tax
-            state_tax = self._calculate_state_tax(annual_income, state, filing_status)
-            
-            # FICA taxes (Social Security + Medicare)
-            social_security_tax = min(annual_income * 0.062, 10453.20)  # 2024 SS wage base
-            medicare_tax = annual_income * 0.0145
-            additional_medicare = max(0, (annual_income - self._get_medicare_threshold(filing_status)) * 0.009)
+            # Federal, state and FICA taxes (Social Security + Medicare)
+            federal_tax, state_tax, social_security_tax, medicare_tax, additional_medicare = \
+                self._calculate_tax_components(annual_income, filing_status, state, tax_year)
             
             fica_total = social_security_tax + medicare_tax + additional_medicare
             
@@ -282,6 +344,26 @@ class IncomeTaxCalculator(BaseCalculator):
             'canonical': '/calculators/income-tax/'
         }
     
+    def _get_standard_deduction(self, filing_status):
+        """Get the 2024 standard deduction"""
+        standard_deductions = {
+            'single': 14600,
+            'married_jointly': 29200,
+            'married_separately': 14600,
+            'head_of_household': 21900
+        }
+        return standard_deductions.get(filing_status, 14600)
+    
+    def _calculate_tax_components(self, income, filing_status, state, tax_year=2024):
+        """Calculate unrounded federal, state, Social Security, Medicare and Additional Medicare tax"""
+        standard_deduction = self._get_standard_deduction(filing_status)
+        federal_tax = self._calculate_federal_tax(income, filing_status, standard_deduction, tax_year)
+        state_tax = self._calculate_state_tax(income, state, filing_status)
+        social_security_tax = min(income * 0.062, 10453.20)  # 2024 SS wage base
+        medicare_tax = income * 0.0145
+        additional_medicare = max(0, (income - self._get_medicare_threshold(filing_status)) * 0.009)
+        return federal_tax, state_tax, social_security_tax, medicare_tax, additional_medicare
+    
     def _calculate_federal_tax(self, income, filing_status, standard_deduction, tax_year):
         """Calculate federal income tax using 2024 tax brackets"""
         taxable_income = max(0, income - standard_deduction)
@@ -383,6 +465,8 @@ class IncomeTaxCalculator(BaseCalculator):
 # Sales Tax Calculator
 @register_calculator
 class SalesTaxCalculator(BaseCalculator):
+    __slots__ = ()
+    
     def calculate(self, inputs):
         try:
             purchase_amount = float(inputs['purchase_amount'])
@@ -566,6 +650,8 @@ class SalesTaxCalculator(BaseCalculator):
 # Property Tax Calculator
 @register_calculator
 class PropertyTaxCalculator(BaseCalculator):
+    __slots__ = ()
+    
     def calculate(self, inputs):
         try:
             home_value = float(inputs['home_value'])
@@ -767,29 +853,117 @@ class PropertyTaxCalculator(BaseCalculator):
             'note': 'Tax rates vary significantly by county and municipality'
         })
 
+# Filing status codes, resolved once per request so the credit rules compare ints
+_FS_SINGLE, _FS_MARRIED_JOINTLY, _FS_MARRIED_SEPARATELY, _FS_HEAD_OF_HOUSEHOLD = range(4)
+_FILING_STATUS_CODES = {
+    'single': _FS_SINGLE,
+    'married_jointly': _FS_MARRIED_JOINTLY,
+    'married_separately': _FS_MARRIED_SEPARATELY,
+    'head_of_household': _FS_HEAD_OF_HOUSEHOLD
+}
+
+# 2024 Child Tax Credit phase-out thresholds, indexed by filing status code
+_CTC_PHASE_OUT_THRESHOLDS = (200000, 400000, 200000, 200000)
+
+# 2024 EITC parameters (simplified) by qualifying children, capped at 3:
+# (max_credit, phase_out_start, max_income)
+_EITC_PARAMS = (
+    (632, 9800, 17640),
+    (3995, 11750, 47915),
+    (6604, 11750, 53057),
+    (7430, 11750, 56838)
+)
+
+def _child_tax_credit(income, filing_code, dependents):
+    """Calculate Child Tax Credit for 2024"""
+    if dependents == 0:
+        return 0
+    
+    # 2024 Child Tax Credit - $2,000 per qualifying child
+    max_credit = dependents * 2000
+    threshold = _CTC_PHASE_OUT_THRESHOLDS[filing_code]
+    
+    if income <= threshold:
+        return max_credit
+    
+    # Phase out $50 for every $1,000 over threshold
+    reduction = ((income - threshold) / 1000) * 50
+    
+    return max(0, max_credit - reduction)
+
+def _earned_income_credit(income, filing_code, dependents):
+    """Calculate Earned Income Tax Credit for 2024"""
+    if filing_code == _FS_MARRIED_SEPARATELY:
+        return 0  # Generally not eligible if married filing separately
+    
+    # Use parameters for number of dependents (max 3+)
+    num_children = min(dependents, 3)
+    max_credit, phase_out_start, max_income = _EITC_PARAMS[num_children]
+    
+    # Adjust for married filing jointly
+    if filing_code == _FS_MARRIED_JOINTLY:
+        max_income += 6500  # Marriage bonus
+    
+    if income > max_income:
+        return 0
+    
+    if income <= phase_out_start:
+        # In phase-in range - simplified calculation
+        phase_in_rate = 0.34 if num_children == 0 else 0.40  # Simplified rates
+        return min(income * phase_in_rate, max_credit)
+    
+    # In phase-out range
+    phase_out_rate = 0.1576 if num_children == 0 else 0.2106  # Simplified rates
+    reduction = (income - phase_out_start) * phase_out_rate
+    
+    return max(0, max_credit - reduction)
+
+# Refund status labels indexed by the sign of the final refund (+1)
+_REFUND_STATUS = ('owed', 'even', 'refund')
+
+@dataclass(slots=True)
+class TaxRefundResult(CalculationResult):
+    annual_income: float
+    federal_withholding: float
+    state_withholding: float
+    actual_federal_tax: float
+    actual_state_tax: float
+    federal_refund: float
+    state_refund: float
+    child_tax_credit: float
+    earned_income_credit: float
+    total_credits: float
+    total_refund: float
+    final_refund: float
+    refund_status: str
+    effective_rate: float
+    filing_status: str
+    state: str
+    dependents: int
+    inputs: dict
+
 # Tax Refund Estimator
 @register_calculator
 class TaxRefundCalculator(BaseCalculator):
+    __slots__ = ()
+    
     def calculate(self, inputs):
+        r = _round_cents
         try:
-            annual_income = float(inputs['annual_income'])
-            federal_withholding = float(inputs.get('federal_withholding', 0))
-            state_withholding = float(inputs.get('state_withholding', 0))
+            annual_income = self.get_number(inputs, 'annual_income')
+            federal_withholding = self.get_number(inputs, 'federal_withholding', 0)
+            state_withholding = self.get_number(inputs, 'state_withholding', 0)
             filing_status = inputs.get('filing_status', 'single')
             state = inputs.get('state', 'no_state_tax')
             dependents = int(inputs.get('dependents', 0))
             
-            # Calculate actual tax liability using existing logic
-            income_calc = IncomeTaxCalculator()
-            tax_result = income_calc.calculate({
-                'annual_income': annual_income,
-                'filing_status': filing_status,
-                'state': state,
-                'tax_year': 2024
-            })
-            
-            actual_federal_tax = tax_result['federal_tax']
-            actual_state_tax = tax_result['state_tax']
+            # Calculate actual tax liability using existing logic; the rate uses the
+            # exact total, the refunds the rounded taxes so they add up as displayed
+            tax_components = IncomeTaxCalculator()._calculate_tax_components(annual_income, filing_status, state)
+            total_tax = sum(tax_components)
+            effective_rate = (total_tax / annual_income) * 100 if annual_income > 0 else 0
+            actual_federal_tax = r(tax_components[0])
+            actual_state_tax = r(tax_components[1])
             
             # Calculate refunds/owed
             federal_refund = federal_withholding - actual_federal_tax
@@ -797,43 +971,42 @@ class TaxRefundCalculator(BaseCalculator):
             total_refund = federal_refund + state_refund
             
             # Add tax credits
-            child_tax_credit = self._calculate_child_tax_credit(annual_income, filing_status, dependents)
-            earned_income_credit = self._calculate_earned_income_credit(annual_income, filing_status, dependents)
+            filing_code = _FILING_STATUS_CODES.get(filing_status, _FS_SINGLE)
+            child_tax_credit = _child_tax_credit(annual_income, filing_code, dependents)
+            earned_income_credit = _earned_income_credit(annual_income, filing_code, dependents)
             
             # Adjust refund with credits
             total_credits = child_tax_credit + earned_income_credit
             final_refund = total_refund + total_credits
             
             # Determine if refund or owed
-            refund_status = "refund" if final_refund > 0 else "owed" if final_refund < 0 else "even"
-            
-            return {
-                'annual_income': round(annual_income, 2),
-                'federal_withholding': round(federal_withholding, 2),
-                'state_withholding': round(state_withholding, 2),
-                'actual_federal_tax': round(actual_federal_tax, 2),
-                'actual_state_tax': round(actual_state_tax, 2),
-                'federal_refund': round(federal_refund, 2),
-                'state_refund': round(state_refund, 2),
-                'child_tax_credit': round(child_tax_credit, 2),
-                'earned_income_credit': round(earned_income_credit, 2),
-                'total_credits': round(total_credits, 2),
-                'total_refund': round(total_refund, 2),
-                'final_refund': round(abs(final_refund), 2),
-                'refund_status': refund_status,
-                'effective_rate': tax_result['effective_rate'],
-                'filing_status': filing_status,
-                'state': state,
-                'dependents': dependents,
-                'inputs': inputs
-            }
+            refund_status = _REFUND_STATUS[(final_refund > 0) - (final_refund < 0) + 1]
+            
+            return TaxRefundResult(
+                annual_income=r(annual_income),
+                federal_withholding=r(federal_withholding),
+                state_withholding=r(state_withholding),
+                actual_federal_tax=r(actual_federal_tax),
+                actual_state_tax=r(actual_state_tax),
+                federal_refund=r(federal_refund),
+                state_refund=r(state_refund),
+                child_tax_credit=r(child_tax_credit),
+                earned_income_credit=r(earned_income_credit),
+                total_credits=r(total_credits),
+                total_refund=r(total_refund),
+                final_refund=r(abs(final_refund)),
+                refund_status=refund_status,
+                effective_rate=r(effective_rate),
+                filing_status=filing_status,
+                state=state,
+                dependents=dependents,
+                inputs=inputs
+            )
             
         except KeyError as e:
-            raise ValueError(f"Missing required field: {str(e).strip('\"\'')}")
-        except ValueError as e:
-            raise e
-        except Exception as e:
-            raise ValueError(f"Calculation error: {str(e)}")
+            raise ValueError(f"Missing required field: {e.args[0]}")
+        except (ZeroDivisionError, OverflowError) as e:
+            raise ValueError(f"Calculation error: {e}")
     
     def validate_inputs(self, inputs):
         self.clear_errors()
@@ -841,12 +1014,12 @@ class TaxRefundCalculator(BaseCalculator):
         if 'annual_income' not in inputs or inputs['annual_income'] == '':
             self.add_error("Annual income is required")
         else:
-            income = self.validate_number(inputs['annual_income'], 'Annual income', 0, 10000000)
+            income = self.validate_number(inputs['annual_income'], 'Annual income', 0, 10000000, key='annual_income')
         
         # Validate withholdings (optional but should be numbers if provided)
         for field in ['federal_withholding', 'state_withholding']:
             if field in inputs and inputs[field] != '':
-                self.validate_number(inputs[field], field.replace('_', ' ').title(), 0, 1000000)
+                self.validate_number(inputs[field], field.replace('_', ' ').title(), 0, 1000000, key=field)
         
         # Validate dependents
         if 'dependents' in inputs and inputs['dependents'] != '':
@@ -854,178 +1027,133 @@ class TaxRefundCalculator(BaseCalculator):
         
         return len(self.errors) == 0
     
-    def get_meta_data(self):
-        return {
-            'title': 'Tax Refund Calculator - Estimate Your Federal and State Tax Refund',
-            'description': 'Free tax refund estimator. Calculate your 2024 federal and state tax refund with withholdings, credits, and deductions.',
-            'keywords': 'tax refund calculator, tax refund estimator, federal refund, state refund, tax withholding, tax credits',
-            'canonical': '/calculators/tax-refund/'
-        }
-    
-    def _calculate_child_tax_credit(self, income, filing_status, dependents):
-        """Calculate Child Tax Credit for 2024"""
-        if dependents == 0:
-            return 0
-        
-        # 2024 Child Tax Credit - $2,000 per qualifying child
-        max_credit_per_child = 2000
-        max_credit = dependents * max_credit_per_child
-        
-        # Phase-out thresholds
-        phase_out_thresholds = {
-            'single': 200000,
-            'married_jointly': 400000,
-            'married_separately': 200000,
-            'head_of_household': 200000
-        }
-        
-        threshold = phase_out_thresholds.get(filing_status, 200000)
-        
-        if income <= threshold:
-            return max_credit
-        
-        # Phase out $50 for every $1,000 over threshold
-        excess = income - threshold
-        reduction = (excess / 1000) * 50
-        
-        return max(0, max_credit - reduction)
+    _META = MappingProxyType({
+        'title': 'Tax Refund Calculator - Estimate Your Federal and State Tax Refund',
+        'description': 'Free tax refund estimator. Calculate your 2024 federal and state tax refund with withholdings, credits, and deductions.',
+        'keywords': 'tax refund calculator, tax refund estimator, federal refund, state refund, tax withholding, tax credits',
+        'canonical': '/calculators/tax-refund/'
+    })
     
-    def _calculate_earned_income_credit(self, income, filing_status, dependents):
-        """Calculate Earned Income Tax Credit for 2024"""
-        # 2024 EITC parameters (simplified)
-        if filing_status == 'married_separately':
-            return 0  # Generally not eligible if married filing separately
-        
-        # Maximum credit amounts and income limits (2024)
-        eitc_params = {
-            0: {'max_credit': 632, 'phase_out_start': 9800, 'max_income': 17640},
-            1: {'max_credit': 3995, 'phase_out_start': 11750, 'max_income': 47915},
-            2: {'max_credit': 6604, 'phase_out_start': 11750, 'max_income': 53057},
-            3: {'max_credit': 7430, 'phase_out_start': 11750, 'max_income': 56838}
-        }
-        
-        # Use parameters for number of dependents (max 3+)
-        num_children = min(dependents, 3)
-        params = eitc_params.get(num_children, eitc_params[3])
-        
-        # Adjust for married filing jointly
-        if filing_status == 'married_jointly':
-            params['max_income'] += 6500  # Marriage bonus
-        
-        if income > params['max_income']:
-            return 0
-        
-        if income <= params['phase_out_start']:
-            # In phase-in range - simplified calculation
-            phase_in_rate = 0.34 if num_children == 0 else 0.40  # Simplified rates
-            return min(income * phase_in_rate, params['max_credit'])
-        
-        # In phase-out range
-        excess = income - params['phase_out_start']
-        phase_out_rate = 0.1576 if num_children == 0 else 0.2106  # Simplified rates
-        reduction = excess * phase_out_rate
-        
-        return max(0, params['max_credit'] - reduction)
+    def get_meta_data(self):
+        return self._META
+
+# Pay periods per year for each pay frequency (hourly assumes 40 hours x 52 weeks)
+_PAY_PERIODS_PER_YEAR = {
+    'annual': 1,
+    'monthly': 12,
+    'semimonthly': 24,
+    'biweekly': 26,
+    'weekly': 52,
+    'hourly': 2080
+}
+
+@dataclass(slots=True)
+class GrossToNetResult(CalculationResult):
+    gross_salary: float
+    pay_frequency: str
+    annual_gross: float
+    period_gross: float
+    federal_tax: float
+    state_tax: float
+    social_security: float
+    medicare: float
+    retirement_401k: float
+    health_insurance: float
+    dental_vision: float
+    fsa_hsa: float
+    total_taxes: float
+    total_deductions: float
+    net_pay: float
+    annual_net: float
+    annual_taxes: float
+    annual_deductions: float
+    effective_rate: float
+    take_home_rate: float
+    filing_status: str
+    state: str
+    inputs: dict
 
 # Gross to Net Salary Calculator
 @register_calculator
 class GrossToNetCalculator(BaseCalculator):
+    __slots__ = ()
+    
     def calculate(self, inputs):
+        r = _round_cents
         try:
-            gross_salary = float(inputs['gross_salary'])
+            gross_salary = self.get_number(inputs, 'gross_salary')
             pay_frequency = inputs.get('pay_frequency', 'annual')
             filing_status = inputs.get('filing_status', 'single')
             state = inputs.get('state', 'no_state_tax')
             allowances = int(inputs.get('allowances', 0))
             
             # Pre-tax deductions
-            retirement_401k = float(inputs.get('retirement_401k', 0))
-            health_insurance = float(inputs.get('health_insurance', 0))
-            dental_vision = float(inputs.get('dental_vision', 0))
-            fsa_hsa = float(inputs.get('fsa_hsa', 0))
-            
-            # Convert to annual if needed
-            if pay_frequency == 'hourly':
-                annual_gross = gross_salary * 2080  # 40 hours/week * 52 weeks
-            elif pay_frequency == 'weekly':
-                annual_gross = gross_salary * 52
-            elif pay_frequency == 'biweekly':
-                annual_gross = gross_salary * 26
-            elif pay_frequency == 'semimonthly':
-                annual_gross = gross_salary * 24
-            elif pay_frequency == 'monthly':
-                annual_gross = gross_salary * 12
-            else:  # annual
-                annual_gross = gross_salary
+            retirement_401k = self.get_number(inputs, 'retirement_401k', 0)
+            health_insurance = self.get_number(inputs, 'health_insurance', 0)
+            dental_vision = self.get_number(inputs, 'dental_vision', 0)
+            fsa_hsa = self.get_number(inputs, 'fsa_hsa', 0)
+            
+            # Convert to annual if needed (unknown frequencies are treated as annual)
+            periods = _PAY_PERIODS_PER_YEAR.get(pay_frequency, 1)
+            annual_gross = gross_salary * periods
             
             # Annual pre-tax deductions
             annual_pre_tax = retirement_401k + health_insurance + dental_vision + fsa_hsa
             taxable_income = annual_gross - annual_pre_tax
             
-            # Calculate taxes using Income Tax Calculator
-            tax_calc = IncomeTaxCalculator()
-            tax_result = tax_calc.calculate({
-                'annual_income': taxable_income,
-                'filing_status': filing_status,
-                'state': state,
-                'tax_year': 2024
-            })
-            
-            # Get tax amounts
-            federal_tax = tax_result['federal_tax']
-            state_tax = tax_result['state_tax']
-            social_security = tax_result['social_security_tax']
-            medicare = tax_result['medicare_tax'] + tax_result['additional_medicare']
+            # Calculate taxes using Income Tax Calculator, rounded to cents before
+            # they are totalled so the displayed parts add up to the totals
+            federal_tax, state_tax, social_security, medicare_tax, additional_medicare = [
+                r(tax) for tax in IncomeTaxCalculator()._calculate_tax_components(taxable_income, filing_status, state)
+            ]
+            medicare = medicare_tax + additional_medicare
             
             # Total deductions and net pay
             total_taxes = federal_tax + state_tax + social_security + medicare
             total_deductions = total_taxes + annual_pre_tax
             annual_net = annual_gross - total_deductions
             
-            # Convert back to pay frequency
-            pay_periods = {
-                'annual': 1,
-                'monthly': 12,
-                'semimonthly': 24,
-                'biweekly': 26,
-                'weekly': 52,
-                'hourly': 2080
-            }
-            
-            periods = pay_periods.get(pay_frequency, 1)
-            
-            return {
-                'gross_salary': round(gross_salary, 2),
-                'pay_frequency': pay_frequency,
-                'annual_gross': round(annual_gross, 2),
-                'period_gross': round(annual_gross / periods, 2),
-                'federal_tax': round(federal_tax / periods, 2),
-                'state_tax': round(state_tax / periods, 2),
-                'social_security': round(social_security / periods, 2),
-                'medicare': round(medicare / periods, 2),
-                'retirement_401k': round(retirement_401k / periods, 2),
-                'health_insurance': round(health_insurance / periods, 2),
-                'dental_vision': round(dental_vision / periods, 2),
-                'fsa_hsa': round(fsa_hsa / periods, 2),
-                'total_taxes': round(total_taxes / periods, 2),
-                'total_deductions': round(total_deductions / periods, 2),
-                'net_pay': round(annual_net / periods, 2),
-                'annual_net': round(annual_net, 2),
-                'annual_taxes': round(total_taxes, 2),
-                'annual_deductions': round(total_deductions, 2),
-                'effective_rate': round((total_taxes / annual_gross) * 100, 2),
-                'take_home_rate': round((annual_net / annual_gross) * 100, 2),
-                'filing_status': filing_status,
-                'state': state,
-                'inputs': inputs
-            }
+            # Split every annual figure into per-period amounts in a single pass
+            (period_gross, period_federal, period_state, period_social_security,
+             period_medicare, period_401k, period_health, period_dental_vision,
+             period_fsa_hsa, period_taxes, period_deductions, period_net) = [
+                r(amount / periods) for amount in (
+                    annual_gross, federal_tax, state_tax, social_security,
+                    medicare, retirement_401k, health_insurance, dental_vision,
+                    fsa_hsa, total_taxes, total_deductions, annual_net
+                )
+            ]
+
+            return GrossToNetResult(
+                gross_salary=r(gross_salary),
+                pay_frequency=pay_frequency,
+                annual_gross=r(annual_gross),
+                period_gross=period_gross,
+                federal_tax=period_federal,
+                state_tax=period_state,
+                social_security=period_social_security,
+                medicare=period_medicare,
+                retirement_401k=period_401k,
+                health_insurance=period_health,
+                dental_vision=period_dental_vision,
+                fsa_hsa=period_fsa_hsa,
+                total_taxes=period_taxes,
+                total_deductions=period_deductions,
+                net_pay=period_net,
+                annual_net=r(annual_net),
+                annual_taxes=r(total_taxes),
+                annual_deductions=r(total_deductions),
+                effective_rate=r((total_taxes / annual_gross) * 100),
+                take_home_rate=r((annual_net / annual_gross) * 100),
+                filing_status=filing_status,
+                state=state,
+                inputs=inputs
+            )
             
         except KeyError as e:
-            raise ValueError(f"Missing required field: {str(e).strip('\"\'')}")
-        except ValueError as e:
-            raise e
-        except Exception as e:
-            raise ValueError(f"Calculation error: {str(e)}")
+            raise ValueError(f"Missing required field: {e.args[0]}")
+        except (ZeroDivisionError, OverflowError) as e:
+            raise ValueError(f"Calculation error: {e}")
     
     def validate_inputs(self, inputs):
         self.clear_errors()
@@ -1033,98 +1161,143 @@ class GrossToNetCalculator(BaseCalculator):
         if 'gross_salary' not in inputs or inputs['gross_salary'] == '':
             self.add_error("Gross salary is required")
         else:
-            salary = self.validate_number(inputs['gross_salary'], 'Gross salary', 0, 10000000)
+            salary = self.validate_number(inputs['gross_salary'], 'Gross salary', 0, 10000000, key='gross_salary')
         
         # Validate optional deductions
         for field in ['retirement_401k', 'health_insurance', 'dental_vision', 'fsa_hsa']:
             if field in inputs and inputs[field] != '':
-                self.validate_number(inputs[field], field.replace('_', ' ').title(), 0, 100000)
+                self.validate_number(inputs[field], field.replace('_', ' ').title(), 0, 100000, key=field)
         
         return len(self.errors) == 0
     
+    _META = MappingProxyType({
+        'title': 'Gross to Net Salary Calculator - Calculate Take Home Pay',
+        'description': 'Free gross to net salary calculator. Calculate your take-home pay after taxes and deductions for 2024.',
+        'keywords': 'gross to net calculator, salary calculator, take home pay, paycheck calculator, net pay calculator',
+        'canonical': '/calculators/gross-to-net/'
+    })
+    
     def get_meta_data(self):
-        return {
-            'title': 'Gross to Net Salary Calculator - Calculate Take Home Pay',
-            'description': 'Free gross to net salary calculator. Calculate your take-home pay after taxes and deductions for 2024.',
-            'keywords': 'gross to net calculator, salary calculator, take home pay, paycheck calculator, net pay calculator',
-            'canonical': '/calculators/gross-to-net/'
-        }
+        return self._META
+
+@dataclass(slots=True)
+class HourlyToSalaryResult(CalculationResult):
+    calculation_type: str
+    hourly_rate: float
+    hours_per_week: float
+    weeks_per_year: float
+    annual_salary: float
+    monthly_salary: float
+    weekly_salary: float
+    daily_salary: float
+    part_time_20: float
+    part_time_30: float
+    overtime_rate: float
+    inputs: dict
+
+@dataclass(slots=True)
+class SalaryToHourlyResult(CalculationResult):
+    calculation_type: str
+    annual_salary: float
+    hours_per_week: float
+    weeks_per_year: float
+    hourly_rate: float
+    monthly_salary: float
+    weekly_salary: float
+    daily_salary: float
+    if_35_hours: float
+    if_45_hours: float
+    overtime_rate: float
+    total_hours_year: float
+    inputs: dict
 
 # Hourly to Salary Calculator
 @register_calculator
 class HourlyToSalaryCalculator(BaseCalculator):
+    __slots__ = ()
+    
     def calculate(self, inputs):
+        calculation_type = inputs.get('calculation_type', 'hourly_to_salary')
+        convert = self._CONVERSIONS.get(calculation_type, self._CONVERSIONS['salary_to_hourly'])
         try:
-            calculation_type = inputs.get('calculation_type', 'hourly_to_salary')
-            
-            if calculation_type == 'hourly_to_salary':
-                hourly_rate = float(inputs['hourly_rate'])
-                hours_per_week = float(inputs.get('hours_per_week', 40))
-                weeks_per_year = float(inputs.get('weeks_per_year', 52))
-                
-                # Calculate different salary scenarios
-                annual_salary = hourly_rate * hours_per_week * weeks_per_year
-                monthly_salary = annual_salary / 12
-                weekly_salary = hourly_rate * hours_per_week
-                
-                # Part-time variations
-                part_time_20 = hourly_rate * 20 * weeks_per_year
-                part_time_30 = hourly_rate * 30 * weeks_per_year
-                
-                return {
-                    'calculation_type': calculation_type,
-                    'hourly_rate': round(hourly_rate, 2),
-                    'hours_per_week': hours_per_week,
-                    'weeks_per_year': weeks_per_year,
-                    'annual_salary': round(annual_salary, 2),
-                    'monthly_salary': round(monthly_salary, 2),
-                    'weekly_salary': round(weekly_salary, 2),
-                    'daily_salary': round(weekly_salary / 5, 2),
-                    'part_time_20': round(part_time_20, 2),
-                    'part_time_30': round(part_time_30, 2),
-                    'overtime_rate': round(hourly_rate * 1.5, 2),
-                    'inputs': inputs
-                }
-                
-            else:  # salary_to_hourly
-                annual_salary = float(inputs['annual_salary'])
-                hours_per_week = float(inputs.get('hours_per_week', 40))
-                weeks_per_year = float(inputs.get('weeks_per_year', 52))
-                
-                total_hours = hours_per_week * weeks_per_year
-                hourly_rate = annual_salary / total_hours
-                
-                # Different work scenarios
-                monthly_salary = annual_salary / 12
-                weekly_salary = annual_salary / weeks_per_year
-                daily_salary = weekly_salary / (hours_per_week / 5) if hours_per_week >= 5 else weekly_salary
-                
-                # Compare to different hour scenarios
-                if_35_hours = annual_salary / (35 * weeks_per_year)
-                if_45_hours = annual_salary / (45 * weeks_per_year)
-                
-                return {
-                    'calculation_type': calculation_type,
-                    'annual_salary': round(annual_salary, 2),
-                    'hours_per_week': hours_per_week,
-                    'weeks_per_year': weeks_per_year,
-                    'hourly_rate': round(hourly_rate, 2),
-                    'monthly_salary': round(monthly_salary, 2),
-                    'weekly_salary': round(weekly_salary, 2),
-                    'daily_salary': round(daily_salary, 2),
-                    'if_35_hours': round(if_35_hours, 2),
-                    'if_45_hours': round(if_45_hours, 2),
-                    'overtime_rate': round(hourly_rate * 1.5, 2),
-                    'total_hours_year': round(total_hours, 0),
-                    'inputs': inputs
-                }
-            
+            return convert(self, inputs, calculation_type)
         except KeyError as e:
-            raise ValueError(f"Missing required field: {str(e).strip('\"\'')}")
-        except ValueError as e:
-            raise e
-        except Exception as e:
-            raise ValueError(f"Calculation error: {str(e)}")
+            raise ValueError(f"Missing required field: {e.args[0]}")
+        except (ZeroDivisionError, OverflowError) as e:
+            raise ValueError(f"Calculation error: {e}")
+    
+    def _calculate_hourly_to_salary(self, inputs, calculation_type):
+        """Convert an hourly wage to salary figures"""
+        r = _round_cents
+        hourly_rate = self.get_number(inputs, 'hourly_rate')
+        hours_per_week = self.get_number(inputs, 'hours_per_week', 40)
+        weeks_per_year = self.get_number(inputs, 'weeks_per_year', 52)
+        
+        # Calculate different salary scenarios
+        weekly_salary = hourly_rate * hours_per_week
+        annual_salary = weekly_salary * weeks_per_year
+        monthly_salary = annual_salary / 12
+        
+        # Part-time variations (pay for one hour every week of the year)
+        hourly_per_year = hourly_rate * weeks_per_year
+        part_time_20 = hourly_per_year * 20
+        part_time_30 = hourly_per_year * 30
+        
+        return HourlyToSalaryResult(
+            calculation_type=calculation_type,
+            hourly_rate=r(hourly_rate),
+            hours_per_week=hours_per_week,
+            weeks_per_year=weeks_per_year,
+            annual_salary=r(annual_salary),
+            monthly_salary=r(monthly_salary),
+            weekly_salary=r(weekly_salary),
+            daily_salary=r(weekly_salary / 5),
+            part_time_20=r(part_time_20),
+            part_time_30=r(part_time_30),
+            overtime_rate=r(hourly_rate * 1.5),
+            inputs=inputs
+        )
+    
+    def _calculate_salary_to_hourly(self, inputs, calculation_type):
+        """Convert an annual salary to hourly figures"""
+        r = _round_cents
+        annual_salary = self.get_number(inputs, 'annual_salary')
+        hours_per_week = self.get_number(inputs, 'hours_per_week', 40)
+        weeks_per_year = self.get_number(inputs, 'weeks_per_year', 52)
+        
+        total_hours = hours_per_week * weeks_per_year
+        hourly_rate = annual_salary / total_hours
+        
+        # Different work scenarios
+        monthly_salary = annual_salary / 12
+        weekly_salary = annual_salary / weeks_per_year
+        daily_salary = weekly_salary / (hours_per_week / 5) if hours_per_week >= 5 else weekly_salary
+        
+        # Compare to different hour scenarios
+        if_35_hours = weekly_salary / 35
+        if_45_hours = weekly_salary / 45
+        
+        return SalaryToHourlyResult(
+            calculation_type=calculation_type,
+            annual_salary=r(annual_salary),
+            hours_per_week=hours_per_week,
+            weeks_per_year=weeks_per_year,
+            hourly_rate=r(hourly_rate),
+            monthly_salary=r(monthly_salary),
+            weekly_salary=r(weekly_salary),
+            daily_salary=r(daily_salary),
+            if_35_hours=r(if_35_hours),
+            if_45_hours=r(if_45_hours),
+            overtime_rate=r(hourly_rate * 1.5),
+            total_hours_year=round(total_hours, 0),
+            inputs=inputs
+        )
+    
+    # Conversion per calculation_type; anything else is treated as salary_to_hourly
+    _CONVERSIONS = {
+        'hourly_to_salary': _calculate_hourly_to_salary,
+        'salary_to_hourly': _calculate_salary_to_hourly
+    }
     
     def validate_inputs(self, inputs):
         self.clear_errors()
@@ -1135,54 +1308,76 @@ class HourlyToSalaryCalculator(BaseCalculator):
             if 'hourly_rate' not in inputs or inputs['hourly_rate'] == '':
                 self.add_error("Hourly rate is required")
             else:
-                rate = self.validate_number(inputs['hourly_rate'], 'Hourly rate', 0.01, 1000)
+                rate = self.validate_number(inputs['hourly_rate'], 'Hourly rate', 0.01, 1000, key='hourly_rate')
         else:
             if 'annual_salary' not in inputs or inputs['annual_salary'] == '':
                 self.add_error("Annual salary is required")
             else:
-                salary = self.validate_number(inputs['annual_salary'], 'Annual salary', 1, 10000000)
+                salary = self.validate_number(inputs['annual_salary'], 'Annual salary', 1, 10000000, key='annual_salary')
         
         # Validate optional hours/weeks
         for field in ['hours_per_week', 'weeks_per_year']:
             if field in inputs and inputs[field] != '':
                 if field == 'hours_per_week':
-                    self.validate_number(inputs[field], 'Hours per week', 1, 80)
+                    self.validate_number(inputs[field], 'Hours per week', 1, 80, key=field)
                 else:
-                    self.validate_number(inputs[field], 'Weeks per year', 1, 52)
+                    self.validate_number(inputs[field], 'Weeks per year', 1, 52, key=field)
         
         return len(self.errors) == 0
     
+    _META = MappingProxyType({
+        'title': 'Hourly to Salary Calculator - Convert Hourly Wage to Annual Salary',
+        'description': 'Free hourly to salary calculator. Convert hourly wages to annual salary and vice versa. Compare part-time vs full-time pay.',
+        'keywords': 'hourly to salary calculator, hourly wage converter, salary to hourly, annual salary calculator, wage calculator',
+        'canonical': '/calculators/hourly-to-salary/'
+    })
+    
     def get_meta_data(self):
-        return {
-            'title': 'Hourly to Salary Calculator - Convert Hourly Wage to Annual Salary',
-            'description': 'Free hourly to salary calculator. Convert hourly wages to annual salary and vice versa. Compare part-time vs full-time pay.',
-            'keywords': 'hourly to salary calculator, hourly wage converter, salary to hourly, annual salary calculator, wage calculator',
-            'canonical': '/calculators/hourly-to-salary/'
-        }
+        return self._META
+
+@dataclass(slots=True)
+class SalaryRaiseResult(CalculationResult):
+    calculation_type: str
+    current_salary: float
+    new_salary: float
+    raise_amount: float
+    raise_percentage: float
+    monthly_increase: float
+    weekly_increase: float
+    daily_increase: float
+    hourly_increase: float
+    one_year_extra: float
+    five_year_extra: float
+    ten_year_extra: float
+    performance_context: dict
+    inputs: dict
 
 # Salary Raise Calculator
 @register_calculator
 class SalaryRaiseCalculator(BaseCalculator):
+    __slots__ = ()
+    
     def calculate(self, inputs):
+        r = _round_cents
         try:
             calculation_type = inputs.get('calculation_type', 'raise_amount')
-            current_salary = float(inputs['current_salary'])
+            current_salary = self.get_number(inputs, 'current_salary')
             
             if calculation_type == 'raise_amount':
                 # Calculate percentage from dollar amount
-                raise_amount = float(inputs['raise_amount'])
+                raise_amount = self.get_number(inputs, 'raise_amount')
                 new_salary = current_salary + raise_amount
                 raise_percentage = (raise_amount / current_salary) * 100
                 
             elif calculation_type == 'raise_percentage':
                 # Calculate dollar amount from percentage
-                raise_percentage = float(inputs['raise_percentage'])
+                raise_percentage = self.get_number(inputs, 'raise_percentage')
                 raise_amount = current_salary * (raise_percentage / 100)
                 new_salary = current_salary + raise_amount
                 
             else:  # target_salary
                 # Calculate raise needed to reach target
-                new_salary = float(inputs['target_salary'])
+                new_salary = self.get_number(inputs, 'target_salary')
                 raise_amount = new_salary - current_salary
                 raise_percentage = (raise_amount / current_salary) * 100
             
@@ -1202,29 +1397,27 @@ class SalaryRaiseCalculator(BaseCalculator):
             # Performance benchmarks
             performance_context = self._get_performance_context(raise_percentage)
             
-            return {
-                'calculation_type': calculation_type,
-                'current_salary': round(current_salary, 2),
-                'new_salary': round(new_salary, 2),
-                'raise_amount': round(raise_amount, 2),
-                'raise_percentage': round(raise_percentage, 2),
-                'monthly_increase': round(monthly_increase, 2),
-                'weekly_increase': round(weekly_increase, 2),
-                'daily_increase': round(daily_increase, 2),
-                'hourly_increase': round(hourly_increase, 2),
-                'one_year_extra': round(one_year_extra, 2),
-                'five_year_extra': round(five_year_extra, 2),
-                'ten_year_extra': round(ten_year_extra, 2),
-                'performance_context': performance_context,
-                'inputs': inputs
-            }
+            return SalaryRaiseResult(
+                calculation_type=calculation_type,
+                current_salary=r(current_salary),
+                new_salary=r(new_salary),
+                raise_amount=r(raise_amount),
+                raise_percentage=r(raise_percentage),
+                monthly_increase=r(monthly_increase),
+                weekly_increase=r(weekly_increase),
+                daily_increase=r(daily_increase),
+                hourly_increase=r(hourly_increase),
+                one_year_extra=r(one_year_extra),
+                five_year_extra=r(five_year_extra),
+                ten_year_extra=r(ten_year_extra),
+                performance_context=performance_context,
+                inputs=inputs
+            )
             
         except KeyError as e:
-            raise ValueError(f"Missing required field: {str(e).strip('\"\'')}")
-        except ValueError as e:
-            raise e
-        except Exception as e:
-            raise ValueError(f"Calculation error: {str(e)}")
+            raise ValueError(f"Missing required field: {e.args[0]}")
+        except (ZeroDivisionError, OverflowError) as e:
+            raise ValueError(f"Calculation error: {e}")
     
     def validate_inputs(self, inputs):
         self.clear_errors()
@@ -1232,7 +1425,7 @@ class SalaryRaiseCalculator(BaseCalculator):
         if 'current_salary' not in inputs or inputs['current_salary'] == '':
             self.add_error("Current salary is required")
         else:
-            salary = self.validate_number(inputs['current_salary'], 'Current salary', 1, 10000000)
+            salary = self.validate_number(inputs['current_salary'], 'Current salary', 1, 10000000, key='current_salary')
         
         calculation_type = inputs.get('calculation_type', 'raise_amount')
         
@@ -1240,27 +1433,29 @@ class SalaryRaiseCalculator(BaseCalculator):
             if 'raise_amount' not in inputs or inputs['raise_amount'] == '':
                 self.add_error("Raise amount is required")
             else:
-                amount = self.validate_number(inputs['raise_amount'], 'Raise amount', 0, 1000000)
+                amount = self.validate_number(inputs['raise_amount'], 'Raise amount', 0, 1000000, key='raise_amount')
         elif calculation_type == 'raise_percentage':
             if 'raise_percentage' not in inputs or inputs['raise_percentage'] == '':
                 self.add_error("Raise percentage is required")
             else:
-                percent = self.validate_number(inputs['raise_percentage'], 'Raise percentage', 0, 500)
+                percent = self.validate_number(inputs['raise_percentage'], 'Raise percentage', 0, 500, key='raise_percentage')
         else:  # target_salary
             if 'target_salary' not in inputs or inputs['target_salary'] == '':
                 self.add_error("Target salary is required")
             else:
-                target = self.validate_number(inputs['target_salary'], 'Target salary', 1, 10000000)
+                target = self.validate_number(inputs['target_salary'], 'Target salary', 1, 10000000, key='target_salary')
         
         return len(self.errors) == 0
     
+    _META = MappingProxyType({
+        'title': 'Salary Raise Calculator - Calculate Raise Amount and Percentage',
+        'description': 'Free salary raise calculator. Calculate raise amounts, percentages, and long-term financial impact of salary increases.',
+        'keywords': 'salary raise calculator, pay raise calculator, salary increase, raise percentage, salary negotiation',
+        'canonical': '/calculators/salary-raise/'
+    })
+    
     def get_meta_data(self):
-        return {
-            'title': 'Salary Raise Calculator - Calculate Raise Amount and Percentage',
-            'description': 'Free salary raise calculator. Calculate raise amounts, percentages, and long-term financial impact of salary increases.',
-            'keywords': 'salary raise calculator, pay raise calculator, salary increase, raise percentage, salary negotiation',
-            'canonical': '/calculators/salary-raise/'
-        }
+        return self._META
     
     def _get_performance_context(self, raise_percentage):
         """Provide context for raise percentage"""
@@ -1307,12 +1502,38 @@ class SalaryRaiseCalculator(BaseCalculator):
                 'context': 'Significant promotion, job change, or specialized skill premium.'
             }
 
+@dataclass(slots=True)
+class CostOfLivingResult(CalculationResult):
+    current_salary: float
+    current_city: str
+    target_city: str
+    current_col_index: float
+    target_col_index: float
+    equivalent_salary: float
+    salary_difference: float
+    percentage_change: float
+    purchasing_power_change: float
+    breakdown: dict
+    recommendation: dict
+    inputs: dict
+
+# Typical share of salary spent per budget category (cost of living breakdown)
+_COL_BUDGET_SHARES = (
+    ('housing', 0.30),
+    ('food', 0.15),
+    ('transportation', 0.15),
+    ('utilities', 0.08)
+)
+
 # Cost of Living Calculator
 @register_calculator
 class CostOfLivingCalculator(BaseCalculator):
+    __slots__ = ()
+    
     def calculate(self, inputs):
+        r = _round_cents
         try:
-            current_salary = float(inputs['current_salary'])
+            current_salary = self.get_number(inputs, 'current_salary')
             current_city = inputs.get('current_city', 'Current City')
             target_city = inputs.get('target_city', 'Target City')
             
@@ -1347,22 +1568,19 @@ class CostOfLivingCalculator(BaseCalculator):
             salary_difference = equivalent_salary - current_salary
             percentage_change = ((equivalent_salary - current_salary) / current_salary) * 100
             
-            # Breakdown by categories
-            housing_current = current_salary * 0.30 * current_index
-            housing_target = current_salary * 0.30 * target_index
-            housing_difference = housing_target - housing_current
-            
-            food_current = current_salary * 0.15 * current_index
-            food_target = current_salary * 0.15 * target_index
-            food_difference = food_target - food_current
-            
-            transportation_current = current_salary * 0.15 * current_index
-            transportation_target = current_salary * 0.15 * target_index
-            transportation_difference = transportation_target - transportation_current
-            
-            utilities_current = current_salary * 0.08 * current_index
-            utilities_target = current_salary * 0.08 * target_index
-            utilities_difference = utilities_target - utilities_current
+            # Breakdown by categories: budget share of salary scaled by each city's index,
+            # built as whole columns (one per quantity) and then zipped into rows
+            category_spend = [current_salary * share for _, share in _COL_BUDGET_SHARES]
+            category_current = [spend * current_index for spend in category_spend]
+            category_target = [spend * target_index for spend in category_spend]
+            breakdown = {
+                category: {
+                    'current': r(current),
+                    'target': r(target),
+                    'difference': r(target - current)
+                }
+                for (category, _), current, target in zip(_COL_BUDGET_SHARES, category_current, category_target)
+            }
             
             # Calculate purchasing power
             purchasing_power_change = (current_index / target_index) * 100 - 100
@@ -1370,122 +1588,167 @@ class CostOfLivingCalculator(BaseCalculator):
             # Recommendations
             recommendation = self._get_recommendation(percentage_change, col_ratio)
             
-            return {
-                'current_salary': round(current_salary, 2),
-                'current_city': current_city,
-                'target_city': target_city,
-                'current_col_index': round(current_index, 2),
-                'target_col_index': round(target_index, 2),
-                'equivalent_salary': round(equivalent_salary, 2),
-                'salary_difference': round(salary_difference, 2),
-                'percentage_change': round(percentage_change, 2),
-                'purchasing_power_change': round(purchasing_power_change, 2),
-                'breakdown': {
-                    'housing': {
-                        'current': round(housing_current, 2),
-                        'target': round(housing_target, 2),
-                        'difference': round(housing_difference, 2)
-                    },
-                    'food': {
-                        'current': round(food_current, 2),
-                        'target': round(food_target, 2),
-                        'difference': round(food_difference, 2)
-                    },
-                    'transportation': {
-                        'current': round(transportation_current, 2),
-                        'target': round(transportation_target, 2),
-                        'difference': round(transportation_difference, 2)
-                    },
-                    'utilities': {
-                        'current': round(utilities_current, 2),
-                        'target': round(utilities_target, 2),
-                        'difference': round(utilities_difference, 2)
-                    }
-                },
-                'recommendation': recommendation,
-                'inputs': inputs
-            }
+            return CostOfLivingResult(
+                current_salary=r(current_salary),
+                current_city=current_city,
+                target_city=target_city,
+                current_col_index=r(current_index),
+                target_col_index=r(target_index),
+                equivalent_salary=r(equivalent_salary),
+                salary_difference=r(salary_difference),
+                percentage_change=r(percentage_change),
+                purchasing_power_change=r(purchasing_power_change),
+                breakdown=breakdown,
+                recommendation=recommendation,
+                inputs=inputs
+            )
             
         except KeyError as e:
-            raise ValueError(f"Missing required field: {str(e).strip('\"\'')}")
-        except ValueError as e:
-            raise e
-        except Exception as e:
-            raise ValueError(f"Calculation error: {str(e)}")
+            raise ValueError(f"Missing required field: {e.args[0]}")
+        except (ZeroDivisionError, OverflowError) as e:
+            raise ValueError(f"Calculation error: {e}")
+    
+    # (key, missing message, label, min, max); the cities are required but not numeric
+    _REQUIRED_FIELDS = (
+        ('current_salary', "Current salary is required", 'Current salary', 1, 10000000),
+        ('current_city', "Current city is required", None, None, None),
+        ('target_city', "Target city is required", None, None, None)
+    )
     
     def validate_inputs(self, inputs):
         self.clear_errors()
-        
-        if 'current_salary' not in inputs or inputs['current_salary'] == '':
-            self.add_error("Current salary is required")
-        else:
-            salary = self.validate_number(inputs['current_salary'], 'Current salary', 1, 10000000)
-        
-        if 'current_city' not in inputs or inputs['current_city'] == '':
-            self.add_error("Current city is required")
-        
-        if 'target_city' not in inputs or inputs['target_city'] == '':
-            self.add_error("Target city is required")
-        
+        self.validate_fields(inputs, self._REQUIRED_FIELDS)
         return len(self.errors) == 0
     
+    _META = MappingProxyType({
+        'title': 'Cost of Living Calculator - Compare Cities and Salary Requirements',
+        'description': 'Free cost of living calculator. Compare living costs between cities and calculate equivalent salary requirements for relocation.',
+        'keywords': 'cost of living calculator, city comparison, salary comparison, relocation calculator, moving calculator',
+        'canonical': '/calculators/cost-of-living/'
+    })
+    
     def get_meta_data(self):
-        return {
-            'title': 'Cost of Living Calculator - Compare Cities and Salary Requirements',
-            'description': 'Free cost of living calculator. Compare living costs between cities and calculate equivalent salary requirements for relocation.',
-            'keywords': 'cost of living calculator, city comparison, salary comparison, relocation calculator, moving calculator',
-            'canonical': '/calculators/cost-of-living/'
-        }
+        return self._META
+    
+    # Recommendation bands by percentage change, lowest first. Bands below zero
+    # include their lower bound and bands above zero their upper bound, so
+    # -5..5 (inclusive) is "similar" and e.g. exactly -15 or +15 is "moderate".
+    _RECOMMENDATION_THRESHOLDS = (-15, -5, 5, 15, 30)
+    _RECOMMENDATIONS = (
+        ('Significant Savings', 'Much lower cost of living ({pc:.1f}%)',
+         'Excellent opportunity for significant savings and improved quality of life. Your money will go much further.'),
+        ('Moderate Savings', 'Lower cost of living ({pc:.1f}%)',
+         'Great opportunity to save money or improve your lifestyle with the same salary.'),
+        ('Similar Cost', 'Minimal cost difference (±5%)',
+         'Cost of living is very similar. Focus on career opportunities and quality of life factors.'),
+        ('Moderate Increase', 'Moderately higher cost (+{pc:.1f}%)',
+         'Consider negotiating a salary increase of at least 10-15% to maintain your current lifestyle.'),
+        ('Significant Increase', 'Significantly higher cost (+{pc:.1f}%)',
+         'Negotiate a substantial salary increase (20-35%) or prepare to adjust your lifestyle and budget.'),
+        ('Major Increase', 'Much higher cost (+{pc:.1f}%)',
+         'This move requires careful financial planning. Consider the long-term career benefits that justify the higher costs.')
+    )
     
     def _get_recommendation(self, percentage_change, col_ratio):
         """Provide relocation recommendations based on cost changes"""
-        if abs(percentage_change) <= 5:
-            return {
-                'category': 'Similar Cost',
-                'description': 'Minimal cost difference (±5%)',
-                'advice': 'Cost of living is very similar. Focus on career opportunities and quality of life factors.'
-            }
-        elif percentage_change > 5 and percentage_change <= 15:
-            return {
-                'category': 'Moderate Increase',
-                'description': f'Moderately higher cost (+{percentage_change:.1f}%)',
-                'advice': 'Consider negotiating a salary increase of at least 10-15% to maintain your current lifestyle.'
-            }
-        elif percentage_change > 15 and percentage_change <= 30:
-            return {
-                'category': 'Significant Increase',
-                'description': f'Significantly higher cost (+{percentage_change:.1f}%)',
-                'advice': 'Negotiate a substantial salary increase (20-35%) or prepare to adjust your lifestyle and budget.'
-            }
-        elif percentage_change > 30:
-            return {
-                'category': 'Major Increase',
-                'description': f'Much higher cost (+{percentage_change:.1f}%)',
-                'advice': 'This move requires careful financial planning. Consider the long-term career benefits that justify the higher costs.'
-            }
-        elif percentage_change < -5 and percentage_change >= -15:
-            return {
-                'category': 'Moderate Savings',
-                'description': f'Lower cost of living ({percentage_change:.1f}%)',
-                'advice': 'Great opportunity to save money or improve your lifestyle with the same salary.'
-            }
-        else:  # percentage_change < -15
-            return {
-                'category': 'Significant Savings',
-                'description': f'Much lower cost of living ({percentage_change:.1f}%)',
-                'advice': 'Excellent opportunity for significant savings and improved quality of life. Your money will go much further.'
-            }
+        find_band = bisect_right if percentage_change < 0 else bisect_left
+        category, description, advice = self._RECOMMENDATIONS[
+            find_band(self._RECOMMENDATION_THRESHOLDS, percentage_change)
+        ]
+        return {
+            'category': category,
+            'description': description.format(pc=percentage_change),
+            'advice': advice
+        }
+
+# Static compound interest insights, shared by every response. These are plain
+# dicts so jsonify can encode them; treat them as read-only.
+_CI_INSIGHT_LONGER_TIMELINE = {
+    'type': 'time',
+    'title': 'Consider Longer Timeline',
+    'message': 'Compound interest works best over longer periods. Consider extending your investment timeline if possible.'
+}
+_CI_INSIGHT_RATE_IMPACT = {
+    'type': 'rate',
+    'title': 'Rate Impact',
+    'message': 'Even small increases in your return rate can significantly impact long-term growth. Consider diversified investments.'
+}
+
+def _growth_factor(rate, periods):
+    """(1 + rate) ** periods, computed as exp(periods * log1p(rate))
+    
+    Forming 1 + rate first rounds away the low digits of a small per-period
+    rate; log1p keeps them.
+    """
+    return math.exp(periods * math.log1p(rate))
+
+def _annuity_factor(rate, periods):
+    """Future value of 1 paid at the end of each period: ((1 + rate) ** periods - 1) / rate"""
+    if rate == 0:
+        return periods
+    return math.expm1(periods * math.log1p(rate)) / rate
+
+# Display names for the common compounding frequencies (periods per year)
+_COMPOUND_FREQUENCY_TEXT = {
+    1: 'Annually',
+    2: 'Semi-annually',
+    4: 'Quarterly',
+    12: 'Monthly',
+    52: 'Weekly',
+    365: 'Daily'
+}
+
+@lru_cache(maxsize=16)
+def _frequency_text(frequency):
+    """Human-readable name for a compounding frequency"""
+    return _COMPOUND_FREQUENCY_TEXT.get(frequency, f'{frequency} times per year')
+
+def _compound_yearly(principal, monthly_contribution, rate_per_period, compound_frequency, years_to_show):
+    """Year-end balance, interest earned and contributions for each of the first years.
+    
+    One growth factor per year is shared by the principal and the contributions;
+    each year's factor is the previous one times a single year of compounding.
+    Returns three lists of plain floats, one entry per year.
+    """
+    contributions = [monthly_contribution * 12 * year for year in range(1, years_to_show + 1)]
+    if rate_per_period == 0:
+        # No growth: the balance is just the principal plus what was paid in
+        balances = [principal + contributed for contributed in contributions]
+    else:
+        year_growth = accumulate(repeat(_growth_factor(rate_per_period, compound_frequency), years_to_show), mul)
+        contributions_per_period = monthly_contribution * (12 / compound_frequency)
+        balances = [
+            principal * growth + contributions_per_period * ((growth - 1) / rate_per_period)
+            for growth in year_growth
+        ]
+    interest_earned = [
+        balance - principal - contributed
+        for balance, contributed in zip(balances, contributions)
+    ]
+    return balances, interest_earned, contributions
+
+@dataclass(slots=True)
+class CompoundInterestInputs:
+    principal: float
+    annual_rate: float  # fraction, e.g. 0.07 for 7%
+    years: float
+    compound_frequency: int = 12
+    monthly_contribution: float = 0.0
 
 # Compound Interest Calculator
 @register_calculator
 class CompoundInterestCalculator(BaseCalculator):
+    __slots__ = ()
+    
     def calculate(self, inputs):
+        r = _round_cents
         try:
-            principal = float(inputs['principal'])
-            annual_rate = float(inputs['annual_rate']) / 100
-            years = float(inputs['years'])
-            compound_frequency = int(inputs.get('compound_frequency', 12))  # Monthly default
-            monthly_contribution = float(inputs.get('monthly_contribution', 0))
+            params = self._parse_inputs(inputs)
+            principal = params.principal
+            annual_rate = params.annual_rate
+            years = params.years
+            compound_frequency = params.compound_frequency
+            monthly_contribution = params.monthly_contribution
             
             # Calculate compound interest with regular contributions
             # Formula: A = P(1 + r/n)^(nt) + PMT * [((1 + r/n)^(nt) - 1) / (r/n)]
@@ -1498,46 +1761,31 @@ class CompoundInterestCalculator(BaseCalculator):
                 fv_principal = principal
                 fv_contributions = monthly_contribution * 12 * years
             else:
-                fv_principal = principal * ((1 + rate_per_period) ** total_periods)
+                fv_principal = principal * _growth_factor(rate_per_period, total_periods)
                 
-                # Future value of regular contributions (annuity)
-                periods_per_year = compound_frequency
-                contribution_frequency = 12  # Monthly contributions
+                # Future value of regular (monthly) contributions as an annuity
                 contributions_per_period = monthly_contribution * (12 / compound_frequency)
-                
-                if rate_per_period == 0:
-                    fv_contributions = contributions_per_period * total_periods
-                else:
-                    fv_contributions = contributions_per_period * (((1 + rate_per_period) ** total_periods - 1) / rate_per_period)
+                fv_contributions = contributions_per_period * _annuity_factor(rate_per_period, total_periods)
             
             total_value = fv_principal + fv_contributions
             total_contributions = monthly_contribution * 12 * years
             total_interest = total_value - principal - total_contributions
             
             # Calculate year-by-year breakdown for first 10 years or total years if less
-            yearly_breakdown = []
             years_to_show = min(int(years), 10)
-            
-            for year in range(1, years_to_show + 1):
-                year_periods = year * compound_frequency
-                year_fv_principal = principal * ((1 + rate_per_period) ** year_periods) if rate_per_period > 0 else principal
-                year_contributions = monthly_contribution * 12 * year
-                
-                if rate_per_period == 0:
-                    year_fv_contributions = year_contributions
-                else:
-                    contributions_per_period = monthly_contribution * (12 / compound_frequency)
-                    year_fv_contributions = contributions_per_period * (((1 + rate_per_period) ** year_periods - 1) / rate_per_period)
-                
-                year_total = year_fv_principal + year_fv_contributions
-                year_interest = year_total - principal - year_contributions
-                
-                yearly_breakdown.append({
+            balances, interest_earned, contributions = _compound_yearly(
+                principal, monthly_contribution, rate_per_period, compound_frequency, years_to_show
+            )
+            yearly_breakdown = [
+                {
                     'year': year,
-                    'balance': round(year_total, 2),
-                    'interest_earned': round(year_interest, 2),
-                    'contributions': round(year_contributions, 2)
-                })
+                    'balance': r(balance),
+                    'interest_earned': r(interest),
+                    'contributions': r(contributed)
+                }
+                for year, balance, interest, contributed
+                in zip(range(1, years_to_show + 1), balances, interest_earned, contributions)
+            ]
             
             # Calculate effective annual yield
             if principal > 0:
@@ -1549,16 +1797,16 @@ class CompoundInterestCalculator(BaseCalculator):
             insights = self._generate_insights(principal, total_contributions, total_interest, years, annual_rate * 100)
             
             return {
-                'principal': round(principal, 2),
-                'annual_rate': round(annual_rate * 100, 2),
+                'principal': r(principal),
+                'annual_rate': r(annual_rate * 100),
                 'years': years,
                 'compound_frequency': compound_frequency,
-                'compound_frequency_text': self._get_frequency_text(compound_frequency),
-                'monthly_contribution': round(monthly_contribution, 2),
-                'total_value': round(total_value, 2),
-                'total_contributions': round(total_contributions, 2),
-                'total_interest': round(total_interest, 2),
-                'effective_yield': round(effective_yield, 2),
+                'compound_frequency_text': _frequency_text(compound_frequency),
+                'monthly_contribution': r(monthly_contribution),
+                'total_value': r(total_value),
+                'total_contributions': r(total_contributions),
+                'total_interest': r(total_interest),
+                'effective_yield': r(effective_yield),
                 'yearly_breakdown': yearly_breakdown,
                 'insights': insights,
                 'inputs': inputs
@@ -1571,48 +1819,40 @@ class CompoundInterestCalculator(BaseCalculator):
         except Exception as e:
             raise ValueError(f"Calculation error: {str(e)}")
     
+    def _parse_inputs(self, inputs):
+        """Coerce the request fields once, reusing the numbers parsed during validation"""
+        return CompoundInterestInputs(
+            principal=self.get_number(inputs, 'principal'),
+            annual_rate=self.get_number(inputs, 'annual_rate') / 100,
+            years=self.get_number(inputs, 'years'),
+            compound_frequency=int(inputs.get('compound_frequency', 12)),  # Monthly default
+            monthly_contribution=self.get_number(inputs, 'monthly_contribution', 0)
+        )
+    
+    # (key, missing message, label, min, max) and optional (key, label, min, max)
+    _REQUIRED_FIELDS = (
+        ('principal', "Initial investment amount is required", 'Initial investment', 1, 10000000),
+        ('annual_rate', "Annual interest rate is required", 'Annual interest rate', 0, 50),
+        ('years', "Investment time period is required", 'Years', 0.1, 100)
+    )
+    _OPTIONAL_FIELDS = (
+        ('monthly_contribution', 'Monthly contribution', 0, 100000),
+    )
+    
     def validate_inputs(self, inputs):
         self.clear_errors()
-        
-        if 'principal' not in inputs or inputs['principal'] == '':
-            self.add_error("Initial investment amount is required")
-        else:
-            principal = self.validate_number(inputs['principal'], 'Initial investment', 1, 10000000)
-        
-        if 'annual_rate' not in inputs or inputs['annual_rate'] == '':
-            self.add_error("Annual interest rate is required")
-        else:
-            rate = self.validate_number(inputs['annual_rate'], 'Annual interest rate', 0, 50)
-        
-        if 'years' not in inputs or inputs['years'] == '':
-            self.add_error("Investment time period is required")
-        else:
-            years = self.validate_number(inputs['years'], 'Years', 0.1, 100)
-        
-        # Optional fields validation
-        if 'monthly_contribution' in inputs and inputs['monthly_contribution'] != '':
-            contribution = self.validate_number(inputs['monthly_contribution'], 'Monthly contribution', 0, 100000)
-        
+        self.validate_fields(inputs, self._REQUIRED_FIELDS, self._OPTIONAL_FIELDS)
         return len(self.errors) == 0
     
-    def get_meta_data(self):
-        return {
-            'title': 'Compound Interest Calculator - Investment Growth Calculator',
-            'description': 'Free compound interest calculator. Calculate investment growth with regular contributions and different compounding frequencies.',
-            'keywords': 'compound interest calculator, investment calculator, savings calculator, retirement planning, investment growth',
-            'canonical': '/calculators/compound-interest/'
-        }
+    _META = MappingProxyType({
+        'title': 'Compound Interest Calculator - Investment Growth Calculator',
+        'description': 'Free compound interest calculator. Calculate investment growth with regular contributions and different compounding frequencies.',
+        'keywords': 'compound interest calculator, investment calculator, savings calculator, retirement planning, investment growth',
+        'canonical': '/calculators/compound-interest/'
+    })
     
-    def _get_frequency_text(self, frequency):
-        frequency_map = {
-            1: 'Annually',
-            2: 'Semi-annually',
-            4: 'Quarterly',
-            12: 'Monthly',
-            52: 'Weekly',
-            365: 'Daily'
-        }
-        return frequency_map.get(frequency, f'{frequency} times per year')
+    def get_meta_data(self):
+        return self._META
     
     def _generate_insights(self, principal, total_contributions, total_interest, years, annual_rate):
         """Generate investment insights and recommendations"""
@@ -1648,26 +1888,127 @@ class CompoundInterestCalculator(BaseCalculator):
         
         # Time value recommendation
         if years < 10:
-            insights.append({
-                'type': 'time',
-                'title': 'Consider Longer Timeline',
-                'message': 'Compound interest works best over longer periods. Consider extending your investment timeline if possible.'
-            })
+            insights.append(_CI_INSIGHT_LONGER_TIMELINE)
         
         # Rate sensitivity
         if annual_rate < 3:
-            insights.append({
-                'type': 'rate',
-                'title': 'Rate Impact',
-                'message': 'Even small increases in your return rate can significantly impact long-term growth. Consider diversified investments.'
-            })
+            insights.append(_CI_INSIGHT_RATE_IMPACT)
         
         return insights
 
+# Static retirement recommendations, shared by every response. These are plain
+# dicts so jsonify can encode them; treat them as read-only.
+_RET_REC_TIME_HORIZON = {
+    'category': 'Time Advantage',
+    'title': 'Great Time Horizon',
+    'message': 'You have excellent time for compound growth. Consider more aggressive investments while young.',
+    'priority': 'high'
+}
+_RET_REC_CATCH_UP = {
+    'category': 'Catch-Up',
+    'title': 'Consider Catch-Up Contributions',
+    'message': 'With limited time, maximize contributions and consider catch-up contributions if over 50.',
+    'priority': 'urgent'
+}
+_RET_REC_CONTRIBUTIONS = {
+    'category': 'Contributions',
+    'title': 'Increase Monthly Savings',
+    'message': 'Consider increasing your monthly contributions. Even small increases compound significantly over time.',
+    'priority': 'medium'
+}
+_RET_REC_INVESTMENT_STRATEGY = {
+    'category': 'Investment Strategy',
+    'title': 'Consider Higher-Growth Investments',
+    'message': 'A 6-8% return is typical for diversified portfolios. Review your investment allocation.',
+    'priority': 'medium'
+}
+_RET_REC_GAP_SIGNIFICANT = {
+    'category': 'Savings Gap',
+    'title': 'Significant Shortfall',
+    'message': 'Consider working longer, reducing expenses, or significantly increasing contributions.',
+    'priority': 'urgent'
+}
+_RET_REC_GAP_MINOR = {
+    'category': 'Savings Gap',
+    'title': 'Minor Adjustments Needed',
+    'message': 'Small increases in contributions or returns can close your savings gap.',
+    'priority': 'medium'
+}
+_RET_REC_EARLY_CAREER = {
+    'category': 'Early Career',
+    'title': 'Start Strong',
+    'message': 'Starting early is your biggest advantage. Focus on building the savings habit.',
+    'priority': 'high'
+}
+_RET_REC_PRE_RETIREMENT = {
+    'category': 'Pre-Retirement',
+    'title': 'Preserve and Protect',
+    'message': 'Consider reducing risk and focusing on capital preservation as you near retirement.',
+    'priority': 'high'
+}
+
+def _readiness_score(total_projected, target_income):
+    """Calculate retirement readiness score (0-100) from plain floats"""
+    required_savings = target_income / 0.04
+    
+    # Score based on percentage of goal achieved
+    if required_savings == 0:
+        return 100
+    
+    return min(100, (total_projected / required_savings) * 100)
+
+# Inflation assumed by the retirement purchasing power analysis, and its
+# cumulative growth for every whole number of years a valid input can produce
+_ASSUMED_INFLATION_RATE = 0.03
+_ASSUMED_INFLATION_GROWTH = tuple((1 + _ASSUMED_INFLATION_RATE) ** year for year in range(101))
+
+def _purchasing_power(income, years_to_retirement, inflation_rate=_ASSUMED_INFLATION_RATE):
+    """Analyze the impact of inflation on retirement income"""
+    if inflation_rate == _ASSUMED_INFLATION_RATE and 0 <= years_to_retirement <= 100:
+        inflation_growth = _ASSUMED_INFLATION_GROWTH[years_to_retirement]
+    else:
+        inflation_growth = (1 + inflation_rate) ** years_to_retirement
+    
+    current_purchasing_power = income
+    future_purchasing_power = income / inflation_growth
+    purchasing_power_loss = current_purchasing_power - future_purchasing_power
+    
+    return {
+        'current_dollars': _round_cents(current_purchasing_power),
+        'future_purchasing_power': _round_cents(future_purchasing_power),
+        'purchasing_power_loss': _round_cents(purchasing_power_loss),
+        'inflation_rate_used': round(inflation_rate * 100, 1)
+    }
+
+@dataclass(slots=True)
+class RetirementResult(CalculationResult):
+    current_age: int
+    retirement_age: int
+    years_to_retirement: int
+    years_in_retirement: int
+    current_savings: float
+    monthly_contribution: float
+    annual_return: float
+    fv_current_savings: float
+    fv_contributions: float
+    total_retirement_savings: float
+    sustainable_annual_income: float
+    sustainable_monthly_income: float
+    total_contributions: float
+    retirement_goal_analysis: dict | None
+    estimated_social_security: float
+    readiness_score: float
+    recommendations: list
+    purchasing_power_analysis: dict
+    inputs: dict
+
 # Retirement Calculator
 @register_calculator
 class RetirementCalculator(BaseCalculator):
+    __slots__ = ()
+    
     def calculate(self, inputs):
+        r = _round_cents
         try:
             current_age = int(inputs['current_age'])
             retirement_age = int(inputs['retirement_age'])
@@ -1683,16 +2024,16 @@ class RetirementCalculator(BaseCalculator):
             years_to_retirement = retirement_age - current_age
             years_in_retirement = int(inputs.get('years_in_retirement', 25))  # Default 25 years
             
+            # Growth of a lump sum and of $1/month saved until retirement, computed
+            # once and shared by the projection, the goal analysis and the score
+            growth = _growth_factor(annual_return, years_to_retirement)
+            annuity_factor = _annuity_factor(annual_return / 12, years_to_retirement * 12)
+            
             # Calculate future value of current savings
-            fv_current_savings = current_savings * ((1 + annual_return) ** years_to_retirement)
+            fv_current_savings = current_savings * growth
             
             # Calculate future value of monthly contributions
-            if annual_return == 0:
-                fv_contributions = monthly_contribution * 12 * years_to_retirement
-            else:
-                monthly_rate = annual_return / 12
-                total_months = years_to_retirement * 12
-                fv_contributions = monthly_contribution * (((1 + monthly_rate) ** total_months - 1) / monthly_rate)
+            fv_contributions = monthly_contribution * annuity_factor
             
             # Total retirement savings
             total_retirement_savings = fv_current_savings + fv_contributions
@@ -1710,12 +2051,7 @@ class RetirementCalculator(BaseCalculator):
                 
                 # Calculate additional monthly contribution needed
                 if savings_gap > 0:
-                    if annual_return == 0:
-                        additional_monthly_needed = savings_gap / (12 * years_to_retirement)
-                    else:
-                        monthly_rate = annual_return / 12
-                        total_months = years_to_retirement * 12
-                        additional_monthly_needed = savings_gap / (((1 + monthly_rate) ** total_months - 1) / monthly_rate)
+                    additional_monthly_needed = savings_gap / annuity_factor
                 else:
                     additional_monthly_needed = 0
                 
@@ -1728,14 +2064,14 @@ class RetirementCalculator(BaseCalculator):
                     'on_track': savings_gap <= 0
                 }
             
-            # Social Security estimate (simplified)
-            estimated_social_security = self._estimate_social_security(retirement_income_goal or sustainable_income_4percent)
+            target_income = retirement_income_goal or sustainable_income_4percent
+            
+            # Social Security estimate (simplified): the average benefit is about
+            # $1,800/month ($21,600/year) in 2024; actual benefits depend on work history
+            estimated_social_security = min(target_income * 0.4, 21600)  # Cap at average benefit
             
             # Retirement readiness score
-            readiness_score = self._calculate_readiness_score(
-                current_age, retirement_age, current_savings, monthly_contribution, 
-                annual_return, retirement_income_goal or sustainable_income_4percent
-            )
+            readiness_score = self._calculate_readiness_score(total_retirement_savings, target_income)
             
             # Recommendations
             recommendations = self._generate_recommendations(
@@ -1743,34 +2079,31 @@ class RetirementCalculator(BaseCalculator):
                 savings_gap if retirement_goal_analysis else 0, current_age
             )
             
-            # Inflation analysis
-            inflation_rate = 0.03  # 3% assumed inflation
-            purchasing_power_analysis = self._analyze_purchasing_power(
-                sustainable_income_4percent, years_to_retirement, inflation_rate
+            # Inflation analysis (3% assumed inflation)
+            purchasing_power_analysis = _purchasing_power(sustainable_income_4percent, years_to_retirement)
+            
+            return RetirementResult(
+                current_age=current_age,
+                retirement_age=retirement_age,
+                years_to_retirement=years_to_retirement,
+                years_in_retirement=years_in_retirement,
+                current_savings=r(current_savings),
+                monthly_contribution=r(monthly_contribution),
+                annual_return=r(annual_return * 100),
+                fv_current_savings=r(fv_current_savings),
+                fv_contributions=r(fv_contributions),
+                total_retirement_savings=r(total_retirement_savings),
+                sustainable_annual_income=r(sustainable_income_4percent),
+                sustainable_monthly_income=r(monthly_income_4percent),
+                total_contributions=r(monthly_contribution * 12 * years_to_retirement),
+                retirement_goal_analysis=retirement_goal_analysis,
+                estimated_social_security=r(estimated_social_security),
+                readiness_score=readiness_score,
+                recommendations=recommendations,
+                purchasing_power_analysis=purchasing_power_analysis,
+                inputs=inputs
             )
             
-            return {
-                'current_age': current_age,
-                'retirement_age': retirement_age,
-                'years_to_retirement': years_to_retirement,
-                'years_in_retirement': years_in_retirement,
-                'current_savings': round(current_savings, 2),
-                'monthly_contribution': round(monthly_contribution, 2),
-                'annual_return': round(annual_return * 100, 2),
-                'fv_current_savings': round(fv_current_savings, 2),
-                'fv_contributions': round(fv_contributions, 2),
-                'total_retirement_savings': round(total_retirement_savings, 2),
-                'sustainable_annual_income': round(sustainable_income_4percent, 2),
-                'sustainable_monthly_income': round(monthly_income_4percent, 2),
-                'total_contributions': round(monthly_contribution * 12 * years_to_retirement, 2),
-                'retirement_goal_analysis': retirement_goal_analysis,
-                'estimated_social_security': round(estimated_social_security, 2),
-                'readiness_score': readiness_score,
-                'recommendations': recommendations,
-                'purchasing_power_analysis': purchasing_power_analysis,
-                'inputs': inputs
-            }
-            
         except KeyError as e:
             raise ValueError(f"Missing required field: {str(e).strip('\"\'')}")
         except ValueError as e:
@@ -1778,71 +2111,36 @@ class RetirementCalculator(BaseCalculator):
         except Exception as e:
             raise ValueError(f"Calculation error: {str(e)}")
     
+    # (key, missing message, label, min, max) and optional (key, label, min, max)
+    _REQUIRED_FIELDS = (
+        ('current_age', "Current age is required", 'Current age', 18, 100),
+        ('retirement_age', "Retirement age is required", 'Retirement age', 50, 100),
+        ('annual_return', "Expected annual return is required", 'Annual return', 0, 20)
+    )
+    _OPTIONAL_FIELDS = (
+        ('current_savings', 'Current savings', 0, 50000000),
+        ('monthly_contribution', 'Monthly contribution', 0, 100000),
+        ('retirement_income_goal', 'Retirement income goal', 0, 5000000)
+    )
+    
     def validate_inputs(self, inputs):
         self.clear_errors()
-        
-        if 'current_age' not in inputs or inputs['current_age'] == '':
-            self.add_error("Current age is required")
-        else:
-            age = self.validate_number(inputs['current_age'], 'Current age', 18, 100)
-        
-        if 'retirement_age' not in inputs or inputs['retirement_age'] == '':
-            self.add_error("Retirement age is required")
-        else:
-            ret_age = self.validate_number(inputs['retirement_age'], 'Retirement age', 50, 100)
-        
-        if 'annual_return' not in inputs or inputs['annual_return'] == '':
-            self.add_error("Expected annual return is required")
-        else:
-            return_rate = self.validate_number(inputs['annual_return'], 'Annual return', 0, 20)
-        
-        # Optional fields validation
-        if 'current_savings' in inputs and inputs['current_savings'] != '':
-            savings = self.validate_number(inputs['current_savings'], 'Current savings', 0, 50000000)
-        
-        if 'monthly_contribution' in inputs and inputs['monthly_contribution'] != '':
-            contribution = self.validate_number(inputs['monthly_contribution'], 'Monthly contribution', 0, 100000)
-        
-        if 'retirement_income_goal' in inputs and inputs['retirement_income_goal'] != '':
-            goal = self.validate_number(inputs['retirement_income_goal'], 'Retirement income goal', 0, 5000000)
-        
+        self.validate_fields(inputs, self._REQUIRED_FIELDS, self._OPTIONAL_FIELDS)
         return len(self.errors) == 0
     
-    def get_meta_data(self):
-        return {
-            'title': 'Retirement Calculator - Plan Your Retirement Savings',
-            'description': 'Free retirement calculator. Calculate how much you need to save for retirement and plan your financial future.',
-            'keywords': 'retirement calculator, retirement planning, 401k calculator, retirement savings, pension calculator',
-            'canonical': '/calculators/retirement/'
-        }
+    _META = MappingProxyType({
+        'title': 'Retirement Calculator - Plan Your Retirement Savings',
+        'description': 'Free retirement calculator. Calculate how much you need to save for retirement and plan your financial future.',
+        'keywords': 'retirement calculator, retirement planning, 401k calculator, retirement savings, pension calculator',
+        'canonical': '/calculators/retirement/'
+    })
     
-    def _estimate_social_security(self, target_income):
-        """Estimate Social Security benefits (simplified)"""
-        # Average Social Security benefit is about $1,800/month ($21,600/year) in 2024
-        # This is a simplified estimate - actual benefits depend on work history
-        return min(target_income * 0.4, 21600)  # Cap at average benefit
+    def get_meta_data(self):
+        return self._META
     
-    def _calculate_readiness_score(self, current_age, retirement_age, current_savings, monthly_contribution, annual_return, target_income):
+    def _calculate_readiness_score(self, total_projected, target_income):
         """Calculate retirement readiness score (0-100)"""
-        years_to_retirement = retirement_age - current_age
-        
-        # Calculate projected savings
-        fv_current = current_savings * ((1 + annual_return) ** years_to_retirement)
-        if annual_return == 0:
-            fv_contributions = monthly_contribution * 12 * years_to_retirement
-        else:
-            monthly_rate = annual_return / 12
-            total_months = years_to_retirement * 12
-            fv_contributions = monthly_contribution * (((1 + monthly_rate) ** total_months - 1) / monthly_rate)
-        
-        total_projected = fv_current + fv_contributions
-        required_savings = target_income / 0.04
-        
-        # Score based on percentage of goal achieved
-        if required_savings == 0:
-            return 100
-        
-        score = min(100, (total_projected / required_savings) * 100)
+        score = _readiness_score(total_projected, target_income)
         return round(score, 1)
     
     def _generate_recommendations(self, years_to_retirement, monthly_contribution, annual_return, savings_gap, current_age):
@@ -1851,89 +2149,165 @@ class RetirementCalculator(BaseCalculator):
         
         # Time-based recommendations
         if years_to_retirement > 30:
-            recommendations.append({
-                'category': 'Time Advantage',
-                'title': 'Great Time Horizon',
-                'message': 'You have excellent time for compound growth. Consider more aggressive investments while young.',
-                'priority': 'high'
-            })
+            recommendations.append(_RET_REC_TIME_HORIZON)
         elif years_to_retirement < 10:
-            recommendations.append({
-                'category': 'Catch-Up',
-                'title': 'Consider Catch-Up Contributions',
-                'message': 'With limited time, maximize contributions and consider catch-up contributions if over 50.',
-                'priority': 'urgent'
-            })
+            recommendations.append(_RET_REC_CATCH_UP)
         
         # Contribution recommendations
         if monthly_contribution < 500:
-            recommendations.append({
-                'category': 'Contributions',
-                'title': 'Increase Monthly Savings',
-                'message': 'Consider increasing your monthly contributions. Even small increases compound significantly over time.',
-                'priority': 'medium'
-            })
+            recommendations.append(_RET_REC_CONTRIBUTIONS)
         
         # Return rate recommendations
         if annual_return < 0.06:
-            recommendations.append({
-                'category': 'Investment Strategy',
-                'title': 'Consider Higher-Growth Investments',
-                'message': 'A 6-8% return is typical for diversified portfolios. Review your investment allocation.',
-                'priority': 'medium'
-            })
+            recommendations.append(_RET_REC_INVESTMENT_STRATEGY)
         
         # Savings gap recommendations
         if savings_gap > 0:
             if savings_gap > 100000:
-                recommendations.append({
-                    'category': 'Savings Gap',
-                    'title': 'Significant Shortfall',
-                    'message': 'Consider working longer, reducing expenses, or significantly increasing contributions.',
-                    'priority': 'urgent'
-                })
+                recommendations.append(_RET_REC_GAP_SIGNIFICANT)
             else:
-                recommendations.append({
-                    'category': 'Savings Gap',
-                    'title': 'Minor Adjustments Needed',
-                    'message': 'Small increases in contributions or returns can close your savings gap.',
-                    'priority': 'medium'
-                })
+                recommendations.append(_RET_REC_GAP_MINOR)
         
         # Age-specific recommendations
         if current_age < 30:
-            recommendations.append({
-                'category': 'Early Career',
-                'title': 'Start Strong',
-                'message': 'Starting early is your biggest advantage. Focus on building the savings habit.',
-                'priority': 'high'
-            })
+            recommendations.append(_RET_REC_EARLY_CAREER)
         elif current_age > 50:
-            recommendations.append({
-                'category': 'Pre-Retirement',
-                'title': 'Preserve and Protect',
-                'message': 'Consider reducing risk and focusing on capital preservation as you near retirement.',
-                'priority': 'high'
-            })
+            recommendations.append(_RET_REC_PRE_RETIREMENT)
         
         return recommendations
+
+# Risk levels for a required annual return (%): up to 3, up to 7, up to 12, above.
+# Shared by every response; plain dicts so jsonify can encode them, treat as read-only.
+_RETURN_RISK_THRESHOLDS = (3, 7, 12)
+_RETURN_RISK_LEVELS = (
+    {
+        'level': 'Conservative',
+        'description': 'Low risk, achievable with bonds/CDs',
+        'feasibility': 'High'
+    },
+    {
+        'level': 'Moderate',
+        'description': 'Moderate risk, typical for balanced portfolios',
+        'feasibility': 'Good'
+    },
+    {
+        'level': 'Aggressive',
+        'description': 'Higher risk, requires growth-focused investments',
+        'feasibility': 'Challenging'
+    },
+    {
+        'level': 'Very High Risk',
+        'description': 'Extremely high risk, may not be realistic',
+        'feasibility': 'Unlikely'
+    }
+)
+
+def _solve_for_return(principal, pmt, freq, years, target):
+    """Solve for the required return rate (0.1% to 50%) with safeguarded Newton's method"""
+    # f(rate) = P(1 + rate)^years + PMT * ((1 + q)^n - 1) / q - target, q = rate / freq,
+    # is increasing in rate, so the search keeps a [low, high] bracket around the root
+    # and falls back to bisection whenever a Newton step would leave it
+    low, high = 0.001, 0.50  # 0.1% to 50%
+    tolerance = 0.000001
+    max_iterations = 100
+    total_periods = years * freq
     
-    def _analyze_purchasing_power(self, income, years_to_retirement, inflation_rate):
-        """Analyze the impact of inflation on retirement income"""
-        current_purchasing_power = income
-        future_purchasing_power = income / ((1 + inflation_rate) ** years_to_retirement)
-        purchasing_power_loss = current_purchasing_power - future_purchasing_power
-        
-        return {
-            'current_dollars': round(current_purchasing_power, 2),
-            'future_purchasing_power': round(future_purchasing_power, 2),
-            'purchasing_power_loss': round(purchasing_power_loss, 2),
-            'inflation_rate_used': round(inflation_rate * 100, 1)
-        }
+    # Seed with the no-contribution closed form on the total invested, which
+    # lands near the root for realistic inputs; otherwise start mid-bracket
+    rate = (low + high) / 2
+    total_invested = principal + pmt * total_periods
+    if total_invested > 0 and target > 0:
+        estimate = (target / total_invested) ** (1 / years) - 1
+        if low < estimate < high:
+            rate = estimate
+    
+    for _ in range(max_iterations):
+        period_rate = rate / freq
+        growth = _growth_factor(rate, years)
+        log_period_growth = total_periods * math.log1p(period_rate)
+        period_growth = math.exp(log_period_growth)
+        annuity = math.expm1(log_period_growth) / period_rate
+        
+        error = principal * growth + pmt * annuity - target
+        if abs(error) < tolerance:
+            break
+        if error < 0:
+            low = rate
+        else:
+            high = rate
+        if high - low < 1e-12:
+            break
+        
+        # d/drate of both terms, reusing the growth factors computed above
+        slope = (principal * years * growth / (1 + rate)
+                 + pmt * (total_periods * period_growth / (1 + period_rate) - annuity) / period_rate / freq)
+        if slope > 0:
+            step = error / slope
+            rate -= step
+            if low < rate < high and abs(step) < tolerance:
+                break  # Newton converges quadratically, so this step is already exact
+        if slope <= 0 or not low < rate < high:
+            rate = (low + high) / 2
+    
+    return rate * 100
+
+def _solve_for_time(principal, pmt, freq, rate, target):
+    """Solve for the first 0.1-year step (1 to 100 years) at which the target is reached"""
+    if rate <= 0:
+        return float('inf')
+    
+    period_rate = rate / freq
+    
+    def future_value(years):
+        fv_principal = principal * _growth_factor(rate, years)
+        fv_pmt = pmt * _annuity_factor(period_rate, years * freq)
+        return fv_principal + fv_pmt
+    
+    # The principal compounds yearly but contributions per period, so there is
+    # no closed-form inverse; FV is increasing in time, so bisect over the
+    # 0.1-year steps instead of walking them one by one
+    min_step, max_step = 0, 990  # 1 year to 100 years
+    if future_value(1) >= target:
+        return 1
+    if future_value(1 + max_step / 10) < target:
+        return float('inf')
+    
+    # Invariant: step `low` falls short of the target, step `high` reaches it
+    low, high = min_step, max_step
+    while high - low > 1:
+        mid = (low + high) // 2
+        if future_value(1 + mid / 10) >= target:
+            high = mid
+        else:
+            low = mid
+    
+    return 1 + high / 10
+
+# Contributions per year for each contribution frequency
+_CONTRIBUTIONS_PER_YEAR = {'monthly': 12, 'quarterly': 4, 'annually': 1}
+
+@dataclass(slots=True)
+class FutureValueResult(CalculationResult):
+    calculation_type: str
+    initial_investment: float
+    annual_return: float
+    years: float
+    additional_contributions: float
+    contribution_frequency: str
+    total_value: float
+    total_invested: float
+    total_gains: float
+    annualized_return: float
+    fv_initial: float
+    fv_contributions: float
+    inputs: dict
 
 # Investment Return Calculator
 @register_calculator
 class InvestmentReturnCalculator(BaseCalculator):
+    __slots__ = ()
+    
+    @_memoize_inputs
     def calculate(self, inputs):
         try:
             calculation_type = inputs.get('calculation_type', 'future_value')
@@ -1958,31 +2332,32 @@ class InvestmentReturnCalculator(BaseCalculator):
     
     def _calculate_future_value(self, inputs):
         """Calculate future value of investment"""
-        initial_investment = float(inputs['initial_investment'])
-        annual_return = float(inputs['annual_return']) / 100
-        years = float(inputs['years'])
-        additional_contributions = float(inputs.get('additional_contributions', 0))
+        r = _round_cents
+        initial_investment = self.get_number(inputs, 'initial_investment')
+        annual_return = self.get_number(inputs, 'annual_return') / 100
+        years = self.get_number(inputs, 'years')
+        additional_contributions = self.get_number(inputs, 'additional_contributions', 0)
         contribution_frequency = inputs.get('contribution_frequency', 'monthly')
         
         # Convert contribution frequency to times per year
-        freq_map = {'monthly': 12, 'quarterly': 4, 'annually': 1}
-        contributions_per_year = freq_map.get(contribution_frequency, 12)
+        contributions_per_year = _CONTRIBUTIONS_PER_YEAR.get(contribution_frequency, 12)
+        total_periods = years * contributions_per_year
+        total_contributions = additional_contributions * contributions_per_year * years
         
         # Calculate future value of initial investment
-        fv_initial = initial_investment * ((1 + annual_return) ** years)
+        fv_initial = initial_investment * _growth_factor(annual_return, years)
         
         # Calculate future value of regular contributions
         if additional_contributions > 0 and annual_return != 0:
             period_rate = annual_return / contributions_per_year
-            total_periods = years * contributions_per_year
-            fv_contributions = additional_contributions * (((1 + period_rate) ** total_periods - 1) / period_rate)
+            fv_contributions = additional_contributions * _annuity_factor(period_rate, total_periods)
         elif additional_contributions > 0:
-            fv_contributions = additional_contributions * contributions_per_year * years
+            fv_contributions = total_contributions
         else:
             fv_contributions = 0
         
         total_value = fv_initial + fv_contributions
-        total_invested = initial_investment + (additional_contributions * contributions_per_year * years)
+        total_invested = initial_investment + total_contributions
         total_gains = total_value - total_invested
         
         # Calculate annualized return including contributions
@@ -1991,33 +2366,33 @@ class InvestmentReturnCalculator(BaseCalculator):
         else:
             annualized_return = 0
         
-        return {
-            'calculation_type': 'future_value',
-            'initial_investment': round(initial_investment, 2),
-            'annual_return': round(annual_return * 100, 2),
-            'years': years,
-            'additional_contributions': round(additional_contributions, 2),
-            'contribution_frequency': contribution_frequency,
-            'total_value': round(total_value, 2),
-            'total_invested': round(total_invested, 2),
-            'total_gains': round(total_gains, 2),
-            'annualized_return': round(annualized_return, 2),
-            'fv_initial': round(fv_initial, 2),
-            'fv_contributions': round(fv_contributions, 2),
-            'inputs': inputs
-        }
+        return FutureValueResult(
+            calculation_type='future_value',
+            initial_investment=r(initial_investment),
+            annual_return=r(annual_return * 100),
+            years=years,
+            additional_contributions=r(additional_contributions),
+            contribution_frequency=contribution_frequency,
+            total_value=r(total_value),
+            total_invested=r(total_invested),
+            total_gains=r(total_gains),
+            annualized_return=r(annualized_return),
+            fv_initial=r(fv_initial),
+            fv_contributions=r(fv_contributions),
+            inputs=inputs
+        )
     
     def _calculate_required_return(self, inputs):
         """Calculate required return to reach target"""
-        initial_investment = float(inputs['initial_investment'])
-        target_value = float(inputs['target_value'])
-        years = float(inputs['years'])
-        additional_contributions = float(inputs.get('additional_contributions', 0))
+        r = _round_cents
+        initial_investment = self.get_number(inputs, 'initial_investment')
+        target_value = self.get_number(inputs, 'target_value')
+        years = self.get_number(inputs, 'years')
+        additional_contributions = self.get_number(inputs, 'additional_contributions', 0)
         contribution_frequency = inputs.get('contribution_frequency', 'monthly')
         
         # Convert contribution frequency
-        freq_map = {'monthly': 12, 'quarterly': 4, 'annually': 1}
-        contributions_per_year = freq_map.get(contribution_frequency, 12)
+        contributions_per_year = _CONTRIBUTIONS_PER_YEAR.get(contribution_frequency, 12)
         
         total_contributions = additional_contributions * contributions_per_year * years
         total_invested = initial_investment + total_contributions
@@ -2030,7 +2405,7 @@ class InvestmentReturnCalculator(BaseCalculator):
                 required_return = 0
         else:
             # Use iterative approach to find required return with regular contributions
-            required_return = self._solve_for_return(
+            required_return = _solve_for_return(
                 initial_investment, additional_contributions, contributions_per_year, years, target_value
             )
         
@@ -2039,28 +2414,28 @@ class InvestmentReturnCalculator(BaseCalculator):
         
         return {
             'calculation_type': 'required_return',
-            'initial_investment': round(initial_investment, 2),
-            'target_value': round(target_value, 2),
+            'initial_investment': r(initial_investment),
+            'target_value': r(target_value),
             'years': years,
-            'additional_contributions': round(additional_contributions, 2),
+            'additional_contributions': r(additional_contributions),
             'contribution_frequency': contribution_frequency,
-            'total_invested': round(total_invested, 2),
-            'required_return': round(required_return, 2),
+            'total_invested': r(total_invested),
+            'required_return': r(required_return),
             'risk_assessment': risk_assessment,
             'inputs': inputs
         }
     
     def _calculate_time_needed(self, inputs):
         """Calculate time needed to reach target"""
-        initial_investment = float(inputs['initial_investment'])
-        target_value = float(inputs['target_value'])
-        annual_return = float(inputs['annual_return']) / 100
-        additional_contributions = float(inputs.get('additional_contributions', 0))
+        r = _round_cents
+        initial_investment = self.get_number(inputs, 'initial_investment')
+        target_value = self.get_number(inputs, 'target_value')
+        annual_return = self.get_number(inputs, 'annual_return') / 100
+        additional_contributions = self.get_number(inputs, 'additional_contributions', 0)
         contribution_frequency = inputs.get('contribution_frequency', 'monthly')
         
         # Convert contribution frequency
-        freq_map = {'monthly': 12, 'quarterly': 4, 'annually': 1}
-        contributions_per_year = freq_map.get(contribution_frequency, 12)
+        contributions_per_year = _CONTRIBUTIONS_PER_YEAR.get(contribution_frequency, 12)
         
         if additional_contributions == 0:
             # Simple compound interest
@@ -2070,7 +2445,7 @@ class InvestmentReturnCalculator(BaseCalculator):
                 years_needed = float('inf')
         else:
             # Use iterative approach
-            years_needed = self._solve_for_time(
+            years_needed = _solve_for_time(
                 initial_investment, additional_contributions, contributions_per_year, annual_return, target_value
             )
         
@@ -2082,10 +2457,10 @@ class InvestmentReturnCalculator(BaseCalculator):
         
         return {
             'calculation_type': 'time_needed',
-            'initial_investment': round(initial_investment, 2),
-            'target_value': round(target_value, 2),
-            'annual_return': round(annual_return * 100, 2),
-            'additional_contributions': round(additional_contributions, 2),
+            'initial_investment': r(initial_investment),
+            'target_value': r(target_value),
+            'annual_return': r(annual_return * 100),
+            'additional_contributions': r(additional_contributions),
             'contribution_frequency': contribution_frequency,
             'years_needed': round(years_needed, 1) if years_needed else None,
             'feasible': feasible,
@@ -2094,178 +2469,91 @@ class InvestmentReturnCalculator(BaseCalculator):
     
     def _calculate_portfolio_analysis(self, inputs):
         """Analyze portfolio performance"""
-        investments = []
-        total_initial = 0
-        total_current = 0
-        
-        # Parse multiple investments
-        for i in range(1, 6):  # Support up to 5 investments
-            initial_key = f'investment_{i}_initial'
-            current_key = f'investment_{i}_current'
-            name_key = f'investment_{i}_name'
-            
-            if initial_key in inputs and inputs[initial_key]:
-                initial = float(inputs[initial_key])
-                current = float(inputs.get(current_key, initial))
-                name = inputs.get(name_key, f'Investment {i}')
-                
-                gain_loss = current - initial
-                return_pct = (gain_loss / initial) * 100 if initial > 0 else 0
-                
-                investments.append({
-                    'name': name,
-                    'initial': round(initial, 2),
-                    'current': round(current, 2),
-                    'gain_loss': round(gain_loss, 2),
-                    'return_pct': round(return_pct, 2),
-                    'weight': 0  # Will calculate below
-                })
-                
-                total_initial += initial
-                total_current += current
-        
-        # Calculate weights and portfolio metrics
-        for investment in investments:
-            investment['weight'] = round((investment['initial'] / total_initial) * 100, 1)
+        r = _round_cents
+        # Parse multiple investments (up to 5) into parallel columns
+        active = [i for i in range(1, 6) if inputs.get(f'investment_{i}_initial')]
+        names = [inputs.get(f'investment_{i}_name', f'Investment {i}') for i in active]
+        initials = [float(inputs[f'investment_{i}_initial']) for i in active]
+        currents = [float(inputs.get(f'investment_{i}_current', initial))
+                    for i, initial in zip(active, initials)]
+        
+        total_initial = sum(initials)
+        total_current = sum(currents)
+        
+        # Per-investment figures, one column each; weights use the rounded initial amounts
+        gains = [current - initial for initial, current in zip(initials, currents)]
+        initials_r = [r(initial) for initial in initials]
+        returns_r = [r((gain / initial) * 100 if initial > 0 else 0)
+                     for initial, gain in zip(initials, gains)]
+        weights = [round((initial / total_initial) * 100, 1) for initial in initials_r]
+        
+        investments = [
+            {
+                'name': name,
+                'initial': initial,
+                'current': r(current),
+                'gain_loss': r(gain),
+                'return_pct': return_pct,
+                'weight': weight
+            }
+            for name, initial, current, gain, return_pct, weight
+            in zip(names, initials_r, currents, gains, returns_r, weights)
+        ]
         
         total_gain_loss = total_current - total_initial
         portfolio_return = (total_gain_loss / total_initial) * 100 if total_initial > 0 else 0
         
-        # Performance analysis
-        best_performer = max(investments, key=lambda x: x['return_pct']) if investments else None
-        worst_performer = min(investments, key=lambda x: x['return_pct']) if investments else None
+        # Performance analysis; index() finds the first best/worst like max()/min() with a key
+        if investments:
+            best_performer = investments[returns_r.index(max(returns_r))]
+            worst_performer = investments[returns_r.index(min(returns_r))]
+        else:
+            best_performer = worst_performer = None
         
         return {
             'calculation_type': 'portfolio_analysis',
             'investments': investments,
-            'total_initial': round(total_initial, 2),
-            'total_current': round(total_current, 2),
-            'total_gain_loss': round(total_gain_loss, 2),
-            'portfolio_return': round(portfolio_return, 2),
+            'total_initial': r(total_initial),
+            'total_current': r(total_current),
+            'total_gain_loss': r(total_gain_loss),
+            'portfolio_return': r(portfolio_return),
             'best_performer': best_performer,
             'worst_performer': worst_performer,
             'num_investments': len(investments),
             'inputs': inputs
         }
     
-    def _solve_for_return(self, principal, pmt, freq, years, target):
-        """Iteratively solve for required return rate"""
-        import math
-        
-        # Binary search for the return rate
-        low, high = 0.001, 0.50  # 0.1% to 50%
-        tolerance = 0.0001
-        max_iterations = 100
-        
-        for _ in range(max_iterations):
-            mid = (low + high) / 2
-            period_rate = mid / freq
-            total_periods = years * freq
-            
-            # Calculate future value with this rate
-            fv_principal = principal * ((1 + mid) ** years)
-            if period_rate == 0:
-                fv_pmt = pmt * total_periods
-            else:
-                fv_pmt = pmt * (((1 + period_rate) ** total_periods - 1) / period_rate)
-            
-            total_fv = fv_principal + fv_pmt
-            
-            if abs(total_fv - target) < tolerance:
-                return mid * 100
-            elif total_fv < target:
-                low = mid
-            else:
-                high = mid
-        
-        return mid * 100
-    
-    def _solve_for_time(self, principal, pmt, freq, rate, target):
-        """Iteratively solve for time needed"""
-        if rate <= 0:
-            return float('inf')
-        
-        # Start with simple estimate and iterate
-        years = 1
-        max_years = 100
-        
-        while years <= max_years:
-            period_rate = rate / freq
-            total_periods = years * freq
-            
-            fv_principal = principal * ((1 + rate) ** years)
-            fv_pmt = pmt * (((1 + period_rate) ** total_periods - 1) / period_rate)
-            total_fv = fv_principal + fv_pmt
-            
-            if total_fv >= target:
-                return years
-            
-            years += 0.1
-        
-        return float('inf')
-    
     def _assess_return_risk(self, required_return):
         """Assess the risk level of required return"""
-        if required_return <= 3:
-            return {
-                'level': 'Conservative',
-                'description': 'Low risk, achievable with bonds/CDs',
-                'feasibility': 'High'
-            }
-        elif required_return <= 7:
-            return {
-                'level': 'Moderate',
-                'description': 'Moderate risk, typical for balanced portfolios',
-                'feasibility': 'Good'
-            }
-        elif required_return <= 12:
-            return {
-                'level': 'Aggressive',
-                'description': 'Higher risk, requires growth-focused investments',
-                'feasibility': 'Challenging'
-            }
-        else:
-            return {
-                'level': 'Very High Risk',
-                'description': 'Extremely high risk, may not be realistic',
-                'feasibility': 'Unlikely'
-            }
+        return _RETURN_RISK_LEVELS[bisect_left(_RETURN_RISK_THRESHOLDS, required_return)]
+    
+    # (key, missing message, label, min, max) per calculation type; time_needed only
+    # checks that its fields are present
+    _REQUIRED_FIELDS = {
+        'future_value': (
+            ('initial_investment', "Initial investment is required", 'Initial investment', 1, 50000000),
+            ('annual_return', "Annual return is required", 'Annual return', -50, 50),
+            ('years', "Investment period is required", 'Years', 0.1, 100)
+        ),
+        'required_return': (
+            ('initial_investment', "Initial Investment is required", 'Initial Investment', 1, 50000000),
+            ('target_value', "Target Value is required", 'Target Value', 1, 50000000),
+            ('years', "Years is required", 'Years', 1, 100)
+        ),
+        'time_needed': (
+            ('initial_investment', "Initial Investment is required", None, None, None),
+            ('target_value', "Target Value is required", None, None, None),
+            ('annual_return', "Annual Return is required", None, None, None)
+        )
+    }
     
     def validate_inputs(self, inputs):
         self.clear_errors()
         
         calculation_type = inputs.get('calculation_type', 'future_value')
         
-        if calculation_type == 'future_value':
-            if 'initial_investment' not in inputs or inputs['initial_investment'] == '':
-                self.add_error("Initial investment is required")
-            else:
-                self.validate_number(inputs['initial_investment'], 'Initial investment', 1, 50000000)
-            
-            if 'annual_return' not in inputs or inputs['annual_return'] == '':
-                self.add_error("Annual return is required")
-            else:
-                self.validate_number(inputs['annual_return'], 'Annual return', -50, 50)
-            
-            if 'years' not in inputs or inputs['years'] == '':
-                self.add_error("Investment period is required")
-            else:
-                self.validate_number(inputs['years'], 'Years', 0.1, 100)
-        
-        elif calculation_type == 'required_return':
-            required_fields = ['initial_investment', 'target_value', 'years']
-            for field in required_fields:
-                if field not in inputs or inputs[field] == '':
-                    self.add_error(f"{field.replace('_', ' ').title()} is required")
-                else:
-                    max_val = 50000000 if 'investment' in field or 'value' in field else 100
-                    self.validate_number(inputs[field], field.replace('_', ' ').title(), 1, max_val)
-        
-        elif calculation_type == 'time_needed':
-            required_fields = ['initial_investment', 'target_value', 'annual_return']
-            for field in required_fields:
-                if field not in inputs or inputs[field] == '':
-                    self.add_error(f"{field.replace('_', ' ').title()} is required")
+        if calculation_type in self._REQUIRED_FIELDS:
+            self.validate_fields(inputs, self._REQUIRED_FIELDS[calculation_type])
         
         elif calculation_type == 'portfolio_analysis':
             # At least one investment required
@@ -2287,12 +2575,19 @@ class InvestmentReturnCalculator(BaseCalculator):
             'canonical': '/calculators/investment-return/'
         }
 
+# Required mortgage inputs, fetched together; a missing key raises KeyError as before
+_MORTGAGE_REQUIRED_INPUTS = itemgetter('home_price', 'annual_rate')
+
 # Mortgage Calculator
 @register_calculator
 class MortgageCalculator(BaseCalculator):
+    __slots__ = ()
+    
+    @_memoize_inputs
     def calculate(self, inputs):
+        r = _round_cents
         try:
-            home_price = float(inputs['home_price'])
+            home_price, annual_rate_percent = map(float, _MORTGAGE_REQUIRED_INPUTS(inputs))
             down_payment = float(inputs.get('down_payment_amount', 0))
             down_payment_percent = float(inputs.get('down_payment_percent', 20))
             
@@ -2306,7 +2601,7 @@ class MortgageCalculator(BaseCalculator):
                 down_payment_percent = (down_payment / home_price) * 100
             
             loan_amount = home_price - down_payment
-            annual_rate = float(inputs['annual_rate']) / 100
+            annual_rate = annual_rate_percent / 100
             loan_term_years = float(inputs.get('loan_term_years', 30))
             
             # Additional costs
@@ -2327,7 +2622,10 @@ class MortgageCalculator(BaseCalculator):
             if monthly_rate == 0:
                 monthly_principal_interest = loan_amount / num_payments
             else:
-                monthly_principal_interest = loan_amount * (monthly_rate * (1 + monthly_rate)**num_payments) / ((1 + monthly_rate)**num_payments - 1)
+                # P * r * g / (g - 1) with g = (1 + r)^n, written as growth over the annuity
+                # factor (g - 1) / r so g is computed once and small rates stay accurate
+                monthly_principal_interest = (loan_amount * _growth_factor(monthly_rate, num_payments)
+                                              / _annuity_factor(monthly_rate, num_payments))
             
             # Calculate monthly costs
             monthly_property_tax = property_tax_annual / 12
@@ -2346,20 +2644,20 @@ class MortgageCalculator(BaseCalculator):
             required_annual_income = (total_monthly_payment * 12) / 0.28
             
             return {
-                'home_price': round(home_price, 2),
-                'down_payment': round(down_payment, 2),
+                'home_price': r(home_price),
+                'down_payment': r(down_payment),
                 'down_payment_percent': round(down_payment_percent, 1),
-                'loan_amount': round(loan_amount, 2),
-                'monthly_principal_interest': round(monthly_principal_interest, 2),
-                'monthly_property_tax': round(monthly_property_tax, 2),
-                'monthly_insurance': round(monthly_insurance, 2),
-                'pmi_monthly': round(pmi_monthly, 2),
-                'hoa_monthly': round(hoa_monthly, 2),
-                'total_monthly_payment': round(total_monthly_payment, 2),
-                'total_interest': round(total_interest, 2),
-                'total_cost_of_home': round(total_cost_of_home, 2),
-                'required_annual_income': round(required_annual_income, 2),
-                'annual_rate': float(inputs['annual_rate']),
+                'loan_amount': r(loan_amount),
+                'monthly_principal_interest': r(monthly_principal_interest),
+                'monthly_property_tax': r(monthly_property_tax),
+                'monthly_insurance': r(monthly_insurance),
+                'pmi_monthly': r(pmi_monthly),
+                'hoa_monthly': r(hoa_monthly),
+                'total_monthly_payment': r(total_monthly_payment),
+                'total_interest': r(total_interest),
+                'total_cost_of_home': r(total_cost_of_home),
+                'required_annual_income': r(required_annual_income),
+                'annual_rate': annual_rate_percent,
                 'loan_term_years': loan_term_years,
                 'needs_pmi': down_payment_percent < 20,
                 'closing_costs': self._estimate_closing_costs(home_price),
@@ -2373,31 +2671,20 @@ class MortgageCalculator(BaseCalculator):
         except Exception as e:
             raise ValueError(f"Calculation error: {str(e)}")
     
+    # (key, missing message, label, min, max) and optional (key, label, min, max)
+    _REQUIRED_FIELDS = (
+        ('home_price', "Home price is required", 'Home price', 10000, 50000000),
+        ('annual_rate', "Annual interest rate is required", 'Annual interest rate', 0.1, 30)
+    )
+    _OPTIONAL_FIELDS = (
+        ('down_payment_amount', 'Down payment', 0, 10000000),
+        ('property_tax_annual', 'Property tax', 0, 1000000),
+        ('home_insurance_annual', 'Home insurance', 0, 100000)
+    )
+    
     def validate_inputs(self, inputs):
         self.clear_errors()
-        
-        # Validate home price
-        if 'home_price' not in inputs or inputs['home_price'] == '':
-            self.add_error("Home price is required")
-        else:
-            price = self.validate_number(inputs['home_price'], 'Home price', 10000, 50000000)
-        
-        # Validate annual interest rate
-        if 'annual_rate' not in inputs or inputs['annual_rate'] == '':
-            self.add_error("Annual interest rate is required")
-        else:
-            rate = self.validate_number(inputs['annual_rate'], 'Annual interest rate', 0.1, 30)
-        
-        # Optional fields validation
-        if 'down_payment_amount' in inputs and inputs['down_payment_amount']:
-            down_payment = self.validate_number(inputs['down_payment_amount'], 'Down payment', 0, 10000000)
-        
-        if 'property_tax_annual' in inputs and inputs['property_tax_annual']:
-            self.validate_number(inputs['property_tax_annual'], 'Property tax', 0, 1000000)
-        
-        if 'home_insurance_annual' in inputs and inputs['home_insurance_annual']:
-            self.validate_number(inputs['home_insurance_annual'], 'Home insurance', 0, 100000)
-        
+        self.validate_fields(inputs, self._REQUIRED_FIELDS, self._OPTIONAL_FIELDS)
         return len(self.errors) == 0
     
     def get_meta_data(self):
@@ -2410,18 +2697,54 @@ class MortgageCalculator(BaseCalculator):
     
     def _estimate_closing_costs(self, home_price):
         """Estimate typical closing costs (2-5% of home price)"""
+        r = _round_cents
         low_estimate = home_price * 0.02
         high_estimate = home_price * 0.05
         return {
-            'low': round(low_estimate, 2),
-            'high': round(high_estimate, 2),
-            'typical': round((low_estimate + high_estimate) / 2, 2)
+            'low': r(low_estimate),
+            'high': r(high_estimate),
+            'typical': r((low_estimate + high_estimate) / 2)
         }
 
+# Tipping guidance by service type, shared by every response. Plain dicts so
+# jsonify can encode them; treat them as read-only.
+_TIP_GUIDES = {
+    'restaurant': {
+        'excellent': '20-25%',
+        'good': '18-20%',
+        'average': '15-18%',
+        'poor': '10-15%',
+        'note': 'Standard for sit-down restaurants in the US'
+    },
+    'delivery': {
+        'excellent': '20-25%',
+        'good': '15-20%',
+        'average': '10-15%',
+        'minimum': '$2-5',
+        'note': 'Consider distance and weather conditions'
+    },
+    'bar': {
+        'cocktails': '$1-2 per drink',
+        'beer_wine': '$1 per drink',
+        'tab': '15-20%',
+        'note': 'Higher for craft cocktails'
+    },
+    'taxi_uber': {
+        'standard': '15-20%',
+        'excellent': '20-25%',
+        'note': 'Round up to nearest dollar'
+    }
+}
+_DEFAULT_TIP_GUIDE = _TIP_GUIDES['restaurant']
+
 # Tip Calculator
 @register_calculator
 class TipCalculator(BaseCalculator):
+    __slots__ = ()
+    
+    @_memoize_inputs
     def calculate(self, inputs):
+        r = _round_cents
         try:
             bill_amount = float(inputs['bill_amount'])
             tip_percentage = float(inputs['tip_percentage'])
@@ -2439,24 +2762,26 @@ class TipCalculator(BaseCalculator):
             # Calculate totals
             total_amount = bill_amount + tax_amount + tip_amount
             
-            # Per person calculations
-            bill_per_person = bill_amount / num_people
-            tax_per_person = tax_amount / num_people
-            tip_per_person = tip_amount / num_people
-            total_per_person = total_amount / num_people
+            # Per person calculations; divide rather than multiply by 1 / people so
+            # the shares stay correctly rounded, but convert the count to float once
+            people = float(num_people)
+            bill_per_person = bill_amount / people
+            tax_per_person = tax_amount / people
+            tip_per_person = tip_amount / people
+            total_per_person = total_amount / people
             
             return {
-                'bill_amount': round(bill_amount, 2),
+                'bill_amount': r(bill_amount),
                 'tip_percentage': tip_percentage,
                 'tax_percentage': tax_percentage,
-                'tax_amount': round(tax_amount, 2),
-                'tip_amount': round(tip_amount, 2),
-                'total_amount': round(total_amount, 2),
+                'tax_amount': r(tax_amount),
+                'tip_amount': r(tip_amount),
+                'total_amount': r(total_amount),
                 'num_people': num_people,
-                'bill_per_person': round(bill_per_person, 2),
-                'tax_per_person': round(tax_per_person, 2),
-                'tip_per_person': round(tip_per_person, 2),
-                'total_per_person': round(total_per_person, 2),
+                'bill_per_person': r(bill_per_person),
+                'tax_per_person': r(tax_per_person),
+                'tip_per_person': r(tip_per_person),
+                'total_per_person': r(total_per_person),
                 'tip_on_total': tip_on_total,
                 'tip_guide': self._get_tip_guide(inputs.get('service_type', 'restaurant')),
                 'inputs': inputs
@@ -2469,31 +2794,22 @@ class TipCalculator(BaseCalculator):
         except Exception as e:
             raise ValueError(f"Calculation error: {str(e)}")
     
+    # (key, missing message, label, min, max)
+    _REQUIRED_FIELDS = (
+        ('bill_amount', "Bill amount is required", 'Bill amount', 0.01, 100000),
+        ('tip_percentage', "Tip percentage is required", 'Tip percentage', 0, 100)
+    )
+    
     def validate_inputs(self, inputs):
         self.clear_errors()
         
-        # Validate bill amount
-        if 'bill_amount' not in inputs or inputs['bill_amount'] == '':
-            self.add_error("Bill amount is required")
-        else:
-            bill = self.validate_number(inputs['bill_amount'], 'Bill amount', 0.01, 100000)
-            if bill is None:
-                pass
-        
-        # Validate tip percentage
-        if 'tip_percentage' not in inputs or inputs['tip_percentage'] == '':
-            self.add_error("Tip percentage is required")
-        else:
-            tip = self.validate_number(inputs['tip_percentage'], 'Tip percentage', 0, 100)
-            if tip is None:
-                pass
+        self.validate_fields(inputs, self._REQUIRED_FIELDS)
         
         # Validate number of people (optional, default to 1)
-        if 'num_people' in inputs and inputs['num_people'] != '':
-            people = self.validate_number(inputs['num_people'], 'Number of people', 1, 100)
-            if people is None:
-                pass
-            elif not float(inputs['num_people']).is_integer():
+        num_people = inputs.get('num_people', '')
+        if num_people != '':
+            people = self.validate_number(num_people, 'Number of people', 1, 100)
+            if people is not None and not people.is_integer():
                 self.add_error("Number of people must be a whole number")
         
         return len(self.errors) == 0
@@ -2507,38 +2823,56 @@ class TipCalculator(BaseCalculator):
         }
     
     def _get_tip_guide(self, service_type):
-        guides = {
-            'restaurant': {
-                'excellent': '20-25%',
-                'good': '18-20%',
-                'average': '15-18%',
-                'poor': '10-15%',
-                'note': 'Standard for sit-down restaurants in the US'
-            },
-            'delivery': {
-                'excellent': '20-25%',
-                'good': '15-20%',
-                'average': '10-15%',
-                'minimum': '$2-5',
-                'note': 'Consider distance and weather conditions'
-            },
-            'bar': {
-                'cocktails': '$1-2 per drink',
-                'beer_wine': '$1 per drink',
-                'tab': '15-20%',
-                'note': 'Higher for craft cocktails'
-            },
-            'taxi_uber': {
-                'standard': '15-20%',
-                'excellent': '20-25%',
-                'note': 'Round up to nearest dollar'
-            }
-        }
-        return guides.get(service_type, guides['restaurant'])
+        return _TIP_GUIDES.get(service_type, _DEFAULT_TIP_GUIDE)
+
+# Imperial conversions; kg is converted back to lbs by division so the ideal-weight range stays correctly rounded
+_KG_PER_LB = 0.453592
+_METERS_PER_INCH = 0.0254
+
+# BMI category lower bounds; a BMI exactly on a bound belongs to the higher category
+_BMI_CATEGORY_BOUNDS = (16, 18.5, 25, 30, 35, 40)
+_BMI_CATEGORIES = (
+    ("Severely Underweight", "Severely underweight - please consult a healthcare provider", "#dc3545"),
+    ("Underweight", "Underweight - consider gaining weight", "#ffc107"),
+    ("Normal Weight", "Normal weight - maintain your current lifestyle", "#28a745"),
+    ("Overweight", "Overweight - consider losing weight", "#fd7e14"),
+    ("Obese Class I", "Obese Class I - weight loss recommended", "#dc3545"),
+    ("Obese Class II", "Obese Class II - significant weight loss needed", "#dc3545"),
+    ("Obese Class III", "Obese Class III - seek medical advice", "#6f42c1")
+)
+
+# Health recommendations per BMI category band (shared, read-only)
+_BMI_RECS_UNDERWEIGHT = [
+    "Increase caloric intake with nutritious foods",
+    "Consider strength training to build muscle mass",
+    "Consult with a healthcare provider or nutritionist"
+]
+_BMI_RECS_NORMAL = [
+    "Maintain current weight through balanced diet",
+    "Continue regular physical activity",
+    "Focus on overall health and wellness"
+]
+_BMI_RECS_OVERWEIGHT = [
+    "Create a moderate caloric deficit (300-500 calories/day)",
+    "Increase physical activity to 150+ minutes per week",
+    "Focus on whole foods and reduce processed foods"
+]
+_BMI_RECS_OBESE = [
+    "Consult with healthcare provider for weight loss plan",
+    "Consider structured diet and exercise program",
+    "Focus on sustainable lifestyle changes"
+]
+_BMI_RECOMMENDATIONS = (
+    _BMI_RECS_UNDERWEIGHT, _BMI_RECS_UNDERWEIGHT, _BMI_RECS_NORMAL, _BMI_RECS_OVERWEIGHT,
+    _BMI_RECS_OBESE, _BMI_RECS_OBESE, _BMI_RECS_OBESE
+)
 
 # BMI Calculator
 @register_calculator
 class BMICalculator(BaseCalculator):
+    __slots__ = ()
+    
+    @_memoize_inputs
     def calculate(self, inputs):
         unit_system = inputs.get('unit_system', 'metric')
         
@@ -2547,19 +2881,18 @@ class BMICalculator(BaseCalculator):
                 weight = float(inputs['weight'])  # kg
                 height = float(inputs['height']) / 100  # convert cm to meters
             else:  # imperial
-                weight = float(inputs['weight']) * 0.453592  # lbs to kg
-                height = float(inputs['height']) * 0.0254  # inches to meters
+                weight = float(inputs['weight']) * _KG_PER_LB  # lbs to kg
+                height = float(inputs['height']) * _METERS_PER_INCH  # inches to meters
             
             if height <= 0:
                 raise ValueError("Height must be greater than zero")
             
             bmi = weight / (height * height)
             
-            # BMI Categories
-            category, description, color = self._get_bmi_category(bmi)
-            
-            # Health recommendations based on BMI
-            recommendations = self._get_health_recommendations(bmi)
+            # BMI category and health recommendations, both indexed by the same band
+            band = bisect_right(_BMI_CATEGORY_BOUNDS, bmi)
+            category, description, color = _BMI_CATEGORIES[band]
+            recommendations = _BMI_RECOMMENDATIONS[band]
             
             return {
                 'bmi': round(bmi, 1),
@@ -2585,10 +2918,11 @@ class BMICalculator(BaseCalculator):
         unit_system = inputs.get('unit_system', 'metric')
         
         # Check required fields
-        if 'weight' not in inputs or inputs['weight'] == '':
+        weight = inputs.get('weight', '')
+        if weight == '':
             self.add_error("Weight is required")
         else:
-            weight = self.validate_number(inputs['weight'], 'Weight', 1, 1000)
+            weight = self.validate_number(weight, 'Weight', 1, 1000)
             if weight is None:
                 pass
             elif unit_system == 'metric' and (weight < 20 or weight > 500):
@@ -2596,10 +2930,11 @@ class BMICalculator(BaseCalculator):
             elif unit_system == 'imperial' and (weight < 44 or weight > 1100):
                 self.add_error("Weight should be between 44-1100 lbs")
         
-        if 'height' not in inputs or inputs['height'] == '':
+        height = inputs.get('height', '')
+        if height == '':
             self.add_error("Height is required")
         else:
-            height = self.validate_number(inputs['height'], 'Height', 1, 300)
+            height = self.validate_number(height, 'Height', 1, 300)
             if height is None:
                 pass
             elif unit_system == 'metric' and (height < 50 or height > 250):
@@ -2617,115 +2952,138 @@ class BMICalculator(BaseCalculator):
             'canonical': '/calculators/bmi/'
         }
     
-    def _get_bmi_category(self, bmi):
-        if bmi < 16:
-            return "Severely Underweight", "Severely underweight - please consult a healthcare provider", "#dc3545"
-        elif bmi < 18.5:
-            return "Underweight", "Underweight - consider gaining weight", "#ffc107"
-        elif bmi < 25:
-            return "Normal Weight", "Normal weight - maintain your current lifestyle", "#28a745"
-        elif bmi < 30:
-            return "Overweight", "Overweight - consider losing weight", "#fd7e14"
-        elif bmi < 35:
-            return "Obese Class I", "Obese Class I - weight loss recommended", "#dc3545"
-        elif bmi < 40:
-            return "Obese Class II", "Obese Class II - significant weight loss needed", "#dc3545"
-        else:
-            return "Obese Class III", "Obese Class III - seek medical advice", "#6f42c1"
-    
-    def _get_health_recommendations(self, bmi):
-        if bmi < 18.5:
-            return [
-                "Increase caloric intake with nutritious foods",
-                "Consider strength training to build muscle mass",
-                "Consult with a healthcare provider or nutritionist"
-            ]
-        elif bmi < 25:
-            return [
-                "Maintain current weight through balanced diet",
-                "Continue regular physical activity",
-                "Focus on overall health and wellness"
-            ]
-        elif bmi < 30:
-            return [
-                "Create a moderate caloric deficit (300-500 calories/day)",
-                "Increase physical activity to 150+ minutes per week",
-                "Focus on whole foods and reduce processed foods"
-            ]
-        else:
-            return [
-                "Consult with healthcare provider for weight loss plan",
-                "Consider structured diet and exercise program",
-                "Focus on sustainable lifestyle changes"
-            ]
-    
     def _get_ideal_weight_range(self, height_meters, unit_system):
         # Normal BMI range: 18.5 - 24.9
-        min_weight = 18.5 * (height_meters * height_meters)
-        max_weight = 24.9 * (height_meters * height_meters)
+        height_squared = height_meters * height_meters
+        min_weight = 18.5 * height_squared
+        max_weight = 24.9 * height_squared
         
         if unit_system == 'imperial':
-            min_weight = min_weight / 0.453592  # kg to lbs
-            max_weight = max_weight / 0.453592
+            min_weight = min_weight / _KG_PER_LB  # kg to lbs
+            max_weight = max_weight / _KG_PER_LB
             unit = "lbs"
         else:
             unit = "kg"
         
         return f"{min_weight:.1f} - {max_weight:.1f} {unit}"
 
+# Explanation functions take the raw inputs (echoed as typed), the rounded result,
+# and the operation's parsed fields in _PERCENTAGE_FIELDS order
+def _explain_percent_of(inputs, result, *_):
+    x, y = inputs['x'], inputs['y']
+    return f"{x} is {result}% of {y}. This means {x} represents {result} parts out of every 100 parts of {y}."
+
+def _explain_percent_value(inputs, result, *_):
+    percent, total = inputs['percent'], inputs['total']
+    return f"{percent}% of {total} equals {result}. This is calculated as ({percent} ÷ 100) × {total}."
+
+def _explain_increase(inputs, result, original, percent):
+    return (f"{inputs['original']} increased by {inputs['percent']}% equals {result}. "
+            f"The increase amount is {_round_cents(result - original)}.")
+
+def _explain_decrease(inputs, result, original, percent):
+    return (f"{inputs['original']} decreased by {inputs['percent']}% equals {result}. "
+            f"The decrease amount is {_round_cents(original - result)}.")
+
+def _explain_difference(inputs, result, *_):
+    return (f"The percentage difference between {inputs['x']} and {inputs['y']} is {result}%. "
+            f"This measures the relative difference between the two values.")
+
+def _explain_change(inputs, result, *_):
+    direction = 'This is an increase.' if result > 0 else 'This is a decrease.' if result < 0 else 'No change occurred.'
+    return f"The percentage change from {inputs['original']} to {inputs['new_value']} is {result}%. {direction}"
+
+# Required input fields and display formula per operation
+_PERCENTAGE_FIELDS = {
+    'basic': ('x', 'y'),
+    'find_value': ('percent', 'total'),
+    'increase': ('original', 'percent'),
+    'decrease': ('original', 'percent'),
+    'difference': ('x', 'y'),
+    'change': ('original', 'new_value')
+}
+
+def _percent_of(x, y):
+    if y == 0:
+        raise ValueError("Cannot divide by zero")
+    return (x / y) * 100
+
+def _percent_value(percent, total):
+    return (percent / 100) * total
+
+def _percent_increase(original, percent):
+    return original * (1 + percent / 100)
+
+def _percent_decrease(original, percent):
+    return original * (1 - percent / 100)
+
+def _percent_difference(x, y):
+    if x == 0 and y == 0:
+        return 0
+    return abs(x - y) / ((x + y) / 2) * 100
+
+def _percent_change(original, new_value):
+    if original == 0:
+        raise ValueError("Cannot calculate percentage change from zero")
+    return ((new_value - original) / original) * 100
+
+# Operation functions, called with the operation's fields in _PERCENTAGE_FIELDS order
+_PERCENTAGE_OPERATIONS = {
+    'basic': _percent_of,
+    'find_value': _percent_value,
+    'increase': _percent_increase,
+    'decrease': _percent_decrease,
+    'difference': _percent_difference,
+    'change': _percent_change
+}
+
+# The field per operation that must not be zero, with its error message
+_PERCENTAGE_NONZERO_FIELD = {
+    'basic': ('y', "Division by zero: Y cannot be zero"),
+    'difference': ('y', "Division by zero: Y cannot be zero"),
+    'change': ('original', "Original value cannot be zero for percentage change")
+}
+_PERCENTAGE_FORMULAS = {
+    'basic': '(X ÷ Y) × 100',
+    'find_value': '(Percent ÷ 100) × Total',
+    'increase': 'Original × (1 + Percent ÷ 100)',
+    'decrease': 'Original × (1 - Percent ÷ 100)',
+    'difference': '|X - Y| ÷ ((X + Y) ÷ 2) × 100',
+    'change': '((New Value - Original) ÷ Original) × 100'
+}
+
+# Explanation per operation
+_PERCENTAGE_EXPLANATIONS = {
+    'basic': _explain_percent_of,
+    'find_value': _explain_percent_value,
+    'increase': _explain_increase,
+    'decrease': _explain_decrease,
+    'difference': _explain_difference,
+    'change': _explain_change
+}
+
 # Percentage Calculator
 @register_calculator
 class PercentageCalculator(BaseCalculator):
+    __slots__ = ()
+    
+    @_memoize_inputs
     def calculate(self, inputs):
         operation = inputs.get('operation', 'basic')
         
         try:
-            if operation == 'basic':
-                x = float(inputs['x'])
-                y = float(inputs['y'])
-                if y == 0:
-                    raise ValueError("Cannot divide by zero")
-                result = (x / y) * 100
-                
-            elif operation == 'find_value':
-                percent = float(inputs['percent'])
-                total = float(inputs['total'])
-                result = (percent / 100) * total
-                
-            elif operation == 'increase':
-                original = float(inputs['original'])
-                percent = float(inputs['percent'])
-                result = original * (1 + percent / 100)
-                
-            elif operation == 'decrease':
-                original = float(inputs['original'])
-                percent = float(inputs['percent'])
-                result = original * (1 - percent / 100)
-                
-            elif operation == 'difference':
-                x = float(inputs['x'])
-                y = float(inputs['y'])
-                if x == 0 and y == 0:
-                    result = 0
-                else:
-                    result = abs(x - y) / ((x + y) / 2) * 100
-                    
-            elif operation == 'change':
-                original = float(inputs['original'])
-                new_value = float(inputs['new_value'])
-                if original == 0:
-                    raise ValueError("Cannot calculate percentage change from zero")
-                result = ((new_value - original) / original) * 100
-                
-            else:
+            operation_function = _PERCENTAGE_OPERATIONS.get(operation)
+            if operation_function is None:
                 raise ValueError(f"Unknown operation: {operation}")
+            values = [self.get_number(inputs, field) for field in _PERCENTAGE_FIELDS[operation]]
+            result = _round_cents(operation_function(*values))
             
             return {
-                'result': round(result, 2),
+                'result': result,
                 'operation': operation,
                 'inputs': inputs,
                 'formula': self._get_formula(operation),
-                'explanation': self._get_explanation(operation, inputs, result)
+                'explanation': self._get_explanation(operation, inputs, result, values)
             }
         except KeyError as e:
             raise ValueError(f"Missing required field: {str(e).strip('\"\'')}")
@@ -2738,21 +3096,17 @@ class PercentageCalculator(BaseCalculator):
         self.clear_errors()
         
         operation = inputs.get('operation', 'basic')
-        required = self._get_required_fields(operation)
+        nonzero_field, zero_error = _PERCENTAGE_NONZERO_FIELD.get(operation, (None, None))
         
-        for field in required:
-            if field not in inputs or inputs[field] == '' or inputs[field] is None:
+        for field in _PERCENTAGE_FIELDS.get(operation, ()):
+            value = inputs.get(field)
+            if value is None or value == '':
                 self.add_error(f"Missing required field: {field}")
                 continue
             
-            value = self.validate_number(inputs[field], field)
-            if value is None:
-                continue
-            
-            if operation in ['basic', 'difference'] and field == 'y' and value == 0:
-                self.add_error("Division by zero: Y cannot be zero")
-            elif operation == 'change' and field == 'original' and value == 0:
-                self.add_error("Original value cannot be zero for percentage change")
+            value = self.validate_number(value, field, key=field)
+            if value == 0 and field == nonzero_field:
+                self.add_error(zero_error)
         
         return len(self.errors) == 0
     
@@ -2765,45 +3119,112 @@ class PercentageCalculator(BaseCalculator):
         }
     
     def _get_required_fields(self, operation):
-        fields_map = {
-            'basic': ['x', 'y'],
-            'find_value': ['percent', 'total'],
-            'increase': ['original', 'percent'],
-            'decrease': ['original', 'percent'],
-            'difference': ['x', 'y'],
-            'change': ['original', 'new_value']
-        }
-        return fields_map.get(operation, [])
+        return _PERCENTAGE_FIELDS.get(operation, ())
     
     def _get_formula(self, operation):
-        formulas = {
-            'basic': '(X ÷ Y) × 100',
-            'find_value': '(Percent ÷ 100) × Total',
-            'increase': 'Original × (1 + Percent ÷ 100)',
-            'decrease': 'Original × (1 - Percent ÷ 100)',
-            'difference': '|X - Y| ÷ ((X + Y) ÷ 2) × 100',
-            'change': '((New Value - Original) ÷ Original) × 100'
-        }
-        return formulas.get(operation, '')
+        return _PERCENTAGE_FORMULAS.get(operation, '')
     
-    def _get_explanation(self, operation, inputs, result):
+    def _get_explanation(self, operation, inputs, result, values):
+        explanation = _PERCENTAGE_EXPLANATIONS.get(operation)
         try:
-            explanations = {
-                'basic': f"{inputs['x']} is {result}% of {inputs['y']}. This means {inputs['x']} represents {result} parts out of every 100 parts of {inputs['y']}.",
-                'find_value': f"{inputs['percent']}% of {inputs['total']} equals {result}. This is calculated as ({inputs['percent']} ÷ 100) × {inputs['total']}.",
-                'increase': f"{inputs['original']} increased by {inputs['percent']}% equals {result}. The increase amount is {round(float(result) - float(inputs['original']), 2)}.",
-                'decrease': f"{inputs['original']} decreased by {inputs['percent']}% equals {result}. The decrease amount is {round(float(inputs['original']) - float(result), 2)}.",
-                'difference': f"The percentage difference between {inputs['x']} and {inputs['y']} is {result}%. This measures the relative difference between the two values.",
-                'change': f"The percentage change from {inputs['original']} to {inputs['new_value']} is {result}%. {'This is an increase.' if result > 0 else 'This is a decrease.' if result < 0 else 'No change occurred.'}"
-            }
-            return explanations.get(operation, f'Result: {result}')
-        except:
+            if explanation is None:
+                return f'Result: {result}'
+            return explanation(inputs, result, *values)
+        except (KeyError, ValueError, TypeError):
             return f'Result: {result}'
 
 # Routes
-@app.route('/')
-def index():
-    return """
+def _build_page(html):
+    """Encode a static page once, with a gzip copy; returns (body, etag, gzip body, gzip etag)
+
+    Indentation and blank lines are dropped first. Line breaks are kept, so
+    inline scripts parse the same, and the pages have no <pre> or <textarea>.
+    """
+    html = '\n'.join(line for line in map(str.strip, html.splitlines()) if line)
+    body = html.encode('utf-8')
+    compressed = gzip.compress(body, mtime=0)
+    return body, hashlib.md5(body).hexdigest(), compressed, hashlib.md5(compressed).hexdigest()
+
+def _page_response(page, api=None):
+    """Serve a prebuilt page, gzipped when the client accepts it, answering conditional GETs with 304
+
+    Calculator pages pass their API description, which clients preferring
+    JSON get instead of the HTML.
+    """
+    if api is not None and request.accept_mimetypes.best_match(('text/html', 'application/json')) == 'application/json':
+        response = jsonify(api)
+        response.vary.add('Accept')
+        return response
+    body, etag, compressed, compressed_etag = page
+    if request.accept_encodings['gzip']:
+        response = Response(compressed, mimetype='text/html')
+        response.content_encoding = 'gzip'
+        etag = compressed_etag
+    else:
+        response = Response(body, mimetype='text/html')
+    response.vary.add('Accept-Encoding')
+    if api is not None:
+        response.vary.add('Accept')
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+def _calculator_page(slug, page, fields):
+    """Serve a prebuilt calculator page at /calculators/<slug>/; JSON clients get its API fields"""
+    api = {'endpoint': f'/api/calculate/{slug}', 'fields': fields}
+
+    def view():
+        return _page_response(page, api)
+
+    view.__name__ = f"{slug.replace('-', '_')}_calculator"
+    app.add_url_rule(f'/calculators/{slug}/', view.__name__, view)
+    return view
+
+# Calculator classes by their /api/calculate/<slug> slug, for the batch endpoint
+api_calculators = {}
+
+def _calculation_api(slug, calc_class):
+    """Serve POST /api/calculate/<slug> with calc_class, recording each calculation in calculation_logs"""
+    name = slug.replace('-', '_')
+    api_calculators[slug] = calc_class
+
+    def view():
+        try:
+            log.debug("API called - calculating %s", name)
+            data = request.get_json()
+            log.debug("Received data: %s", data)
+            
+            if not data:
+                return jsonify({'error': 'No data received'}), 400
+            
+            calc = calc_class()
+            
+            if not calc.validate_inputs(data):
+                log.debug("Validation errors: %s", calc.errors)
+                return jsonify({'errors': calc.errors}), 400
+            
+            result = calc.calculate(data)
+            log.debug("%s calculation result: %s", name, result)
+            
+            calculation_logs.append({
+                'calculator': name,
+                'inputs': data,
+                'result': result,
+                'timestamp': datetime.now().isoformat()
+            })
+            
+            return jsonify(result)
+            
+        except Exception as e:
+            log.exception("Error in %s API: %s", name, e)
+            return jsonify({'error': str(e)}), 500
+
+    view.__name__ = f'calculate_{name}'
+    app.add_url_rule(f'/api/calculate/{slug}', view.__name__, view, methods=['POST'])
+    return view
+
+_INDEX_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -2905,31 +3326,22 @@ def index():
         </div>
     </body>
     </html>
-    """
+    """)
+
+@app.route('/')
+def index():
+    return _page_response(_INDEX_PAGE)
 
-@app.route('/calculators/mortgage/')
-def mortgage_calculator():
-    return """
+_MORTGAGE_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
         <title>Mortgage Calculator - Home Loan Payment Calculator Free</title>
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <meta name="description" content="Free mortgage calculator with PMI, property taxes, insurance, and HOA. Calculate monthly payments, affordability, and total costs.">
+        <link rel="stylesheet" href="/static/calc.css">
         <style>
-            body { font-family: -apple-system, BlinkMacSystemFont, sans-serif; margin: 2rem; background: #f5f5f5; }
             .container { max-width: 1000px; margin: 0 auto; background: white; padding: 2rem; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-            h1 { color: #007bff; text-align: center; }
-            .form-group { margin-bottom: 1rem; }
-            label { display: block; margin-bottom: 0.5rem; font-weight: 500; }
-            input, select { width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 4px; font-size: 1rem; box-sizing: border-box; }
-            button { width: 100%; background: #007bff; color: white; border: none; padding: 0.75rem; border-radius: 4px; cursor: pointer; font-size: 1rem; margin-top: 1rem; }
-            button:hover { background: #0056b3; }
-            button:disabled { background: #6c757d; cursor: not-allowed; }
-            .result { background: #e8f5e8; border: 1px solid #d4edda; padding: 1.5rem; border-radius: 4px; margin-top: 1rem; }
-            .error { background: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; padding: 1rem; border-radius: 4px; margin-top: 1rem; }
-            .back-link { display: inline-block; margin-bottom: 1rem; color: #007bff; text-decoration: none; }
-            .back-link:hover { text-decoration: underline; }
             .form-sections { display: grid; grid-template-columns: 1fr 1fr; gap: 2rem; }
             .form-section { background: #f8f9fa; padding: 1.5rem; border-radius: 8px; }
             .form-section h3 { margin-top: 0; color: #495057; }
@@ -3028,6 +3440,7 @@ def mortgage_calculator():
             <div id="error-container" style="display: none;"></div>
         </div>
         
+        <script src="/static/calc.js"></script>
         <script>
             const form = document.getElementById('mortgage-form');
             const calculateBtn = document.getElementById('calculate-btn');
@@ -3035,180 +3448,130 @@ def mortgage_calculator():
             const downPaymentAmount = document.getElementById('down_payment_amount');
             const homePriceInput = document.getElementById('home_price');
             
-            // Sync down payment percentage and amount
-            downPaymentPercent.addEventListener('input', function() {
-                const homePrice = parseFloat(homePriceInput.value) || 0;
-                if (homePrice > 0) {
-                    const amount = (homePrice * parseFloat(this.value)) / 100;
-                    downPaymentAmount.value = Math.round(amount);
+            // Sync down payment percentage and amount from one delegated listener
+            form.addEventListener('input', function(e) {
+                const target = e.target;
+                if (target === homePriceInput) {
+                    // Update down payment amount when home price changes
+                    const percent = parseFloat(downPaymentPercent.value) || 20;
+                    downPaymentAmount.value = Math.round((parseFloat(target.value) * percent) / 100);
+                    return;
                 }
-            });
-            
-            downPaymentAmount.addEventListener('input', function() {
+                if (target !== downPaymentPercent && target !== downPaymentAmount) return;
+                
                 const homePrice = parseFloat(homePriceInput.value) || 0;
-                if (homePrice > 0) {
-                    const percent = (parseFloat(this.value) / homePrice) * 100;
-                    downPaymentPercent.value = percent.toFixed(1);
+                if (homePrice <= 0) return;
+                if (target === downPaymentPercent) {
+                    downPaymentAmount.value = Math.round((homePrice * parseFloat(target.value)) / 100);
+                } else {
+                    downPaymentPercent.value = ((parseFloat(target.value) / homePrice) * 100).toFixed(1);
                 }
             });
             
-            homePriceInput.addEventListener('input', function() {
-                // Update down payment amount when home price changes
-                const percent = parseFloat(downPaymentPercent.value) || 20;
-                const amount = (parseFloat(this.value) * percent) / 100;
-                downPaymentAmount.value = Math.round(amount);
-            });
-            
             form.addEventListener('submit', function(e) {
                 e.preventDefault();
+                const data = formValues(form);
                 
-                calculateBtn.disabled = true;
-                calculateBtn.textContent = 'Calculating...';
-                
-                const formData = new FormData(form);
-                const data = {};
-                
-                for (let [key, value] of formData.entries()) {
-                    if (value !== '') data[key] = value;
-                }
-                
-                fetch('/api/calculate/mortgage', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify(data)
-                })
-                .then(response => response.json())
-                .then(result => {
-                    const resultContainer = document.getElementById('result-container');
-                    const errorContainer = document.getElementById('error-container');
+                submitCalculation('/api/calculate/mortgage', data, calculateBtn, result => {
+                    let resultHtml = '<div class="result">';
                     
-                    if (result.error || result.errors) {
-                        const errors = result.errors || [result.error];
-                        errorContainer.innerHTML = '<div class="error">' + errors.join('<br>') + '</div>';
-                        errorContainer.style.display = 'block';
-                        resultContainer.style.display = 'none';
-                    } else {
-                        let resultHtml = '<div class="result">';
-                        
-                        // Main mortgage summary
-                        resultHtml += '<div class="mortgage-summary">';
-                        resultHtml += '<div class="summary-item">';
-                        resultHtml += '<div class="summary-value">$' + result.total_monthly_payment + '</div>';
-                        resultHtml += '<div class="summary-label">Total Monthly Payment</div>';
-                        resultHtml += '</div>';
-                        resultHtml += '<div class="summary-item">';
-                        resultHtml += '<div class="summary-value">$' + result.monthly_principal_interest + '</div>';
-                        resultHtml += '<div class="summary-label">Principal & Interest</div>';
-                        resultHtml += '</div>';
-                        resultHtml += '<div class="summary-item">';
-                        resultHtml += '<div class="summary-value">$' + result.required_annual_income + '</div>';
-                        resultHtml += '<div class="summary-label">Required Annual Income</div>';
-                        resultHtml += '</div>';
-                        resultHtml += '</div>';
-                        
-                        // Payment breakdown
-                        resultHtml += '<div class="payment-breakdown">';
-                        resultHtml += '<h4>Monthly Payment Breakdown</h4>';
-                        resultHtml += '<div class="breakdown-item"><span>Principal & Interest:</span><span>$' + result.monthly_principal_interest + '</span></div>';
-                        if (result.monthly_property_tax > 0) {
-                            resultHtml += '<div class="breakdown-item"><span>Property Tax:</span><span>$' + result.monthly_property_tax + '</span></div>';
-                        }
-                        if (result.monthly_insurance > 0) {
-                            resultHtml += '<div class="breakdown-item"><span>Home Insurance:</span><span>$' + result.monthly_insurance + '</span></div>';
-                        }
-                        if (result.pmi_monthly > 0) {
-                            resultHtml += '<div class="breakdown-item"><span>PMI:</span><span>$' + result.pmi_monthly + '</span></div>';
-                        }
-                        if (result.hoa_monthly > 0) {
-                            resultHtml += '<div class="breakdown-item"><span>HOA Fee:</span><span>$' + result.hoa_monthly + '</span></div>';
-                        }
-                        resultHtml += '<hr style="margin: 1rem 0;">';
-                        resultHtml += '<div class="breakdown-item"><strong><span>Total Monthly:</span><span>$' + result.total_monthly_payment + '</span></strong></div>';
-                        resultHtml += '</div>';
-                        
-                        // PMI warning if applicable
-                        if (result.needs_pmi) {
-                            resultHtml += '<div class="pmi-warning">';
-                            resultHtml += '<h4>⚠️ PMI Required</h4>';
-                            resultHtml += '<p>Since your down payment is less than 20%, you\'ll need Private Mortgage Insurance (PMI) of $' + result.pmi_monthly + '/month. ';
-                            resultHtml += 'PMI can typically be removed once you reach 20% equity in your home.</p>';
-                            resultHtml += '</div>';
-                        }
-                        
-                        // Affordability information
-                        resultHtml += '<div class="affordability-info">';
-                        resultHtml += '<h4>💡 Affordability Analysis</h4>';
-                        resultHtml += '<p><strong>28% Rule:</strong> Your monthly housing payment should not exceed 28% of your gross monthly income.</p>';
-                        resultHtml += '<p><strong>Required Annual Income:</strong> $' + result.required_annual_income + ' (based on 28% rule)</p>';
-                        resultHtml += '<p><strong>Down Payment:</strong> $' + result.down_payment + ' (' + result.down_payment_percent + '% of home price)</p>';
-                        resultHtml += '</div>';
-                        
-                        // Closing costs estimate
-                        if (result.closing_costs) {
-                            resultHtml += '<div class="closing-costs">';
-                            resultHtml += '<h4>📋 Estimated Closing Costs</h4>';
-                            resultHtml += '<p>Typical closing costs range from 2-5% of the home price:</p>';
-                            resultHtml += '<p><strong>Low estimate:</strong> $' + result.closing_costs.low + '</p>';
-                            resultHtml += '<p><strong>Typical:</strong> $' + result.closing_costs.typical + '</p>';
-                            resultHtml += '<p><strong>High estimate:</strong> $' + result.closing_costs.high + '</p>';
-                            resultHtml += '</div>';
-                        }
-                        
-                        // Total costs summary
-                        resultHtml += '<div style="background: #e9ecef; padding: 1rem; border-radius: 4px; margin-top: 1rem;">';
-                        resultHtml += '<h4>💰 Total Cost Summary</h4>';
-                        resultHtml += '<p><strong>Home Price:</strong> $' + result.home_price + '</p>';
-                        resultHtml += '<p><strong>Total Interest Paid:</strong> $' + result.total_interest + '</p>';
-                        resultHtml += '<p><strong>Total Cost of Home:</strong> $' + result.total_cost_of_home + '</p>';
+                    // Main mortgage summary
+                    resultHtml += '<div class="mortgage-summary">';
+                    resultHtml += '<div class="summary-item">';
+                    resultHtml += '<div class="summary-value">$' + result.total_monthly_payment + '</div>';
+                    resultHtml += '<div class="summary-label">Total Monthly Payment</div>';
+                    resultHtml += '</div>';
+                    resultHtml += '<div class="summary-item">';
+                    resultHtml += '<div class="summary-value">$' + result.monthly_principal_interest + '</div>';
+                    resultHtml += '<div class="summary-label">Principal & Interest</div>';
+                    resultHtml += '</div>';
+                    resultHtml += '<div class="summary-item">';
+                    resultHtml += '<div class="summary-value">$' + result.required_annual_income + '</div>';
+                    resultHtml += '<div class="summary-label">Required Annual Income</div>';
+                    resultHtml += '</div>';
+                    resultHtml += '</div>';
+                    
+                    // Payment breakdown
+                    resultHtml += '<div class="payment-breakdown">';
+                    resultHtml += '<h4>Monthly Payment Breakdown</h4>';
+                    resultHtml += '<div class="breakdown-item"><span>Principal & Interest:</span><span>$' + result.monthly_principal_interest + '</span></div>';
+                    if (result.monthly_property_tax > 0) {
+                        resultHtml += '<div class="breakdown-item"><span>Property Tax:</span><span>$' + result.monthly_property_tax + '</span></div>';
+                    }
+                    if (result.monthly_insurance > 0) {
+                        resultHtml += '<div class="breakdown-item"><span>Home Insurance:</span><span>$' + result.monthly_insurance + '</span></div>';
+                    }
+                    if (result.pmi_monthly > 0) {
+                        resultHtml += '<div class="breakdown-item"><span>PMI:</span><span>$' + result.pmi_monthly + '</span></div>';
+                    }
+                    if (result.hoa_monthly > 0) {
+                        resultHtml += '<div class="breakdown-item"><span>HOA Fee:</span><span>$' + result.hoa_monthly + '</span></div>';
+                    }
+                    resultHtml += '<hr style="margin: 1rem 0;">';
+                    resultHtml += '<div class="breakdown-item"><strong><span>Total Monthly:</span><span>$' + result.total_monthly_payment + '</span></strong></div>';
+                    resultHtml += '</div>';
+                    
+                    // PMI warning if applicable
+                    if (result.needs_pmi) {
+                        resultHtml += '<div class="pmi-warning">';
+                        resultHtml += '<h4>⚠️ PMI Required</h4>';
+                        resultHtml += '<p>Since your down payment is less than 20%, you\\'ll need Private Mortgage Insurance (PMI) of $' + result.pmi_monthly + '/month. ';
+                        resultHtml += 'PMI can typically be removed once you reach 20% equity in your home.</p>';
                         resultHtml += '</div>';
-                        
+                    }
+                    
+                    // Affordability information
+                    resultHtml += '<div class="affordability-info">';
+                    resultHtml += '<h4>💡 Affordability Analysis</h4>';
+                    resultHtml += '<p><strong>28% Rule:</strong> Your monthly housing payment should not exceed 28% of your gross monthly income.</p>';
+                    resultHtml += '<p><strong>Required Annual Income:</strong> $' + result.required_annual_income + ' (based on 28% rule)</p>';
+                    resultHtml += '<p><strong>Down Payment:</strong> $' + result.down_payment + ' (' + result.down_payment_percent + '% of home price)</p>';
+                    resultHtml += '</div>';
+                    
+                    // Closing costs estimate
+                    if (result.closing_costs) {
+                        resultHtml += '<div class="closing-costs">';
+                        resultHtml += '<h4>📋 Estimated Closing Costs</h4>';
+                        resultHtml += '<p>Typical closing costs range from 2-5% of the home price:</p>';
+                        resultHtml += '<p><strong>Low estimate:</strong> $' + result.closing_costs.low + '</p>';
+                        resultHtml += '<p><strong>Typical:</strong> $' + result.closing_costs.typical + '</p>';
+                        resultHtml += '<p><strong>High estimate:</strong> $' + result.closing_costs.high + '</p>';
                         resultHtml += '</div>';
-                        
-                        resultContainer.innerHTML = resultHtml;
-                        resultContainer.style.display = 'block';
-                        errorContainer.style.display = 'none';
                     }
-                })
-                .catch(error => {
-                    console.error('Error:', error);
-                    const errorContainer = document.getElementById('error-container');
-                    errorContainer.innerHTML = '<div class="error">An error occurred. Please try again.</div>';
-                    errorContainer.style.display = 'block';
-                    document.getElementById('result-container').style.display = 'none';
-                })
-                .finally(() => {
-                    calculateBtn.disabled = false;
-                    calculateBtn.textContent = 'Calculate Mortgage';
+                    
+                    // Total costs summary
+                    resultHtml += '<div style="background: #e9ecef; padding: 1rem; border-radius: 4px; margin-top: 1rem;">';
+                    resultHtml += '<h4>💰 Total Cost Summary</h4>';
+                    resultHtml += '<p><strong>Home Price:</strong> $' + result.home_price + '</p>';
+                    resultHtml += '<p><strong>Total Interest Paid:</strong> $' + result.total_interest + '</p>';
+                    resultHtml += '<p><strong>Total Cost of Home:</strong> $' + result.total_cost_of_home + '</p>';
+                    resultHtml += '</div>';
+                    
+                    resultHtml += '</div>';
+                    
+                    return resultHtml;
                 });
             });
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/calculators/loan/')
-def loan_calculator():
-    return """
+mortgage_calculator = _calculator_page('mortgage', _MORTGAGE_PAGE, [
+    'home_price', 'down_payment_percent', 'down_payment_amount', 'annual_rate', 'loan_term_years',
+    'property_tax_annual', 'home_insurance_annual', 'hoa_monthly', 'pmi_rate'
+])
+
+_LOAN_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
         <title>Loan Calculator - Calculate Monthly Payments Free</title>
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <meta name="description" content="Free loan calculator for personal loans, auto loans, student loans. Calculate monthly payments, total interest, and amortization schedules.">
+        <link rel="stylesheet" href="/static/calc.css">
         <style>
-            body { font-family: -apple-system, BlinkMacSystemFont, sans-serif; margin: 2rem; background: #f5f5f5; }
             .container { max-width: 900px; margin: 0 auto; background: white; padding: 2rem; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-            h1 { color: #007bff; text-align: center; }
-            .form-group { margin-bottom: 1rem; }
-            label { display: block; margin-bottom: 0.5rem; font-weight: 500; }
-            input, select { width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 4px; font-size: 1rem; box-sizing: border-box; }
-            button { width: 100%; background: #007bff; color: white; border: none; padding: 0.75rem; border-radius: 4px; cursor: pointer; font-size: 1rem; margin-top: 1rem; }
-            button:hover { background: #0056b3; }
-            button:disabled { background: #6c757d; cursor: not-allowed; }
-            .result { background: #e8f5e8; border: 1px solid #d4edda; padding: 1.5rem; border-radius: 4px; margin-top: 1rem; }
-            .error { background: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; padding: 1rem; border-radius: 4px; margin-top: 1rem; }
-            .back-link { display: inline-block; margin-bottom: 1rem; color: #007bff; text-decoration: none; }
-            .back-link:hover { text-decoration: underline; }
             .loan-summary { display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 1rem; margin-bottom: 1.5rem; }
             .summary-item { text-align: center; padding: 1rem; background: #f8f9fa; border-radius: 4px; border-left: 4px solid #007bff; }
             .summary-value { font-size: 1.5rem; font-weight: bold; color: #007bff; }
@@ -3267,176 +3630,120 @@ def loan_calculator():
             <div id="error-container" style="display: none;"></div>
         </div>
         
+        <script src="/static/calc.js"></script>
         <script>
             const form = document.getElementById('loan-form');
             const calculateBtn = document.getElementById('calculate-btn');
             const loanTypeSelect = document.getElementById('loan_type');
+            const loanAmountInput = document.getElementById('loan_amount');
+            const annualRateInput = document.getElementById('annual_rate');
+            const loanTermInput = document.getElementById('loan_term_years');
+            
+            // Typical values and display name for each loan type
+            const LOAN_TYPES = Object.freeze({
+                personal: { label: 'Personal', amount: 'e.g., 15000', rate: 'e.g., 12.5', term: 'e.g., 5' },
+                auto: { label: 'Auto', amount: 'e.g., 25000', rate: 'e.g., 6.5', term: 'e.g., 5' },
+                student: { label: 'Student', amount: 'e.g., 50000', rate: 'e.g., 5.5', term: 'e.g., 10' },
+                mortgage: { label: 'Mortgage', amount: 'e.g., 300000', rate: 'e.g., 4.5', term: 'e.g., 30' }
+            });
             
             // Update typical values based on loan type
             loanTypeSelect.addEventListener('change', function() {
-                const loanAmount = document.getElementById('loan_amount');
-                const annualRate = document.getElementById('annual_rate');
-                const loanTerm = document.getElementById('loan_term_years');
-                
-                switch(this.value) {
-                    case 'personal':
-                        loanAmount.placeholder = 'e.g., 15000';
-                        annualRate.placeholder = 'e.g., 12.5';
-                        loanTerm.placeholder = 'e.g., 5';
-                        break;
-                    case 'auto':
-                        loanAmount.placeholder = 'e.g., 25000';
-                        annualRate.placeholder = 'e.g., 6.5';
-                        loanTerm.placeholder = 'e.g., 5';
-                        break;
-                    case 'student':
-                        loanAmount.placeholder = 'e.g., 50000';
-                        annualRate.placeholder = 'e.g., 5.5';
-                        loanTerm.placeholder = 'e.g., 10';
-                        break;
-                    case 'mortgage':
-                        loanAmount.placeholder = 'e.g., 300000';
-                        annualRate.placeholder = 'e.g., 4.5';
-                        loanTerm.placeholder = 'e.g., 30';
-                        break;
-                }
+                const loanType = LOAN_TYPES[this.value];
+                if (!loanType) return;
+                loanAmountInput.placeholder = loanType.amount;
+                annualRateInput.placeholder = loanType.rate;
+                loanTermInput.placeholder = loanType.term;
             });
             
             // Trigger initial placeholder update
             loanTypeSelect.dispatchEvent(new Event('change'));
             
-            form.addEventListener('submit', function(e) {
-                e.preventDefault();
-                
-                calculateBtn.disabled = true;
-                calculateBtn.textContent = 'Calculating...';
-                
-                const formData = new FormData(form);
-                const data = {};
-                
-                for (let [key, value] of formData.entries()) {
-                    if (value !== '') data[key] = value;
+            // First-year payment breakdown, worked out here from the form inputs
+            function amortizationSample(loanAmount, annualRate, loanTermYears) {
+                const monthlyRate = annualRate / 100 / 12;
+                const numPayments = loanTermYears * 12;
+                const growth = Math.pow(1 + monthlyRate, numPayments);
+                const payment = monthlyRate === 0 ? loanAmount / numPayments : loanAmount * (monthlyRate * growth) / (growth - 1);
+                const schedule = [];
+                let balance = loanAmount;
+                
+                for (let month = 1; month <= 12 && balance > 0; month++) {
+                    let interest = balance * monthlyRate;
+                    let principal = payment - interest;
+                    
+                    if (principal > balance) {
+                        principal = balance;
+                        interest = payment - principal;
+                    }
+                    
+                    balance -= principal;
+                    schedule.push({
+                        month: month,
+                        payment: roundCents(payment),
+                        principal: roundCents(principal),
+                        interest: roundCents(interest),
+                        balance: roundCents(Math.max(0, balance))
+                    });
                 }
                 
-                fetch('/api/calculate/loan', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify(data)
-                })
-                .then(response => response.json())
-                .then(result => {
-                    const resultContainer = document.getElementById('result-container');
-                    const errorContainer = document.getElementById('error-container');
+                return schedule;
+            }
+            
+            form.addEventListener('submit', function(e) {
+                e.preventDefault();
+                const data = formValues(form);
+                
+                submitCalculation('/api/calculate/loan', data, calculateBtn, result => {
+                    const info = result.loan_info;
+                    const infoHtml = info ? `
+                        <div class="loan-info">
+                            <h4>${LOAN_TYPES[data.loan_type].label} Loan Information</h4>
+                            <p><strong>Description:</strong> ${info.description}</p>
+                            <p><strong>Typical Rates:</strong> ${info.typical_rates}</p>
+                            <p><strong>Typical Terms:</strong> ${info.typical_terms}</p>
+                            ${info.uses && info.uses.length > 0 ? `<p><strong>Common Uses:</strong> ${info.uses.join(', ')}</p>` : ''}
+                        </div>` : '';
                     
-                    if (result.error || result.errors) {
-                        const errors = result.errors || [result.error];
-                        errorContainer.innerHTML = '<div class="error">' + errors.join('<br>') + '</div>';
-                        errorContainer.style.display = 'block';
-                        resultContainer.style.display = 'none';
-                    } else {
-                        let resultHtml = '<div class="result">';
-                        
-                        // Loan summary
-                        resultHtml += '<div class="loan-summary">';
-                        resultHtml += '<div class="summary-item">';
-                        resultHtml += '<div class="summary-value">$' + result.monthly_payment + '</div>';
-                        resultHtml += '<div class="summary-label">Monthly Payment</div>';
-                        resultHtml += '</div>';
-                        resultHtml += '<div class="summary-item">';
-                        resultHtml += '<div class="summary-value">$' + result.total_paid + '</div>';
-                        resultHtml += '<div class="summary-label">Total Paid</div>';
-                        resultHtml += '</div>';
-                        resultHtml += '<div class="summary-item">';
-                        resultHtml += '<div class="summary-value">$' + result.total_interest + '</div>';
-                        resultHtml += '<div class="summary-label">Total Interest</div>';
-                        resultHtml += '</div>';
-                        resultHtml += '<div class="summary-item">';
-                        resultHtml += '<div class="summary-value">' + result.annual_rate + '%</div>';
-                        resultHtml += '<div class="summary-label">Interest Rate</div>';
-                        resultHtml += '</div>';
-                        resultHtml += '</div>';
-                        
-                        // Loan type information
-                        if (result.loan_info) {
-                            const info = result.loan_info;
-                            resultHtml += '<div class="loan-info">';
-                            resultHtml += '<h4>' + data.loan_type.charAt(0).toUpperCase() + data.loan_type.slice(1) + ' Loan Information</h4>';
-                            resultHtml += '<p><strong>Description:</strong> ' + info.description + '</p>';
-                            resultHtml += '<p><strong>Typical Rates:</strong> ' + info.typical_rates + '</p>';
-                            resultHtml += '<p><strong>Typical Terms:</strong> ' + info.typical_terms + '</p>';
-                            if (info.uses && info.uses.length > 0) {
-                                resultHtml += '<p><strong>Common Uses:</strong> ' + info.uses.join(', ') + '</p>';
-                            }
-                            resultHtml += '</div>';
-                        }
-                        
-                        // Amortization table (first year)
-                        if (result.amortization_sample && result.amortization_sample.length > 0) {
-                            resultHtml += '<h4>First Year Payment Breakdown</h4>';
-                            resultHtml += '<table class="amortization-table">';
-                            resultHtml += '<thead><tr><th>Month</th><th>Payment</th><th>Principal</th><th>Interest</th><th>Balance</th></tr></thead>';
-                            resultHtml += '<tbody>';
-                            
-                            result.amortization_sample.forEach(payment => {
-                                resultHtml += '<tr>';
-                                resultHtml += '<td>' + payment.month + '</td>';
-                                resultHtml += '<td>$' + payment.payment + '</td>';
-                                resultHtml += '<td>$' + payment.principal + '</td>';
-                                resultHtml += '<td>$' + payment.interest + '</td>';
-                                resultHtml += '<td>$' + payment.balance + '</td>';
-                                resultHtml += '</tr>';
-                            });
-                            
-                            resultHtml += '</tbody></table>';
-                        }
-                        
-                        resultHtml += '</div>';
-                        
-                        resultContainer.innerHTML = resultHtml;
-                        resultContainer.style.display = 'block';
-                        errorContainer.style.display = 'none';
-                    }
-                })
-                .catch(error => {
-                    console.error('Error:', error);
-                    const errorContainer = document.getElementById('error-container');
-                    errorContainer.innerHTML = '<div class="error">An error occurred. Please try again.</div>';
-                    errorContainer.style.display = 'block';
-                    document.getElementById('result-container').style.display = 'none';
-                })
-                .finally(() => {
-                    calculateBtn.disabled = false;
-                    calculateBtn.textContent = 'Calculate Loan';
+                    // Amortization table (first year)
+                    const schedule = amortizationSample(parseFloat(data.loan_amount), parseFloat(data.annual_rate), parseFloat(data.loan_term_years));
+                    const scheduleHtml = schedule.length > 0 ? `
+                        <h4>First Year Payment Breakdown</h4>
+                        <table class="amortization-table">
+                            <thead><tr><th>Month</th><th>Payment</th><th>Principal</th><th>Interest</th><th>Balance</th></tr></thead>
+                            <tbody>${schedule.map(payment => `<tr><td>${payment.month}</td><td>$${payment.payment}</td><td>$${payment.principal}</td><td>$${payment.interest}</td><td>$${payment.balance}</td></tr>`).join('')}</tbody>
+                        </table>` : '';
+                    
+                    return `
+                        <div class="result">
+                            <div class="loan-summary">
+                                ${summaryItem('$' + result.monthly_payment, 'Monthly Payment')}
+                                ${summaryItem('$' + result.total_paid, 'Total Paid')}
+                                ${summaryItem('$' + result.total_interest, 'Total Interest')}
+                                ${summaryItem(result.annual_rate + '%', 'Interest Rate')}
+                            </div>
+                            ${infoHtml}
+                            ${scheduleHtml}
+                        </div>`;
                 });
             });
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/calculators/tip/')
-def tip_calculator():
-    return """
+loan_calculator = _calculator_page('loan', _LOAN_PAGE, ['loan_type', 'loan_amount', 'annual_rate', 'loan_term_years'])
+
+_TIP_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
         <title>Tip Calculator - Calculate Tips and Split Bills Free</title>
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <meta name="description" content="Free tip calculator to calculate tips and split bills for restaurants, delivery, and more services.">
+        <link rel="stylesheet" href="/static/calc.css">
         <style>
-            body { font-family: -apple-system, BlinkMacSystemFont, sans-serif; margin: 2rem; background: #f5f5f5; }
             .container { max-width: 800px; margin: 0 auto; background: white; padding: 2rem; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-            h1 { color: #007bff; text-align: center; }
-            .form-group { margin-bottom: 1rem; }
-            label { display: block; margin-bottom: 0.5rem; font-weight: 500; }
-            input, select { width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 4px; font-size: 1rem; box-sizing: border-box; }
-            button { width: 100%; background: #007bff; color: white; border: none; padding: 0.75rem; border-radius: 4px; cursor: pointer; font-size: 1rem; margin-top: 1rem; }
-            button:hover { background: #0056b3; }
-            button:disabled { background: #6c757d; cursor: not-allowed; }
-            .result { background: #e8f5e8; border: 1px solid #d4edda; padding: 1.5rem; border-radius: 4px; margin-top: 1rem; }
-            .error { background: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; padding: 1rem; border-radius: 4px; margin-top: 1rem; }
-            .back-link { display: inline-block; margin-bottom: 1rem; color: #007bff; text-decoration: none; }
-            .back-link:hover { text-decoration: underline; }
             .quick-tips { display: flex; gap: 0.5rem; margin-top: 0.5rem; flex-wrap: wrap; }
             .quick-tip { background: #f8f9fa; border: 1px solid #dee2e6; padding: 0.25rem 0.5rem; border-radius: 4px; cursor: pointer; font-size: 0.9rem; }
             .quick-tip:hover { background: #e9ecef; }
@@ -3498,156 +3805,135 @@ def tip_calculator():
             <div id="error-container" style="display: none;"></div>
         </div>
         
+        <script src="/static/calc.js"></script>
         <script>
             const form = document.getElementById('tip-form');
             const calculateBtn = document.getElementById('calculate-btn');
             const quickTips = document.querySelectorAll('.quick-tip');
             const tipInput = document.getElementById('tip_percentage');
             
-            // Quick tip buttons
-            quickTips.forEach(tip => {
-                tip.addEventListener('click', function() {
-                    tipInput.value = this.dataset.tip;
-                    form.dispatchEvent(new Event('submit'));
-                });
-            });
+            // Tipping guidance by service type, embedded from the server's table
+            const TIP_GUIDES = """ + json.dumps(_TIP_GUIDES) + """;
             
-            // Auto-calculate on input change
-            form.addEventListener('input', function() {
-                if (form.checkValidity()) {
-                    setTimeout(() => form.dispatchEvent(new Event('submit')), 300);
-                }
-            });
-            
-            form.addEventListener('submit', function(e) {
-                e.preventDefault();
-                
-                calculateBtn.disabled = true;
-                calculateBtn.textContent = 'Calculating...';
-                
-                const formData = new FormData(form);
-                const data = {};
-                
-                for (let [key, value] of formData.entries()) {
-                    if (value !== '') data[key] = value;
-                }
-                
-                fetch('/api/calculate/tip', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify(data)
-                })
-                .then(response => response.json())
-                .then(result => {
-                    const resultContainer = document.getElementById('result-container');
-                    const errorContainer = document.getElementById('error-container');
-                    
-                    if (result.error || result.errors) {
-                        const errors = result.errors || [result.error];
-                        errorContainer.innerHTML = '<div class="error">' + errors.join('<br>') + '</div>';
-                        errorContainer.style.display = 'block';
-                        resultContainer.style.display = 'none';
-                    } else {
-                        let resultHtml = '<div class="result">';
-                        
-                        // Summary
-                        resultHtml += '<div class="calculation-summary">';
-                        resultHtml += '<div class="summary-item">';
-                        resultHtml += '<div class="summary-value">$' + result.tip_amount + '</div>';
-                        resultHtml += '<div class="summary-label">Tip Amount</div>';
-                        resultHtml += '</div>';
-                        resultHtml += '<div class="summary-item">';
-                        resultHtml += '<div class="summary-value">$' + result.total_amount + '</div>';
-                        resultHtml += '<div class="summary-label">Total Amount</div>';
-                        resultHtml += '</div>';
-                        resultHtml += '</div>';
-                        
-                        // Split details if more than 1 person
-                        if (result.num_people > 1) {
-                            resultHtml += '<div class="split-details">';
-                            resultHtml += '<h4>Split Between ' + result.num_people + ' People:</h4>';
-                            resultHtml += '<div class="calculation-summary">';
-                            resultHtml += '<div class="summary-item">';
-                            resultHtml += '<div class="summary-value">$' + result.bill_per_person + '</div>';
-                            resultHtml += '<div class="summary-label">Bill Per Person</div>';
-                            resultHtml += '</div>';
-                            resultHtml += '<div class="summary-item">';
-                            resultHtml += '<div class="summary-value">$' + result.tip_per_person + '</div>';
-                            resultHtml += '<div class="summary-label">Tip Per Person</div>';
-                            resultHtml += '</div>';
-                            resultHtml += '<div class="summary-item">';
-                            resultHtml += '<div class="summary-value">$' + result.total_per_person + '</div>';
-                            resultHtml += '<div class="summary-label">Total Per Person</div>';
-                            resultHtml += '</div>';
-                            resultHtml += '</div>';
-                            resultHtml += '</div>';
-                        }
-                        
-                        // Tip guide
-                        if (result.tip_guide) {
-                            const guide = result.tip_guide;
-                            resultHtml += '<div class="tip-guide">';
-                            resultHtml += '<h4>Tip Guide for ' + data.service_type.charAt(0).toUpperCase() + data.service_type.slice(1) + ':</h4>';
-                            
-                            Object.keys(guide).forEach(key => {
-                                if (key !== 'note') {
-                                    resultHtml += '<p><strong>' + key.replace('_', ' ').toUpperCase() + ':</strong> ' + guide[key] + '</p>';
-                                }
-                            });
-                            
-                            if (guide.note) {
-                                resultHtml += '<p><em>' + guide.note + '</em></p>';
-                            }
-                            resultHtml += '</div>';
-                        }
-                        
-                        resultHtml += '</div>';
-                        
-                        resultContainer.innerHTML = resultHtml;
-                        resultContainer.style.display = 'block';
-                        errorContainer.style.display = 'none';
-                    }
-                })
-                .catch(error => {
-                    console.error('Error:', error);
-                    const errorContainer = document.getElementById('error-container');
-                    errorContainer.innerHTML = '<div class="error">An error occurred. Please try again.</div>';
-                    errorContainer.style.display = 'block';
-                    document.getElementById('result-container').style.display = 'none';
-                })
-                .finally(() => {
-                    calculateBtn.disabled = false;
-                    calculateBtn.textContent = 'Calculate Tip';
+            // Tip math as the server does it; returns null when the inputs are outside
+            // what the server accepts, so the API can report the errors instead
+            function computeTip(data) {
+                const billAmount = Number(data.bill_amount);
+                const tipPercentage = Number(data.tip_percentage);
+                const numPeople = data.num_people === undefined ? 1 : Number(data.num_people);
+                
+                if (!(billAmount >= 0.01 && billAmount <= 100000) || !(tipPercentage >= 0 && tipPercentage <= 100) ||
+                    !Number.isInteger(numPeople) || numPeople < 1 || numPeople > 100) {
+                    return null;
+                }
+                
+                const tipAmount = billAmount * (tipPercentage / 100);
+                const totalAmount = billAmount + tipAmount;
+                return {
+                    tip_amount: roundCents(tipAmount),
+                    total_amount: roundCents(totalAmount),
+                    num_people: numPeople,
+                    bill_per_person: roundCents(billAmount / numPeople),
+                    tip_per_person: roundCents(tipAmount / numPeople),
+                    total_per_person: roundCents(totalAmount / numPeople),
+                    tip_guide: TIP_GUIDES[data.service_type] || TIP_GUIDES.restaurant
+                };
+            }
+            
+            function tipResultHtml(result, data) {
+                // Split details if more than 1 person
+                const splitHtml = result.num_people > 1 ? `
+                    <div class="split-details">
+                        <h4>Split Between ${result.num_people} People:</h4>
+                        <div class="calculation-summary">
+                            ${summaryItem('$' + result.bill_per_person, 'Bill Per Person')}
+                            ${summaryItem('$' + result.tip_per_person, 'Tip Per Person')}
+                            ${summaryItem('$' + result.total_per_person, 'Total Per Person')}
+                        </div>
+                    </div>` : '';
+                
+                const guide = result.tip_guide;
+                const guideHtml = guide ? `
+                    <div class="tip-guide">
+                        <h4>Tip Guide for ${data.service_type.charAt(0).toUpperCase() + data.service_type.slice(1)}:</h4>
+                        ${Object.keys(guide).filter(key => key !== 'note').map(key => `<p><strong>${key.replace('_', ' ').toUpperCase()}:</strong> ${guide[key]}</p>`).join('')}
+                        ${guide.note ? `<p><em>${guide.note}</em></p>` : ''}
+                    </div>` : '';
+                
+                return `
+                    <div class="result">
+                        <div class="calculation-summary">
+                            ${summaryItem('$' + result.tip_amount, 'Tip Amount')}
+                            ${summaryItem('$' + result.total_amount, 'Total Amount')}
+                        </div>
+                        ${splitHtml}
+                        ${guideHtml}
+                    </div>`;
+            }
+            
+            let debounceTimer = null;
+            let pendingRequest = null;
+            
+            function calculateTip() {
+                clearTimeout(debounceTimer);
+                
+                // A newer calculation replaces any still in flight, so stale results never land
+                if (pendingRequest) pendingRequest.abort();
+                pendingRequest = null;
+                calculateBtn.disabled = false;
+                calculateBtn.textContent = 'Calculate Tip';
+                
+                const data = formValues(form);
+                
+                // Valid inputs are worked out right here; only invalid ones need the server's error messages
+                const local = computeTip(data);
+                if (local) {
+                    showResult(tipResultHtml(local, data));
+                    return;
+                }
+                
+                pendingRequest = new AbortController();
+                submitCalculation('/api/calculate/tip', data, calculateBtn, result => tipResultHtml(result, data), pendingRequest.signal);
+            }
+            
+            // Quick tip buttons
+            quickTips.forEach(tip => {
+                tip.addEventListener('click', function() {
+                    tipInput.value = this.dataset.tip;
+                    calculateTip();
                 });
             });
+            
+            // Auto-calculate once typing pauses for 300ms; each keystroke restarts the wait,
+            // and the form is only validated when the wait runs out
+            form.addEventListener('input', function() {
+                clearTimeout(debounceTimer);
+                debounceTimer = setTimeout(() => {
+                    if (form.checkValidity()) calculateTip();
+                }, 300);
+            });
+            
+            form.addEventListener('submit', function(e) {
+                e.preventDefault();
+                calculateTip();
+            });
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/calculators/bmi/')
-def bmi_calculator():
-    return """
+tip_calculator = _calculator_page('tip', _TIP_PAGE, ['service_type', 'bill_amount', 'tip_percentage', 'num_people'])
+
+_BMI_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
         <title>BMI Calculator - Body Mass Index Calculator Free</title>
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <meta name="description" content="Free BMI calculator to check your body mass index. Calculate BMI for adults with health recommendations.">
+        <link rel="stylesheet" href="/static/calc.css">
         <style>
-            body { font-family: -apple-system, BlinkMacSystemFont, sans-serif; margin: 2rem; background: #f5f5f5; }
             .container { max-width: 800px; margin: 0 auto; background: white; padding: 2rem; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-            h1 { color: #007bff; text-align: center; }
-            .form-group { margin-bottom: 1rem; }
-            label { display: block; margin-bottom: 0.5rem; font-weight: 500; }
-            input, select { width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 4px; font-size: 1rem; box-sizing: border-box; }
-            button { width: 100%; background: #007bff; color: white; border: none; padding: 0.75rem; border-radius: 4px; cursor: pointer; font-size: 1rem; margin-top: 1rem; }
-            button:hover { background: #0056b3; }
-            button:disabled { background: #6c757d; cursor: not-allowed; }
-            .result { background: #e8f5e8; border: 1px solid #d4edda; padding: 1.5rem; border-radius: 4px; margin-top: 1rem; }
-            .error { background: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; padding: 1rem; border-radius: 4px; margin-top: 1rem; }
-            .back-link { display: inline-block; margin-bottom: 1rem; color: #007bff; text-decoration: none; }
-            .back-link:hover { text-decoration: underline; }
             .bmi-result { text-align: center; margin-bottom: 1rem; }
             .bmi-value { font-size: 2rem; font-weight: bold; margin: 0.5rem 0; }
             .bmi-category { font-size: 1.2rem; margin: 0.5rem 0; padding: 0.5rem; border-radius: 4px; }
@@ -3695,6 +3981,7 @@ def bmi_calculator():
             <div id="error-container" style="display: none;"></div>
         </div>
         
+        <script src="/static/calc.js"></script>
         <script>
             const form = document.getElementById('bmi-form');
             const calculateBtn = document.getElementById('calculate-btn');
@@ -3721,83 +4008,36 @@ def bmi_calculator():
             
             form.addEventListener('submit', function(e) {
                 e.preventDefault();
-                
-                calculateBtn.disabled = true;
-                calculateBtn.textContent = 'Calculating...';
-                
-                const formData = new FormData(form);
-                const data = {};
-                
-                for (let [key, value] of formData.entries()) {
-                    if (value !== '') data[key] = value;
-                }
-                
-                fetch('/api/calculate/bmi', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify(data)
-                })
-                .then(response => response.json())
-                .then(result => {
-                    const resultContainer = document.getElementById('result-container');
-                    const errorContainer = document.getElementById('error-container');
+                const data = formValues(form);
+                
+                submitCalculation('/api/calculate/bmi', data, calculateBtn, result => {
+                    const recommendations = result.recommendations || [];
+                    const recommendationsHtml = recommendations.length > 0 ? `
+                        <div class="recommendations">
+                            <h4>Health Recommendations:</h4>
+                            <ul>${recommendations.map(rec => `<li>${rec}</li>`).join('')}</ul>
+                        </div>` : '';
                     
-                    if (result.error || result.errors) {
-                        const errors = result.errors || [result.error];
-                        errorContainer.innerHTML = '<div class="error">' + errors.join('<br>') + '</div>';
-                        errorContainer.style.display = 'block';
-                        resultContainer.style.display = 'none';
-                    } else {
-                        let resultHtml = '<div class="result">';
-                        resultHtml += '<div class="bmi-result">';
-                        resultHtml += '<div class="bmi-value" style="color: ' + result.color + '">BMI: ' + result.bmi + '</div>';
-                        resultHtml += '<div class="bmi-category" style="background-color: ' + result.color + '20; color: ' + result.color + '">';
-                        resultHtml += result.category + '</div>';
-                        resultHtml += '<p><strong>' + result.description + '</strong></p>';
-                        resultHtml += '</div>';
-                        
-                        resultHtml += '<div class="ideal-weight">';
-                        resultHtml += '<strong>Ideal Weight Range:</strong> ' + result.ideal_weight_range;
-                        resultHtml += '</div>';
-                        
-                        if (result.recommendations && result.recommendations.length > 0) {
-                            resultHtml += '<div class="recommendations">';
-                            resultHtml += '<h4>Health Recommendations:</h4>';
-                            resultHtml += '<ul>';
-                            result.recommendations.forEach(rec => {
-                                resultHtml += '<li>' + rec + '</li>';
-                            });
-                            resultHtml += '</ul>';
-                            resultHtml += '</div>';
-                        }
-                        
-                        resultHtml += '</div>';
-                        
-                        resultContainer.innerHTML = resultHtml;
-                        resultContainer.style.display = 'block';
-                        errorContainer.style.display = 'none';
-                    }
-                })
-                .catch(error => {
-                    console.error('Error:', error);
-                    const errorContainer = document.getElementById('error-container');
-                    errorContainer.innerHTML = '<div class="error">An error occurred. Please try again.</div>';
-                    errorContainer.style.display = 'block';
-                    document.getElementById('result-container').style.display = 'none';
-                })
-                .finally(() => {
-                    calculateBtn.disabled = false;
-                    calculateBtn.textContent = 'Calculate BMI';
+                    return `
+                        <div class="result">
+                            <div class="bmi-result">
+                                <div class="bmi-value" style="color: ${result.color}">BMI: ${result.bmi}</div>
+                                <div class="bmi-category" style="background-color: ${result.color}20; color: ${result.color}">${result.category}</div>
+                                <p><strong>${result.description}</strong></p>
+                            </div>
+                            <div class="ideal-weight"><strong>Ideal Weight Range:</strong> ${result.ideal_weight_range}</div>
+                            ${recommendationsHtml}
+                        </div>`;
                 });
             });
         </script>
     </body>
     </html>
-    """
+    """)
+
+bmi_calculator = _calculator_page('bmi', _BMI_PAGE, ['unit_system', 'weight', 'height'])
 
-@app.route('/calculators/percentage/')
-def percentage_calculator():
-    return """
+_PERCENTAGE_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -3997,187 +4237,20 @@ def percentage_calculator():
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/api/calculate/mortgage', methods=['POST'])
-def calculate_mortgage():
-    try:
-        print("API called - calculating mortgage")
-        
-        data = request.get_json()
-        print(f"Received data: {data}")
-        
-        if not data:
-            return jsonify({'error': 'No data received'}), 400
-        
-        calc = MortgageCalculator()
-        
-        if not calc.validate_inputs(data):
-            print(f"Validation errors: {calc.errors}")
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        print(f"Mortgage calculation result: {result}")
-        
-        calculation_logs.append({
-            'calculator': 'mortgage',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        print(f"Error in Mortgage API: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/calculate/loan', methods=['POST'])
-def calculate_loan():
-    try:
-        print("API called - calculating loan")
-        
-        data = request.get_json()
-        print(f"Received data: {data}")
-        
-        if not data:
-            return jsonify({'error': 'No data received'}), 400
-        
-        calc = LoanCalculator()
-        
-        if not calc.validate_inputs(data):
-            print(f"Validation errors: {calc.errors}")
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        print(f"Loan calculation result: {result}")
-        
-        calculation_logs.append({
-            'calculator': 'loan',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        print(f"Error in Loan API: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/calculate/tip', methods=['POST'])
-def calculate_tip():
-    try:
-        print("API called - calculating tip")
-        
-        data = request.get_json()
-        print(f"Received data: {data}")
-        
-        if not data:
-            return jsonify({'error': 'No data received'}), 400
-        
-        calc = TipCalculator()
-        
-        if not calc.validate_inputs(data):
-            print(f"Validation errors: {calc.errors}")
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        print(f"Tip calculation result: {result}")
-        
-        calculation_logs.append({
-            'calculator': 'tip',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        print(f"Error in Tip API: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/calculate/bmi', methods=['POST'])
-def calculate_bmi():
-    try:
-        print("API called - calculating BMI")
-        
-        data = request.get_json()
-        print(f"Received data: {data}")
-        
-        if not data:
-            return jsonify({'error': 'No data received'}), 400
-        
-        calc = BMICalculator()
-        
-        if not calc.validate_inputs(data):
-            print(f"Validation errors: {calc.errors}")
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        print(f"BMI calculation result: {result}")
-        
-        calculation_logs.append({
-            'calculator': 'bmi',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        print(f"Error in BMI API: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/calculate/percentage', methods=['POST'])
-def calculate_percentage():
-    try:
-        print("API called - calculating percentage")
-        
-        # Get the request data
-        data = request.get_json()
-        print(f"Received data: {data}")
-        
-        if not data:
-            return jsonify({'error': 'No data received'}), 400
-        
-        # Create calculator instance
-        calc = PercentageCalculator()
-        
-        # Validate inputs
-        if not calc.validate_inputs(data):
-            print(f"Validation errors: {calc.errors}")
-            return jsonify({'errors': calc.errors}), 400
-        
-        # Perform calculation
-        result = calc.calculate(data)
-        print(f"Calculation result: {result}")
-        
-        # Log calculation (in-memory for demo)
-        calculation_logs.append({
-            'calculator': 'percentage',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        print(f"Error in API: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        return jsonify({'error': str(e)}), 500
+percentage_calculator = _calculator_page('percentage', _PERCENTAGE_PAGE, [
+    'operation', 'x', 'y', 'percent', 'total', 'original', 'new_value'
+])
+
+calculate_mortgage = _calculation_api('mortgage', MortgageCalculator)
+calculate_loan = _calculation_api('loan', LoanCalculator)
+calculate_tip = _calculation_api('tip', TipCalculator)
+calculate_bmi = _calculation_api('bmi', BMICalculator)
+calculate_percentage = _calculation_api('percentage', PercentageCalculator)
 
 # SEO Routes
-@app.route('/calculators/income-tax/')
-def income_tax_calculator():
-    return """
+_INCOME_TAX_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -4370,45 +4443,15 @@ def income_tax_calculator():
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/api/calculate/income-tax', methods=['POST'])
-def calculate_income_tax():
-    try:
-        print("API called - calculating income tax")
-        
-        data = request.get_json()
-        print(f"Received data: {data}")
-        
-        if not data:
-            return jsonify({'error': 'No data received'}), 400
-        
-        calc = IncomeTaxCalculator()
-        
-        if not calc.validate_inputs(data):
-            print(f"Validation errors: {calc.errors}")
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        print(f"Income tax calculation result: {result}")
-        
-        calculation_logs.append({
-            'calculator': 'income_tax',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        print(f"Error in Income Tax API: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/calculators/sales-tax/')
-def sales_tax_calculator():
-    return """
+income_tax_calculator = _calculator_page('income-tax', _INCOME_TAX_PAGE, [
+    'annual_income', 'filing_status', 'state', 'tax_year'
+])
+
+calculate_income_tax = _calculation_api('income-tax', IncomeTaxCalculator)
+
+_SALES_TAX_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -4627,45 +4670,13 @@ def sales_tax_calculator():
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/api/calculate/sales-tax', methods=['POST'])
-def calculate_sales_tax():
-    try:
-        print("API called - calculating sales tax")
-        
-        data = request.get_json()
-        print(f"Received data: {data}")
-        
-        if not data:
-            return jsonify({'error': 'No data received'}), 400
-        
-        calc = SalesTaxCalculator()
-        
-        if not calc.validate_inputs(data):
-            print(f"Validation errors: {calc.errors}")
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        print(f"Sales tax calculation result: {result}")
-        
-        calculation_logs.append({
-            'calculator': 'sales_tax',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        print(f"Error in Sales Tax API: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/calculators/property-tax/')
-def property_tax_calculator():
-    return """
+sales_tax_calculator = _calculator_page('sales-tax', _SALES_TAX_PAGE, ['purchase_amount', 'location', 'tax_rate'])
+
+calculate_sales_tax = _calculation_api('sales-tax', SalesTaxCalculator)
+
+_PROPERTY_TAX_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -4939,45 +4950,16 @@ def property_tax_calculator():
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/api/calculate/property-tax', methods=['POST'])
-def calculate_property_tax():
-    try:
-        print("API called - calculating property tax")
-        
-        data = request.get_json()
-        print(f"Received data: {data}")
-        
-        if not data:
-            return jsonify({'error': 'No data received'}), 400
-        
-        calc = PropertyTaxCalculator()
-        
-        if not calc.validate_inputs(data):
-            print(f"Validation errors: {calc.errors}")
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        print(f"Property tax calculation result: {result}")
-        
-        calculation_logs.append({
-            'calculator': 'property_tax',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        print(f"Error in Property Tax API: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/calculators/tax-refund/')
-def tax_refund_calculator():
-    return """
+property_tax_calculator = _calculator_page('property-tax', _PROPERTY_TAX_PAGE, [
+    'home_value', 'location', 'tax_rate', 'homestead_exemption', 'senior_exemption', 'veteran_exemption',
+    'other_exemptions'
+])
+
+calculate_property_tax = _calculation_api('property-tax', PropertyTaxCalculator)
+
+_TAX_REFUND_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -5187,45 +5169,15 @@ def tax_refund_calculator():
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/api/calculate/tax-refund', methods=['POST'])
-def calculate_tax_refund():
-    try:
-        print("API called - calculating tax refund")
-        
-        data = request.get_json()
-        print(f"Received data: {data}")
-        
-        if not data:
-            return jsonify({'error': 'No data received'}), 400
-        
-        calc = TaxRefundCalculator()
-        
-        if not calc.validate_inputs(data):
-            print(f"Validation errors: {calc.errors}")
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        print(f"Tax refund calculation result: {result}")
-        
-        calculation_logs.append({
-            'calculator': 'tax_refund',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        print(f"Error in Tax Refund API: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/calculators/gross-to-net/')
-def gross_to_net_calculator():
-    return """
+tax_refund_calculator = _calculator_page('tax-refund', _TAX_REFUND_PAGE, [
+    'annual_income', 'filing_status', 'dependents', 'federal_withholding', 'state_withholding', 'state'
+])
+
+calculate_tax_refund = _calculation_api('tax-refund', TaxRefundCalculator)
+
+_GROSS_TO_NET_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -5468,45 +5420,16 @@ def gross_to_net_calculator():
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/api/calculate/gross-to-net', methods=['POST'])
-def calculate_gross_to_net():
-    try:
-        print("API called - calculating gross to net")
-        
-        data = request.get_json()
-        print(f"Received data: {data}")
-        
-        if not data:
-            return jsonify({'error': 'No data received'}), 400
-        
-        calc = GrossToNetCalculator()
-        
-        if not calc.validate_inputs(data):
-            print(f"Validation errors: {calc.errors}")
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        print(f"Gross to net calculation result: {result}")
-        
-        calculation_logs.append({
-            'calculator': 'gross_to_net',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        print(f"Error in Gross to Net API: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/calculators/hourly-to-salary/')
-def hourly_to_salary_calculator():
-    return """
+gross_to_net_calculator = _calculator_page('gross-to-net', _GROSS_TO_NET_PAGE, [
+    'gross_salary', 'pay_frequency', 'filing_status', 'state', 'retirement_401k', 'health_insurance',
+    'dental_vision', 'fsa_hsa'
+])
+
+calculate_gross_to_net = _calculation_api('gross-to-net', GrossToNetCalculator)
+
+_HOURLY_TO_SALARY_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -5640,32 +5563,15 @@ def hourly_to_salary_calculator():
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/api/calculate/hourly-to-salary', methods=['POST'])
-def calculate_hourly_to_salary():
-    try:
-        calc = HourlyToSalaryCalculator()
-        data = request.get_json()
-        
-        if not calc.validate_inputs(data):
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        calculation_logs.append({
-            'calculator': 'hourly_to_salary',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+hourly_to_salary_calculator = _calculator_page('hourly-to-salary', _HOURLY_TO_SALARY_PAGE, [
+    'calculation_type', 'hourly_rate', 'annual_salary', 'hours_per_week', 'weeks_per_year'
+])
 
-@app.route('/calculators/salary-raise/')
-def salary_raise_calculator():
-    return """
+calculate_hourly_to_salary = _calculation_api('hourly-to-salary', HourlyToSalaryCalculator)
+
+_SALARY_RAISE_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -5854,32 +5760,15 @@ def salary_raise_calculator():
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/api/calculate/salary-raise', methods=['POST'])
-def calculate_salary_raise():
-    try:
-        calc = SalaryRaiseCalculator()
-        data = request.get_json()
-        
-        if not calc.validate_inputs(data):
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        calculation_logs.append({
-            'calculator': 'salary_raise',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+salary_raise_calculator = _calculator_page('salary-raise', _SALARY_RAISE_PAGE, [
+    'calculation_type', 'current_salary', 'raise_amount', 'raise_percentage', 'target_salary'
+])
 
-@app.route('/calculators/cost-of-living/')
-def cost_of_living_calculator():
-    return """
+calculate_salary_raise = _calculation_api('salary-raise', SalaryRaiseCalculator)
+
+_COST_OF_LIVING_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -6092,32 +5981,15 @@ def cost_of_living_calculator():
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/api/calculate/cost-of-living', methods=['POST'])
-def calculate_cost_of_living():
-    try:
-        calc = CostOfLivingCalculator()
-        data = request.get_json()
-        
-        if not calc.validate_inputs(data):
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        calculation_logs.append({
-            'calculator': 'cost_of_living',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+cost_of_living_calculator = _calculator_page('cost-of-living', _COST_OF_LIVING_PAGE, [
+    'current_salary', 'current_city_key', 'current_city', 'target_city_key', 'target_city'
+])
 
-@app.route('/calculators/compound-interest/')
-def compound_interest_calculator():
-    return """
+calculate_cost_of_living = _calculation_api('cost-of-living', CostOfLivingCalculator)
+
+_COMPOUND_INTEREST_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -6299,32 +6171,15 @@ def compound_interest_calculator():
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/api/calculate/compound-interest', methods=['POST'])
-def calculate_compound_interest():
-    try:
-        calc = CompoundInterestCalculator()
-        data = request.get_json()
-        
-        if not calc.validate_inputs(data):
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        calculation_logs.append({
-            'calculator': 'compound_interest',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+compound_interest_calculator = _calculator_page('compound-interest', _COMPOUND_INTEREST_PAGE, [
+    'principal', 'annual_rate', 'years', 'compound_frequency', 'monthly_contribution'
+])
 
-@app.route('/calculators/retirement/')
-def retirement_calculator():
-    return """
+calculate_compound_interest = _calculation_api('compound-interest', CompoundInterestCalculator)
+
+_RETIREMENT_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -6541,32 +6396,16 @@ def retirement_calculator():
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/api/calculate/retirement', methods=['POST'])
-def calculate_retirement():
-    try:
-        calc = RetirementCalculator()
-        data = request.get_json()
-        
-        if not calc.validate_inputs(data):
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        calculation_logs.append({
-            'calculator': 'retirement',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+retirement_calculator = _calculator_page('retirement', _RETIREMENT_PAGE, [
+    'current_age', 'retirement_age', 'annual_return', 'current_savings', 'monthly_contribution',
+    'retirement_income_goal', 'years_in_retirement'
+])
 
-@app.route('/calculators/investment-return/')
-def investment_return_calculator():
-    return """
+calculate_retirement = _calculation_api('retirement', RetirementCalculator)
+
+_INVESTMENT_RETURN_PAGE = _build_page("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -6989,28 +6828,66 @@ def investment_return_calculator():
         </script>
     </body>
     </html>
-    """
+    """)
 
-@app.route('/api/calculate/investment-return', methods=['POST'])
-def calculate_investment_return():
-    try:
-        calc = InvestmentReturnCalculator()
-        data = request.get_json()
-        
-        if not calc.validate_inputs(data):
-            return jsonify({'errors': calc.errors}), 400
-        
-        result = calc.calculate(data)
-        calculation_logs.append({
-            'calculator': 'investment_return',
-            'inputs': data,
-            'result': result,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+investment_return_calculator = _calculator_page('investment-return', _INVESTMENT_RETURN_PAGE, [
+    'calculation_type', 'initial_investment', 'annual_return', 'years', 'contribution_frequency',
+    'additional_contributions', 'target_value', 'investment_1_name', 'investment_1_initial',
+    'investment_1_current', 'investment_2_name', 'investment_2_initial', 'investment_2_current',
+    'investment_3_name', 'investment_3_initial', 'investment_3_current'
+])
+
+calculate_investment_return = _calculation_api('investment-return', InvestmentReturnCalculator)
+
+# Most calculations accepted in one batch request
+_MAX_BATCH_SIZE = 50
+
+@app.route('/api/calculate/batch', methods=['POST'])
+def calculate_batch():
+    """Run several calculations in one request.
+
+    Takes a JSON list of {"calculator": <slug>, "inputs": {...}} items, where the
+    slug is one from /api/calculate/<slug> such as 'mortgage' or 'income-tax', and
+    returns a list in the same order holding each result, {'errors': [...]}
+    for invalid inputs, or {'error': message} for a failed item.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, list) or not data:
+        return jsonify({'error': 'Expected a non-empty list of calculations'}), 400
+    if len(data) > _MAX_BATCH_SIZE:
+        return jsonify({'error': f'At most {_MAX_BATCH_SIZE} calculations per batch'}), 400
+    
+    results = []
+    for item in data:
+        try:
+            slug = item.get('calculator') if isinstance(item, dict) else None
+            calc_class = api_calculators.get(slug)
+            if calc_class is None:
+                results.append({'error': f"Unknown calculator: {slug}"})
+                continue
+            inputs = item.get('inputs')
+            if not isinstance(inputs, dict) or not inputs:
+                results.append({'error': 'No data received'})
+                continue
+            
+            calc = calc_class()
+            if not calc.validate_inputs(inputs):
+                results.append({'errors': calc.errors})
+                continue
+            
+            result = calc.calculate(inputs)
+            calculation_logs.append({
+                'calculator': slug.replace('-', '_'),
+                'inputs': inputs,
+                'result': result,
+                'timestamp': datetime.now().isoformat()
+            })
+            results.append(result)
+        except Exception as e:
+            log.exception("Error in batch %s calculation: %s", slug, e)
+            results.append({'error': str(e)})
+    
+    return jsonify(results)
 
 # Sitemap route moved to later in file with enhanced SEO content
 
@@ -7689,7 +7566,7 @@ def sitemap():
 def debug_logs():
     return jsonify({
         'calculation_count': len(calculation_logs),
-        'recent_calculations': calculation_logs[-10:] if calculation_logs else []
+        'recent_calculations': list(islice(reversed(calculation_logs), 10))[::-1]
     })
 
 if __name__ == '__main__':
@@ -7719,4 +7596,6 @@ if __name__ == '__main__':
     print("  🤖 Robots: http://localhost:5000/robots.txt")
     print("  🔧 Debug: http://localhost:5000/debug/logs")
     print("")
+    # Show the API handlers' request/result debug lines when running locally
+    logging.basicConfig(level=logging.DEBUG)
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
@@ -0,0 +1,91 @@
+/* Request helpers shared by the calculator pages */
+
+// Successful results keyed on endpoint and form data, so re-submitting the
+// same inputs renders instantly instead of making another round trip
+const calculationCache = new Map();
+const CALCULATION_CACHE_SIZE = 64;
+
+async function calculate(endpoint, data, signal) {
+    const key = endpoint + ' ' + JSON.stringify(data);
+    if (calculationCache.has(key)) {
+        const cached = calculationCache.get(key);
+        // Re-insert so the entry counts as most recently used
+        calculationCache.delete(key);
+        calculationCache.set(key, cached);
+        return cached;
+    }
+
+    const response = await fetch(endpoint, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(data),
+        signal: signal
+    });
+    const result = await response.json();
+    if (!result.error && !result.errors) {
+        calculationCache.set(key, result);
+        if (calculationCache.size > CALCULATION_CACHE_SIZE) {
+            calculationCache.delete(calculationCache.keys().next().value);
+        }
+    }
+    return result;
+}
+
+// A form's non-empty fields as a plain object, ready to post
+function formValues(form) {
+    const data = {};
+    for (let [key, value] of new FormData(form).entries()) {
+        if (value !== '') data[key] = value;
+    }
+    return data;
+}
+
+function showResult(html) {
+    const resultContainer = document.getElementById('result-container');
+    resultContainer.innerHTML = html;
+    resultContainer.style.display = 'block';
+    document.getElementById('error-container').style.display = 'none';
+}
+
+function showErrors(errors) {
+    const errorContainer = document.getElementById('error-container');
+    errorContainer.innerHTML = '<div class="error">' + errors.join('<br>') + '</div>';
+    errorContainer.style.display = 'block';
+    document.getElementById('result-container').style.display = 'none';
+}
+
+// Post one calculation and show the outcome. The button reads 'Calculating...'
+// while the request is out; render(result) returns the markup for a success.
+async function submitCalculation(endpoint, data, button, render, signal) {
+    const label = button.textContent;
+    button.disabled = true;
+    button.textContent = 'Calculating...';
+    try {
+        const result = await calculate(endpoint, data, signal);
+        if (result.error || result.errors) {
+            showErrors(result.errors || [result.error]);
+        } else {
+            showResult(render(result));
+        }
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        console.error('Error:', error);
+        showErrors(['An error occurred. Please try again.']);
+    } finally {
+        // An aborted request leaves the button to the one that replaced it
+        if (!(signal && signal.aborted)) {
+            button.disabled = false;
+            button.textContent = label;
+        }
+    }
+}
+
+// One figure in a results summary grid
+function summaryItem(value, label) {
+    return `<div class="summary-item"><div class="summary-value">${value}</div><div class="summary-label">${label}</div></div>`;
+}
+
+// Round to cents like the server: exact half cents (odd eighths) go to the even cent
+function roundCents(value) {
+    return Number.isInteger(value * 8) && !Number.isInteger(value * 4) ? Math.round(value * 50) / 50 : Number(value.toFixed(2));
+}
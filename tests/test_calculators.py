@@ -8,6 +8,7 @@ import sys
 import os
 import pytest
 import json
+import gzip
 from unittest.mock import patch, MagicMock
 
 # Add the parent directory to sys.path to import the app
@@ -45,6 +46,13 @@ class TestBaseCalculatorFunctionality:
         
         result = calc.calculate(inputs)
         assert result['result'] == 110.0
+
+    def test_percentage_explanation_uses_selected_operation(self):
+        calc = PercentageCalculator()
+        inputs = {'operation': 'basic', 'x': '1', 'y': '3'}
+
+        result = calc.calculate(inputs)
+        assert result['explanation'].startswith('1 is 33.33% of 3.')
     
     def test_percentage_calculator_validation_errors(self):
         calc = PercentageCalculator()
@@ -185,6 +193,16 @@ class TestTipCalculator:
         assert result['tax_amount'] == 8.5
         assert result['total_amount'] == 128.5  # 100 + 20 + 8.5
 
+    def test_repeat_inputs_return_independent_results(self):
+        inputs = {'bill_amount': '64.00', 'tip_percentage': '15', 'num_people': '2'}
+        first = TipCalculator().calculate(inputs)
+        first['tip_amount'] = 0
+
+        repeat_inputs = dict(inputs)
+        second = TipCalculator().calculate(repeat_inputs)
+        assert second['tip_amount'] == 9.6
+        assert second['inputs'] is repeat_inputs
+
 
 class TestMortgageCalculator:
     """Test mortgage calculator functionality"""
@@ -286,6 +304,20 @@ class TestTaxCalculators:
         assert 'federal_refund' in result
         assert 'state_refund' in result
         assert 'child_tax_credit' in result
+    
+    def test_tax_refund_parts_add_up_to_total(self):
+        calc = TaxRefundCalculator()
+        for income in ('48213.37', '60000', '87654.21', '123456.78', '250001.99'):
+            inputs = {
+                'annual_income': income,
+                'federal_withholding': '9000',
+                'state_withholding': '2500',
+                'filing_status': 'single',
+                'state': 'california'
+            }
+            
+            result = calc.calculate(inputs)
+            assert round(result['federal_refund'] + result['state_refund'], 2) == result['total_refund']
 
 
 class TestSalaryCalculators:
@@ -309,6 +341,20 @@ class TestSalaryCalculators:
         assert result['fica_total'] > 0
         assert result['monthly_net'] > 0
     
+    def test_gross_to_net_parts_add_up_to_total(self):
+        calc = GrossToNetCalculator()
+        for salary in ('48213.37', '80000', '87654.21', '123456.78', '250001.99'):
+            inputs = {
+                'gross_salary': salary,
+                'pay_frequency': 'annual',
+                'filing_status': 'single',
+                'state': 'california'
+            }
+            
+            result = calc.calculate(inputs)
+            parts = result['federal_tax'] + result['state_tax'] + result['social_security'] + result['medicare']
+            assert round(parts, 2) == result['total_taxes']
+    
     def test_hourly_to_salary_calculator(self):
         calc = HourlyToSalaryCalculator()
         inputs = {
@@ -355,6 +401,21 @@ class TestSalaryCalculators:
         assert 'breakdown' in result
         assert 'recommendation' in result
 
+    def test_salary_result_serializes_like_dict(self):
+        calc = SalaryRaiseCalculator()
+        inputs = {
+            'calculation_type': 'raise_amount',
+            'current_salary': '50000',
+            'raise_amount': '2500'
+        }
+
+        result = calc.calculate(inputs)
+        assert result.raise_percentage == result['raise_percentage'] == 5.0
+
+        payload = app.json.loads(app.json.dumps(result))
+        assert payload == result.to_dict()
+        assert payload['performance_context']['category'] == 'Good Performance'
+
 
 class TestInvestmentCalculators:
     """Test investment and retirement calculators"""
@@ -537,7 +598,32 @@ class TestAppIntegration:
         response = client.get('/')
         assert response.status_code == 200
         assert b'Calculator Suite' in response.data
-    
+
+    def test_homepage_conditional_get(self, client):
+        response = client.get('/')
+        etag = response.headers['ETag']
+
+        cached = client.get('/', headers={'If-None-Match': etag})
+        assert cached.status_code == 304
+        assert cached.data == b''
+
+    def test_homepage_gzip(self, client):
+        plain = client.get('/')
+        response = client.get('/', headers={'Accept-Encoding': 'gzip, deflate'})
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['ETag'] != plain.headers['ETag']
+        assert gzip.decompress(response.data) == plain.data
+
+    def test_calculator_page_json(self, client):
+        response = client.get('/calculators/loan/', headers={'Accept': 'application/json'})
+        assert response.is_json
+        assert response.get_json()['endpoint'] == '/api/calculate/loan'
+        assert 'loan_amount' in response.get_json()['fields']
+        assert 'Accept' in response.headers['Vary']
+
+        browser = client.get('/calculators/loan/', headers={'Accept': 'text/html,application/xhtml+xml,*/*;q=0.8'})
+        assert browser.mimetype == 'text/html'
+
     def test_calculator_pages_load(self, client):
         calculator_paths = [
             '/calculators/percentage/',
@@ -554,6 +640,29 @@ class TestAppIntegration:
             response = client.get(path)
             assert response.status_code == 200
     
+    def test_calculator_pages_share_stylesheet(self, client):
+        for path in ['/calculators/loan/', '/calculators/tip/', '/calculators/bmi/', '/calculators/mortgage/']:
+            assert b'href="/static/calc.css"' in client.get(path).data
+
+        response = client.get('/static/calc.css')
+        assert response.status_code == 200
+        assert b'.back-link' in response.data
+        response.close()
+    
+    def test_calculator_pages_share_request_helper(self, client):
+        for path in ['/calculators/loan/', '/calculators/tip/', '/calculators/bmi/', '/calculators/mortgage/']:
+            assert b'src="/static/calc.js"' in client.get(path).data
+
+        response = client.get('/static/calc.js')
+        assert response.status_code == 200
+        assert b'async function submitCalculation(' in response.data
+        response.close()
+    
+    def test_tip_page_embeds_tip_guides(self, client):
+        data = client.get('/calculators/tip/').data
+        assert b'const TIP_GUIDES = {"restaurant": ' in data
+        assert b'Round up to nearest dollar' in data
+    
     def test_api_endpoint_percentage(self, client):
         response = client.post('/api/calculate/percentage',
                              json={'operation': 'basic', 'x': '25', 'y': '100'},
@@ -571,6 +680,29 @@ class TestAppIntegration:
         data = json.loads(response.data)
         assert 'errors' in data
     
+    def test_api_endpoint_empty_body(self, client):
+        for path in ['/api/calculate/percentage', '/api/calculate/hourly-to-salary', '/api/calculate/retirement']:
+            response = client.post(path, json={})
+            assert response.status_code == 400
+            assert json.loads(response.data) == {'error': 'No data received'}
+    
+    def test_api_batch_endpoint(self, client):
+        response = client.post('/api/calculate/batch', json=[
+            {'calculator': 'percentage', 'inputs': {'operation': 'basic', 'x': '25', 'y': '100'}},
+            {'calculator': 'percentage', 'inputs': {'operation': 'basic', 'x': '25'}},
+            {'calculator': 'nope', 'inputs': {'x': '1'}},
+            {'calculator': 'income-tax', 'inputs': {'annual_income': '75000', 'filing_status': 'single'}}
+        ])
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data[0]['result'] == 25.0
+        assert 'errors' in data[1]
+        assert 'error' in data[2]
+        assert data[3]['federal_tax'] > 0
+        assert [entry['calculator'] for entry in calculation_logs] == ['percentage', 'income_tax']
+        
+        assert client.post('/api/calculate/batch', json={'x': '1'}).status_code == 400
+    
     def test_sitemap_generation(self, client):
         response = client.get('/sitemap.xml')
         assert response.status_code == 200
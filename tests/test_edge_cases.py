@@ -14,7 +14,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app_simple_fixed import (
     PercentageCalculator, LoanCalculator, BMICalculator, MortgageCalculator,
     IncomeTaxCalculator, RetirementCalculator, CompoundInterestCalculator,
-    InvestmentReturnCalculator, SalaryRaiseCalculator
+    InvestmentReturnCalculator, SalaryRaiseCalculator, _round_cents
 )
 
 
@@ -475,6 +475,14 @@ class TestValidationBoundaries:
         assert isinstance(result['result'], float)
         assert result['result'] != float('inf')
         assert result['result'] != float('-inf')
+    
+    def test_round_cents_matches_round(self):
+        # Half-cent ties, negative zero, ints and values outside the fast path
+        values = [0.125, 2.675, 1.005, -0.125, -0.004, 0.004, -1e-13, 21600,
+                  12345.678, -98765.4321, 7.2e21, float('inf')]
+        for value in values:
+            expected = round(value, 2)
+            assert repr(_round_cents(value)) == repr(expected)
 
 
 if __name__ == '__main__':
@@ -340,6 +340,18 @@ class TestCalculationLogsPerformance:
         
         # Clean up
         calculation_logs.clear()
+    
+    def test_log_storage_is_bounded(self):
+        """Test that old calculations are dropped once the log is full"""
+        calculation_logs.clear()
+        for i in range(calculation_logs.maxlen + 5):
+            calculation_logs.append({'calculator': 'test', 'inputs': {'x': i}})
+        
+        assert len(calculation_logs) == calculation_logs.maxlen
+        assert calculation_logs[0]['inputs']['x'] == 5
+        
+        # Clean up
+        calculation_logs.clear()
 
 
 class TestEdgeCasePerformance: